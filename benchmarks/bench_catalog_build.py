@@ -0,0 +1,64 @@
+"""Measure the build, deepcopy and pickling of a catalog with many ``MlflowArtifactDataset``.
+
+Usage:
+    python benchmarks/bench_catalog_build.py --entries 500
+"""
+
+import argparse
+import copy
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from kedro.io import DataCatalog
+
+
+def _timeit(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main(entries: int, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = {
+            f"artifact_{i}": {
+                "type": "kedro_mlflow.io.artifacts.MlflowArtifactDataset",
+                "dataset": {
+                    "type": "pandas.CSVDataset" if i % 2 else "pickle.PickleDataset",
+                    "filepath": Path(tmp_dir, f"artifact_{i}").as_posix(),
+                },
+            }
+            for i in range(entries)
+        }
+
+        def build():
+            catalog = DataCatalog.from_config(config)
+            # the datasets are lazily instantiated
+            for name in config:
+                catalog[name]
+            return catalog
+
+        catalog = build()
+        datasets = [catalog[name] for name in config]
+        build_duration = _timeit(build, repeat)
+        deepcopy_duration = _timeit(lambda: copy.deepcopy(datasets), repeat)
+        pickle_duration = _timeit(lambda: pickle.loads(pickle.dumps(datasets)), repeat)
+
+    print(f"{entries} MlflowArtifactDataset entries (best of {repeat}):")
+    print(f"  generated classes : {len({type(dataset) for dataset in datasets})}")
+    print(f"  catalog build     : {build_duration:.3f}s")
+    print(f"  deepcopy          : {deepcopy_duration:.3f}s")
+    print(f"  pickle round trip : {pickle_duration:.3f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(entries=args.entries, repeat=args.repeat)
@@ -0,0 +1,71 @@
+"""Compare the file store fast path with ``MlflowClient.get_metric_history``.
+
+Usage:
+    python benchmarks/bench_metric_file_store.py --points 100000 --metrics 5
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import mlflow
+from mlflow.entities import Metric
+from mlflow.tracking import MlflowClient
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+from kedro_mlflow.io.metrics.utils import load_metric_histories
+
+
+def _timeit(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main(points: int, metrics: int, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mlflow.set_tracking_uri(Path(tmp_dir, "mlruns").as_uri())
+        client = MlflowClient()
+        keys = [f"metric_{i}" for i in range(metrics)]
+
+        with mlflow.start_run() as run:
+            run_id = run.info.run_id
+            for key in keys:
+                batch = [
+                    Metric(key=key, value=step / points, timestamp=step, step=step)
+                    for step in range(points)
+                ]
+                for start in range(0, points, MAX_METRICS_PER_BATCH):
+                    client.log_batch(
+                        run_id, metrics=batch[start : start + MAX_METRICS_PER_BATCH]
+                    )
+
+        def with_client():
+            for key in keys:
+                [metric.value for metric in client.get_metric_history(run_id, key)]
+
+        def with_fast_path():
+            load_metric_histories(run_id, keys=keys, file_store_fast_path=True)
+
+        client_duration = _timeit(with_client, repeat)
+        fast_path_duration = _timeit(with_fast_path, repeat)
+
+    print(f"{metrics} metrics x {points} points (best of {repeat}):")
+    print(f"  MlflowClient.get_metric_history : {client_duration:.3f}s")
+    print(f"  file store fast path            : {fast_path_duration:.3f}s")
+    print(
+        f"  speedup                         : x{client_duration / fast_path_duration:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--metrics", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(points=args.points, metrics=args.metrics, repeat=args.repeat)
@@ -0,0 +1,79 @@
+"""Measure the latency of ``KedroPipelineModel.predict`` with artifacts of increasing size.
+
+Usage:
+    python benchmarks/bench_pipeline_model_predict.py --sizes 1 100 1000
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, node
+from kedro_datasets.pickle import PickleDataset
+from mlflow.pyfunc import PythonModelContext
+
+from kedro_mlflow.mlflow import KedroPipelineModel
+
+
+def _preprocess(data):
+    return data + 1
+
+
+def _predict(model, data):
+    return data * model[0]
+
+
+def _timeit(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return np.percentile(durations, 50)
+
+
+def main(sizes: list[int], repeat: int):
+    pipeline = Pipeline(
+        [
+            node(_preprocess, inputs="raw_data", outputs="data"),
+            node(_predict, inputs=["model", "data"], outputs="predictions"),
+        ]
+    )
+    # the runner logs each node, and the artifacts are file uris instead of local paths
+    logging.disable(logging.WARNING)
+    print(f"KedroPipelineModel.predict (median of {repeat}):")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            catalog = DataCatalog(
+                {
+                    "raw_data": MemoryDataset(),
+                    "model": PickleDataset(
+                        filepath=Path(tmp_dir, "model.pkl").as_posix()
+                    ),
+                }
+            )
+            # a float64 array of 'size' MiB
+            catalog.save("model", np.ones(size * 2**17))
+            kedro_pipeline_model = KedroPipelineModel(
+                pipeline=pipeline, catalog=catalog, input_name="raw_data"
+            )
+            artifacts = kedro_pipeline_model.extract_pipeline_artifacts(Path(tmp_dir))
+            kedro_pipeline_model.load_context(
+                PythonModelContext(artifacts=artifacts, model_config={})
+            )
+            duration = _timeit(
+                lambda: kedro_pipeline_model.predict(None, np.ones(10)), repeat
+            )
+        print(f"  {size:>6} MiB artifact : {duration * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(sizes=args.sizes, repeat=args.repeat)
@@ -1,5 +1,7 @@
 import subprocess
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
 from platform import python_version
@@ -17,6 +19,15 @@ from mlflow.models import infer_signature
 from packaging import version
 
 from kedro_mlflow.framework.cli.cli_utils import write_jinja_template
+from kedro_mlflow.io.models import (
+    MlflowModelRegistryDataset,
+    MlflowModelTrackingDataset,
+)
+from kedro_mlflow.io.models.model_cache import (
+    fetch_resolved_model,
+    get_model_cache,
+    resolve_model_uri,
+)
 from kedro_mlflow.mlflow import KedroPipelineModel
 
 LOGGER = getLogger(__name__)
@@ -32,6 +43,7 @@ class KedroClickGroup(click.Group):
             self.add_command(init)
             self.add_command(ui)
             self.add_command(modelify)
+            self.add_command(models)
             # self.add_command(run) # TODO : IMPLEMENT THIS FUNCTION
         # else:
         #     self.add_command(new) # TODO : IMPLEMENT THIS FUNCTION
@@ -356,6 +368,136 @@ def modelify(
             )
 
 
+@click.group()
+def models():
+    """Manage the models referenced in the catalog."""
+    pass  # pragma: no cover
+
+
+@models.command()
+@click.option(
+    "--env",
+    "-e",
+    required=False,
+    default="local",
+    help="The environment within conf folder we want to retrieve.",
+)
+@click.option(
+    "--dataset",
+    "-d",
+    "dataset_names",
+    multiple=True,
+    help="The name of a model dataset of the catalog to pull. Can be repeated. Default to all the MlflowModelRegistryDataset and the MlflowModelTrackingDataset with a 'model_uri'.",
+)
+@click.option(
+    "--model-uri",
+    "-m",
+    "model_uris",
+    multiple=True,
+    help="A model uri to pull in addition to the datasets, e.g. 'models:/my_model@champion'. Can be repeated.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=4,
+    help="The number of models downloaded at the same time.",
+)
+def pull(env: str, dataset_names: tuple[str], model_uris: tuple[str], workers: int):
+    """Download the models of the catalog in their local cache, so that the
+    pipelines which load them do not download them again.
+    """
+
+    project_path = find_kedro_project(Path.cwd()) or Path.cwd()
+    bootstrap_project(project_path)
+    with KedroSession.create(project_path=project_path, env=env) as session:
+        # sets the tracking and registry uris with the after_context_created hook
+        catalog = session.load_context().catalog
+
+        if not dataset_names and not model_uris:
+            dataset_names = [
+                name
+                for name in catalog.keys()
+                if (catalog.get_type(name) or "").rsplit(".", 1)[-1]
+                in {"MlflowModelRegistryDataset", "MlflowModelTrackingDataset"}
+            ]
+
+        # (name, model uri, cache) of each model to pull
+        targets = []
+        for name in dataset_names:
+            dataset = catalog.get(name) if name in catalog else None
+            if isinstance(dataset, MlflowModelRegistryDataset):
+                model_uri = dataset.model_uri
+            elif isinstance(dataset, MlflowModelTrackingDataset):
+                model_uri = dataset._user_defined_model_uri
+                if model_uri is None:
+                    # the model will be logged by the pipeline
+                    continue
+            else:
+                raise KedroMlflowCliError(
+                    f"'{name}' is not a MlflowModelRegistryDataset or a MlflowModelTrackingDataset of the catalog."
+                )
+            if dataset._model_cache is None:
+                # the dataset would download the model again when it is loaded
+                click.secho(
+                    click.style(
+                        f"Skipped '{name}': it has no 'download_cache' to pull its model in.",
+                        fg="yellow",
+                    )
+                )
+                continue
+            targets.append((name, model_uri, dataset._model_cache))
+        for model_uri in model_uris:
+            targets.append((model_uri, model_uri, get_model_cache(True)))
+
+        if not targets:
+            click.secho(click.style("No model to pull.", fg="yellow"))
+            return
+
+        def _pull(model_uri, model_cache):
+            start = time.perf_counter()
+            resolved_model_uri = resolve_model_uri(model_uri)
+            model_path = Path(fetch_resolved_model(resolved_model_uri, model_cache))
+            size = sum(
+                file.stat().st_size for file in model_path.rglob("*") if file.is_file()
+            )
+            return resolved_model_uri, size, time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                name: executor.submit(_pull, model_uri, model_cache)
+                for name, model_uri, model_cache in targets
+            }
+
+        failures = {}
+        total_size = 0
+        for name, future in futures.items():
+            if future.exception() is not None:
+                failures[name] = future.exception()
+                click.secho(
+                    click.style(
+                        f"Failed to pull '{name}': {future.exception()}", fg="red"
+                    )
+                )
+                continue
+            resolved_model_uri, size, duration = future.result()
+            total_size += size
+            click.secho(
+                f"Pulled '{name}' ({resolved_model_uri}): {size / 1024**2:.1f} MiB in {duration:.2f}s"
+            )
+        click.secho(
+            click.style(
+                f"Pulled {len(futures) - len(failures)}/{len(futures)} models ({total_size / 1024**2:.1f} MiB) in {time.perf_counter() - start:.2f}s",
+                fg="red" if failures else "green",
+            )
+        )
+        if failures:
+            raise KedroMlflowCliError(
+                f"Failed to pull the models {list(failures)}. See the errors above."
+            )
+
+
 class KedroMlflowCliError(Exception):
     """kedro-mlflow cli specific error"""
 
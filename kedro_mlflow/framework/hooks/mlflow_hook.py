@@ -1,5 +1,6 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger, getLogger
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -27,15 +28,29 @@ from kedro_mlflow.framework.hooks.utils import (
     _flatten_dict,
     _generate_kedro_command,
 )
+from kedro_mlflow.io.artifacts.artifact_uploader import wait_for_artifact_uploads
+from kedro_mlflow.io.catalog.prefetch_catalog_datasets import (
+    prefetch_catalog_datasets,
+)
 from kedro_mlflow.io.catalog.switch_catalog_logging import switch_catalog_logging
 from kedro_mlflow.io.metrics import (
     MlflowMetricDataset,
     MlflowMetricHistoryDataset,
+    MlflowMetricSeriesDataset,
     MlflowMetricsHistoryDataset,
 )
+from kedro_mlflow.io.metrics.mlflow_metric_logger import (
+    _start_dataset_metric_buffering,
+    _stop_dataset_metric_buffering,
+    _flush_metric_loggers,
+    get_metric_logger,
+)
 from kedro_mlflow.mlflow import KedroPipelineModel
 from kedro_mlflow.pipeline.pipeline_ml import PipelineML
 
+# the number of datasets downloaded at the same time before the pipeline runs
+PREFETCH_WORKERS = 4
+
 
 class MlflowHook:
     def __init__(self):
@@ -44,6 +59,8 @@ class MlflowHook:
         self.recursive = True
         self.sep = "."
         self.long_parameters_strategy = "fail"
+        self._unsaved_outputs = {}  # node name -> outputs not saved yet
+        self._prefetch_executor = None
         self.run_id = None  # we store the run_id because the hook is stateful and we need to keep track of the active run between the different threads
 
     @property
@@ -195,6 +212,14 @@ class MlflowHook:
                         save_args=dataset._save_args,
                     )
 
+            if isinstance(dataset, MlflowMetricSeriesDataset) and dataset.key is None:
+                catalog[name] = MlflowMetricSeriesDataset(
+                    run_id=dataset._run_id,
+                    key=name,
+                    load_args=dataset._load_args,
+                    save_args=dataset._save_args,
+                )
+
     @hook_impl
     def before_pipeline_run(
         self, run_params: dict[str, Any], pipeline: Pipeline, catalog: DataCatalog
@@ -221,6 +246,13 @@ class MlflowHook:
             pipeline: The ``Pipeline`` that will be run.
             catalog: The ``DataCatalog`` to be used during the run.
         """
+        # the inputs pinned to a mlflow run or model are downloaded in the
+        # background while the first nodes run
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=PREFETCH_WORKERS, thread_name_prefix="kedro_mlflow_prefetch"
+        )
+        prefetch_catalog_datasets(catalog, pipeline.inputs(), self._prefetch_executor)
+
         # Handle backward compatibility: pipeline_name (str) or pipeline_names (list[str])
 
         pipeline_names = (
@@ -283,12 +315,15 @@ class MlflowHook:
                     pipeline_names=pipeline_names,
                 ),
             )
+            # the metric datasets saved by a node in this run are sent in a single batch
+            _start_dataset_metric_buffering(self.run_id)
 
         else:
             self._logger.info(
                 "kedro-mlflow logging is deactivated for this pipeline in the configuration. This includes DataSets and parameters."
             )
             switch_catalog_logging(catalog, False)
+            get_metric_logger()._logging_activated = False
 
     @hook_impl
     def before_node_run(
@@ -352,6 +387,51 @@ class MlflowHook:
             for k, v in params_inputs.items():
                 self._log_param(k, v)
 
+    @hook_impl
+    def after_node_run(
+        self,
+        node: Node,
+        catalog: DataCatalog,
+        inputs: dict[str, Any],
+        outputs: dict[str, Any],
+        is_async: bool,
+    ) -> None:
+        """Hook to be invoked after a node runs.
+        This hook flushes the metrics buffered by the ``MlflowMetricLogger``
+        during the node execution.
+        Args:
+            node: The ``Node`` that ran.
+            catalog: A ``DataCatalog`` containing the node's inputs and outputs.
+            inputs: The dictionary of inputs dataset.
+            outputs: The dictionary of outputs dataset.
+            is_async: Whether the node was run in ``async`` mode.
+        """
+        if self._is_mlflow_enabled:
+            _flush_metric_loggers()
+            # the outputs are saved after this hook: the metric datasets
+            # are flushed once they are all saved, see ``after_dataset_saved``
+            if node.outputs:
+                self._unsaved_outputs[node.name] = set(node.outputs)
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name: str, data: Any, node: Node) -> None:
+        """Hook to be invoked after a dataset is saved in the catalog.
+        This hook flushes the metrics datasets buffered during the node execution
+        once all its outputs are saved, to log them with a single ``log_batch``.
+        Args:
+            dataset_name: name of the dataset that was saved to the catalog.
+            data: the actual data that was saved to the catalog.
+            node: The ``Node`` that ran.
+        """
+        if self._is_mlflow_enabled:
+            unsaved_outputs = self._unsaved_outputs.get(node.name)
+            if unsaved_outputs is None:
+                return
+            unsaved_outputs.discard(dataset_name)
+            if not unsaved_outputs:
+                del self._unsaved_outputs[node.name]
+                _flush_metric_loggers()
+
     def _log_param(self, name: str, value: Union[dict, int, bool, str]) -> None:
         str_value = str(value)
         str_value_length = len(str_value)
@@ -404,6 +484,7 @@ class MlflowHook:
             pipeline: The ``Pipeline`` that was run.
             catalog: The ``DataCatalog`` used during the run.
         """
+        self._stop_prefetch()
         if self._is_mlflow_enabled:
             if isinstance(pipeline, PipelineML):
                 # Materialize dataset factories
@@ -447,16 +528,25 @@ class MlflowHook:
                         signature=model_signature,
                         **log_model_kwargs,
                     )
+            # ensure no buffered metric is lost when the run is closed
+            _flush_metric_loggers()
+            _stop_dataset_metric_buffering(self.run_id)
+            self._unsaved_outputs = {}
+            failed_uploads = self._wait_for_artifact_uploads()
             # Close the mlflow active run at the end of the pipeline to avoid interactions with further runs
             if self._already_active_mlflow:
                 self._logger.warning(
                     f"The run '{mlflow.active_run().info.run_id}' was already opened before launching 'kedro run' so it is not closed. You should close it manually."
                 )
+            elif failed_uploads:
+                # the run is incomplete, it must not look successful
+                mlflow.end_run(RunStatus.to_string(RunStatus.FAILED))
             else:
                 mlflow.end_run()
 
         else:
             switch_catalog_logging(catalog, True)
+            get_metric_logger()._logging_activated = True
 
     @hook_impl
     def on_pipeline_error(
@@ -491,7 +581,21 @@ class MlflowHook:
             pipeline: (Not used) The ``Pipeline`` that will was run.
             catalog: (Not used) The ``DataCatalog`` used during the run.
         """
+        self._stop_prefetch()
         if self._is_mlflow_enabled:
+            # log the metrics buffered before the failure: they are often
+            # the most useful ones to understand what went wrong
+            try:
+                _flush_metric_loggers()
+            except Exception as err:  # pragma: no cover
+                self._logger.warning(
+                    f"The buffered metrics could not be logged because of an error: {err}"
+                )
+            finally:
+                _stop_dataset_metric_buffering(self.run_id)
+                self._unsaved_outputs = {}
+            self._wait_for_artifact_uploads()
+
             if self._already_active_mlflow:
                 self._logger.warning(
                     f"The run '{mlflow.active_run().info.run_id}' was already opened before launching 'kedro run' so it is not closed. You should close it manually."
@@ -519,6 +623,21 @@ class MlflowHook:
             # the catalog is supposed to be reloaded each time with _get_catalog,
             # hence it should not be modified. this is only a safeguard
             switch_catalog_logging(catalog, True)
+            get_metric_logger()._logging_activated = True
+
+    def _stop_prefetch(self) -> None:
+        # the remaining downloads are not needed anymore
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
+    def _wait_for_artifact_uploads(self) -> list:
+        failed_uploads = wait_for_artifact_uploads()
+        for upload, error in failed_uploads:
+            self._logger.error(
+                f"The background upload of '{upload.local_path}' in the run '{upload.run_id}' failed: {error}"
+            )
+        return failed_uploads
 
     def sanitize_param_name(self, name: str) -> str:
         # regex taken from MLFlow codebase: https://github.com/mlflow/mlflow/blob/e40e782b6fcab473159e6d4fee85bc0fc10f78fd/mlflow/utils/validation.py#L140C1-L148C44
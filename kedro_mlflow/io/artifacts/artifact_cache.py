@@ -0,0 +1,227 @@
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from tempfile import TemporaryDirectory, mkstemp
+from typing import Callable, Iterable, Optional, Union
+
+# 10 GiB
+DEFAULT_CACHE_MAX_SIZE = 10 * 1024**3
+
+
+def get_cache_dir() -> Path:
+    """Get the folder where kedro-mlflow stores its local caches.
+
+    It can be set with the ``KEDRO_MLFLOW_CACHE_DIR`` environment variable
+    and defaults to ``~/.cache/kedro_mlflow``.
+
+    Returns:
+        Path: The cache folder.
+    """
+    return Path(
+        os.environ.get(
+            "KEDRO_MLFLOW_CACHE_DIR", Path.home() / ".cache" / "kedro_mlflow"
+        )
+    )
+
+
+class _FileLock:
+    """A lock shared by all the processes of the machine, based on a lock file."""
+
+    def __init__(self, path: Path, shared: bool = False):
+        self.path = path
+        self.shared = shared
+        self._file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a+")
+        if os.name == "nt":  # pragma: no cover
+            import msvcrt
+
+            # windows has no shared locks
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            import fcntl
+
+            fcntl.flock(
+                self._file.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if os.name == "nt":  # pragma: no cover
+            import msvcrt
+
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+
+
+def link_or_copy(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Hardlink a file or all the files of a folder, or copy them if linking fails.
+
+    Args:
+        src (Union[str, Path]): The file or folder to link.
+        dst (Union[str, Path]): The destination. An existing file is replaced.
+    """
+    src, dst = Path(src), Path(dst)
+
+    def _link_or_copy_file(src_file, dst_file):
+        if os.path.lexists(dst_file):
+            os.unlink(dst_file)
+        try:
+            os.link(src_file, dst_file)
+        except OSError:
+            # e.g. another device or a filesystem without hardlinks
+            shutil.copy2(src_file, dst_file)
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if src.is_dir():
+        shutil.copytree(src, dst, copy_function=_link_or_copy_file, dirs_exist_ok=True)
+    else:
+        _link_or_copy_file(src, dst)
+
+
+def break_hardlinks(paths: Iterable[Union[str, Path]]) -> None:
+    """Replace the local files which have other hardlinks by a private copy.
+
+    This must be called before writing to a file which may be linked to the cache
+    or to a local artifact store, so that the new content does not modify the
+    linked file. The copy replaces the file in a single rename, so the file is
+    never missing and the other links keep their content.
+
+    Args:
+        paths (Iterable[Union[str, Path]]): The files which are about to be written.
+    """
+    for path in paths:
+        path = Path(path)
+        if not path.is_file() or path.stat().st_nlink < 2:  # noqa: PLR2004
+            continue
+        fd, tmp_path = mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        os.close(fd)
+        try:
+            shutil.copy2(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+class ArtifactCache:
+    """A local cache of the artifacts downloaded from mlflow runs.
+
+    The artifacts are keyed by ``(tracking_uri, run_id, artifact_path)``.
+    The least recently used ones are evicted when the cache exceeds ``max_size``
+    bytes. The cache can be shared by several processes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size: Optional[int] = DEFAULT_CACHE_MAX_SIZE,
+    ):
+        """Initialise ArtifactCache.
+
+        Args:
+            cache_dir (Union[str, Path], optional): The folder of the cache.
+                Default to the ``artifacts`` folder of ``get_cache_dir()``.
+            max_size (int, optional): The maximum size of the cache in bytes.
+                If None, nothing is ever evicted. Default to 10 GiB.
+        """
+        self.cache_dir = Path(cache_dir or get_cache_dir() / "artifacts")
+        self.max_size = max_size
+
+    @property
+    def _lock(self) -> Path:
+        return self.cache_dir / ".lock"
+
+    def _entry_dir(self, tracking_uri: str, run_id: str, artifact_path: str) -> Path:
+        key = hashlib.sha256(
+            "\n".join([tracking_uri, run_id, artifact_path]).encode()
+        ).hexdigest()
+        return self.cache_dir / key
+
+    def get(
+        self,
+        tracking_uri: str,
+        run_id: str,
+        artifact_path: str,
+        download: Callable[[str], str],
+    ) -> Path:
+        """Get the local path of an artifact, and download it if it is not cached yet.
+
+        Args:
+            tracking_uri (str): The tracking uri of the run.
+            run_id (str): The ID of the run.
+            artifact_path (str): The path of the artifact in the run.
+            download (Callable[[str], str]): A function which downloads the artifact
+                in the given folder and returns its local path.
+
+        Returns:
+            Path: The path of the artifact in the cache. It must not be modified.
+        """
+        entry_dir = self._entry_dir(tracking_uri, run_id, artifact_path)
+        # the entry cannot be evicted while it is read
+        with _FileLock(self._lock, shared=True):
+            with _FileLock(entry_dir.with_suffix(".lock")):
+                if not entry_dir.is_dir():
+                    with TemporaryDirectory(dir=self.cache_dir) as tmp_dir:
+                        downloaded_path = Path(download(tmp_dir))
+                        staging_dir = Path(tmp_dir) / "entry"
+                        staging_dir.mkdir()
+                        downloaded_path.rename(staging_dir / downloaded_path.name)
+                        # the entry only appears once it is complete
+                        staging_dir.rename(entry_dir)
+                # the modification time of the entry tracks its last use
+                os.utime(entry_dir)
+                cached_path = next(entry_dir.iterdir())
+
+        if self.max_size is not None:
+            self.evict(keep=entry_dir)
+        return cached_path
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Remove the least recently used artifacts until the cache fits in ``max_size``.
+
+        Args:
+            keep (Path, optional): An entry which must not be removed.
+        """
+        with _FileLock(self._lock):
+            entries = [
+                (entry_dir.stat().st_mtime, _get_size(entry_dir), entry_dir)
+                for entry_dir in self.cache_dir.iterdir()
+                if entry_dir.is_dir() and not entry_dir.name.startswith("tmp")
+            ]
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, entry_dir in sorted(entries, key=lambda entry: entry[0]):
+                if total_size <= self.max_size:
+                    break
+                if entry_dir == keep:
+                    continue
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                entry_dir.with_suffix(".lock").unlink(missing_ok=True)
+                total_size -= size
+
+    def clear(self) -> None:
+        """Remove all the artifacts of the cache."""
+        with _FileLock(self._lock):
+            for path in self.cache_dir.iterdir():
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                elif path != self._lock:
+                    path.unlink(missing_ok=True)
+
+
+def _get_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
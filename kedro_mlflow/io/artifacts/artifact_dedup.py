@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Optional, Union
+
+import mlflow
+from mlflow.tracking import MlflowClient
+
+from kedro_mlflow.io.artifacts.artifact_cache import get_cache_dir
+
+# the tags of a run are prefixed by these keys and suffixed by the artifact path
+ARTIFACT_SHA256_TAG = "kedro_mlflow.artifact_sha256"
+ARTIFACT_REFERENCE_TAG = "kedro_mlflow.artifact_reference"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def compute_sha256(local_path: Union[str, Path]) -> str:
+    """Compute the sha256 of a file, or of all the files of a folder, by chunks.
+
+    Args:
+        local_path (Union[str, Path]): The path to the file or folder.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    local_path = Path(local_path)
+    sha256 = hashlib.sha256()
+    if local_path.is_dir():
+        files = sorted(path for path in local_path.rglob("*") if path.is_file())
+    else:
+        files = [local_path]
+
+    for file in files:
+        if local_path.is_dir():
+            # the layout of the folder is part of its content
+            sha256.update(file.relative_to(local_path).as_posix().encode())
+            sha256.update(b"\0")
+        with open(file, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class ArtifactHashIndex:
+    """A local {sha256: artifact} index of the artifacts logged in an experiment."""
+
+    def __init__(
+        self,
+        experiment_id: str,
+        index_dir: Optional[Path] = None,
+        tracking_uri: Optional[str] = None,
+    ):
+        """Initialise ArtifactHashIndex.
+
+        Args:
+            experiment_id (str): The ID of the mlflow experiment.
+            index_dir (Path, optional): The folder of the index files.
+                Default to the ``artifact_index`` folder of ``get_cache_dir()``.
+            tracking_uri (str, optional): The tracking uri of the experiment.
+                Default to the current tracking uri.
+        """
+        self.experiment_id = experiment_id
+        self.index_dir = Path(index_dir or get_cache_dir() / "artifact_index")
+        self.tracking_uri = tracking_uri or mlflow.get_tracking_uri()
+
+    @property
+    def _index_filepath(self) -> Path:
+        # the experiments of different tracking servers may have the same ID
+        tracking_uri_hash = hashlib.sha256(self.tracking_uri.encode()).hexdigest()
+        return self.index_dir / f"{tracking_uri_hash[:16]}_{self.experiment_id}.json"
+
+    def _read(self) -> dict[str, dict[str, str]]:
+        try:
+            return json.loads(self._index_filepath.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, index: dict[str, dict[str, str]]) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        # the file is replaced atomically so that concurrent sessions never read a partial index
+        with NamedTemporaryFile(
+            "w", dir=self.index_dir, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(index, f)
+        os.replace(f.name, self._index_filepath)
+
+    def get(self, sha256: str) -> Optional[tuple[str, str]]:
+        """Get the artifact with the given sha256.
+
+        Args:
+            sha256 (str): The hexadecimal digest of the artifact.
+
+        Returns:
+            Optional[tuple[str, str]]: The (run_id, artifact_path) of the artifact
+                if it is in the index, else None.
+        """
+        entry = self._read().get(sha256)
+        return (entry["run_id"], entry["artifact_path"]) if entry else None
+
+    def add(self, sha256: str, run_id: str, artifact_path: str) -> None:
+        """Add an artifact to the index.
+
+        Args:
+            sha256 (str): The hexadecimal digest of the artifact.
+            run_id (str): The ID of the run where the artifact is logged.
+            artifact_path (str): The path of the artifact in the run.
+        """
+        index = self._read()
+        index[sha256] = {"run_id": run_id, "artifact_path": artifact_path}
+        self._write(index)
+
+    def remove(self, sha256: str) -> None:
+        """Remove an artifact from the index.
+
+        Args:
+            sha256 (str): The hexadecimal digest of the artifact.
+        """
+        index = self._read()
+        if index.pop(sha256, None) is not None:
+            self._write(index)
+
+
+def artifact_exists(run_id: str, artifact_path: str) -> bool:
+    """Check if an artifact exists in a run.
+
+    Args:
+        run_id (str): The ID of the mlflow run.
+        artifact_path (str): The path of the artifact in the run.
+
+    Returns:
+        bool: Does the artifact exist?
+    """
+    parent_path = Path(artifact_path).parent.as_posix()
+    try:
+        artifacts = MlflowClient().list_artifacts(
+            run_id, None if parent_path == "." else parent_path
+        )
+    except Exception:
+        # the run may have been deleted since it was indexed
+        return False
+    return any(artifact.path == artifact_path for artifact in artifacts)
@@ -0,0 +1,98 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+from mlflow.tracking import MlflowClient
+from mlflow.utils.file_utils import local_file_uri_to_path
+
+from kedro_mlflow.io.artifacts.artifact_cache import link_or_copy
+
+LINK_STRATEGIES = {"hardlink", "reflink", "move"}
+
+# ioctl request to share the blocks of a file on copy-on-write filesystems (btrfs, xfs...)
+# see linux/fs.h
+_FICLONE = 0x40049409
+
+
+def get_local_artifact_dir(run_id: str) -> Optional[Path]:
+    """Get the local folder of the artifacts of a run.
+
+    Args:
+        run_id (str): The ID of the mlflow run.
+
+    Returns:
+        Optional[Path]: The folder if the artifact store of the run
+            is on a local filesystem (e.g. "mlruns" or a NFS mount), else None.
+    """
+    artifact_uri = MlflowClient().get_run(run_id).info.artifact_uri
+    scheme = urlparse(artifact_uri).scheme
+    # a single letter scheme is a windows drive, which is a valid local path
+    if scheme not in ("", "file") and not (len(scheme) == 1 and scheme.isalpha()):
+        return None
+    return Path(local_file_uri_to_path(artifact_uri))
+
+
+def _reflink_or_copy(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        import fcntl
+
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        shutil.copystat(src, dst)
+    except (ImportError, OSError):
+        # windows, another device or a filesystem without copy-on-write
+        shutil.copy2(src, dst)
+
+
+def link_artifact(
+    local_path: Union[str, Path], destination: Union[str, Path], strategy: str
+) -> None:
+    """Put a file or folder in a local artifact store without copying its content.
+
+    Args:
+        local_path (Union[str, Path]): The file or folder to log.
+        destination (Union[str, Path]): Its path in the artifact store.
+        strategy (str): One of:
+            - "hardlink": the artifact is a hardlink to the local file.
+            - "reflink": the artifact is a copy-on-write clone of the local file.
+            - "move": the local file is moved to the artifact store.
+            The file is copied if the strategy is not supported,
+            e.g. if the artifact store is on another device.
+    """
+    if strategy not in LINK_STRATEGIES:
+        raise ValueError(
+            f"link_strategy must be one of {LINK_STRATEGIES}, got '{strategy}' instead."
+        )
+
+    local_path, destination = Path(local_path), Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if strategy == "hardlink":
+        link_or_copy(local_path, destination)
+    elif strategy == "reflink":
+        if local_path.is_dir():
+            shutil.copytree(
+                local_path,
+                destination,
+                copy_function=_reflink_or_copy,
+                dirs_exist_ok=True,
+            )
+        else:
+            _reflink_or_copy(local_path, destination)
+    elif strategy == "move":
+        if local_path.is_dir():
+            # the files are added to the ones already logged in the folder,
+            # like an upload does
+            shutil.copytree(
+                local_path,
+                destination,
+                copy_function=shutil.move,
+                dirs_exist_ok=True,
+            )
+            shutil.rmtree(local_path)
+        else:
+            # a rename on the same device, a copy and a deletion otherwise
+            shutil.move(local_path, destination)
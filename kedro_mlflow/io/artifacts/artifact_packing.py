@@ -0,0 +1,81 @@
+import shutil
+import tarfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
+# the extension of the archive for each supported format
+PACK_FORMATS = {"tar": ".tar", "zstd": ".tar.zst"}
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as err:
+        raise ImportError(
+            "The 'zstd' pack format requires the 'zstandard' package. Install it with 'pip install zstandard' or use the 'tar' pack format."
+        ) from err
+    return zstandard
+
+
+@contextmanager
+def _open_stream(archive_path: Path, pack: str, mode: str) -> Iterator[BinaryIO]:
+    with open(archive_path, mode) as f:
+        if pack == "zstd":
+            zstandard = _import_zstandard()
+            if mode == "wb":
+                with zstandard.ZstdCompressor().stream_writer(f) as stream:
+                    yield stream
+            else:
+                with zstandard.ZstdDecompressor().stream_reader(f) as stream:
+                    yield stream
+        else:
+            yield f
+
+
+def pack_directory(
+    local_dir: Union[str, Path], archive_path: Union[str, Path], pack: str
+) -> None:
+    """Stream all the files of a folder in a single archive.
+
+    Args:
+        local_dir (Union[str, Path]): The folder to pack.
+        archive_path (Union[str, Path]): The path of the archive to create.
+        pack (str): The format of the archive, "tar" or "zstd" (a zstandard compressed tar).
+    """
+    local_dir = Path(local_dir)
+    with _open_stream(Path(archive_path), pack, "wb") as stream:
+        # "w|" writes the archive as a stream, without seeking back in the file
+        with tarfile.open(fileobj=stream, mode="w|") as archive:
+            for path in sorted(local_dir.rglob("*")):
+                archive.add(
+                    path,
+                    arcname=path.relative_to(local_dir).as_posix(),
+                    recursive=False,
+                )
+
+
+def unpack_archive(
+    archive_path: Union[str, Path], local_dir: Union[str, Path], pack: str
+) -> None:
+    """Extract an archive created by ``pack_directory`` in a folder.
+
+    The previous content of the folder is removed, so that it is identical
+    to the packed folder.
+
+    Args:
+        archive_path (Union[str, Path]): The path of the archive.
+        local_dir (Union[str, Path]): The folder where the archive is extracted.
+        pack (str): The format of the archive, "tar" or "zstd".
+    """
+    local_dir = Path(local_dir)
+    if local_dir.is_dir():
+        shutil.rmtree(local_dir)
+    local_dir.mkdir(parents=True)
+    with _open_stream(Path(archive_path), pack, "rb") as stream:
+        with tarfile.open(fileobj=stream, mode="r|") as archive:
+            if hasattr(tarfile, "data_filter"):
+                # refuse absolute paths, links outside the folder...
+                archive.extractall(local_dir, filter="data")
+            else:  # pragma: no cover
+                archive.extractall(local_dir)
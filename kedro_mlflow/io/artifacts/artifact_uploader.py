@@ -0,0 +1,194 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+from kedro.io import DatasetError
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.tracking import MlflowClient
+
+# the number of artifacts uploaded at the same time in the background
+MAX_UPLOAD_WORKERS = 4
+# the default number of files of a folder uploaded at the same time
+DEFAULT_DIRECTORY_UPLOAD_WORKERS = 8
+DEFAULT_UPLOAD_RETRIES = 3
+
+
+class PendingUpload(NamedTuple):
+    run_id: str
+    local_path: str
+    artifact_path: Optional[str]
+    future: Future
+
+
+# the uploads are shared by the whole process, so that the MlflowHook
+# can wait for all of them before the run is ended
+_upload_executor = None
+_pending_uploads: list[PendingUpload] = []
+_lock = Lock()
+
+
+def submit_artifact_upload(
+    run_id: str,
+    local_path: str,
+    artifact_path: Optional[str] = None,
+    upload: Optional[Callable[[], Any]] = None,
+) -> Future:
+    """Upload a local file or folder in a mlflow run in the background.
+
+    Args:
+        run_id (str): The ID of the mlflow run where the artifact should be logged.
+        local_path (str): The path to the file or folder to upload.
+            It must not be modified until the upload is done.
+        artifact_path (str, optional): The folder of the artifact in the run.
+        upload (Callable[[], Any], optional): The function which uploads the artifact.
+            Default to None, which calls ``MlflowClient().log_artifact``.
+
+    Returns:
+        Future: The future of the upload.
+    """
+    global _upload_executor
+    with _lock:
+        if _upload_executor is None:
+            _upload_executor = ThreadPoolExecutor(
+                max_workers=MAX_UPLOAD_WORKERS,
+                thread_name_prefix="kedro_mlflow_upload",
+            )
+        if upload is None:
+            upload = partial(
+                MlflowClient().log_artifact,
+                run_id=run_id,
+                local_path=local_path,
+                artifact_path=artifact_path,
+            )
+        future = _upload_executor.submit(upload)
+        _pending_uploads.append(
+            PendingUpload(
+                run_id=run_id,
+                local_path=local_path,
+                artifact_path=artifact_path,
+                future=future,
+            )
+        )
+    return future
+
+
+def wait_for_artifact_uploads(
+    run_id: Optional[str] = None,
+) -> list[tuple[PendingUpload, BaseException]]:
+    """Wait for the background uploads to be done.
+
+    Args:
+        run_id (str, optional): Only wait for the uploads of this run.
+            Default to None, which waits for all the uploads.
+
+    Returns:
+        list[tuple[PendingUpload, BaseException]]: The failed uploads
+            with their error. They are not reported again by further calls.
+    """
+    with _lock:
+        uploads = [
+            upload
+            for upload in _pending_uploads
+            if run_id is None or upload.run_id == run_id
+        ]
+        for upload in uploads:
+            _pending_uploads.remove(upload)
+
+    wait([upload.future for upload in uploads])
+    return [
+        (upload, upload.future.exception())
+        for upload in uploads
+        if upload.future.exception() is not None
+    ]
+
+
+def snapshot_directory(local_dir: Union[str, Path]) -> dict[str, tuple[int, int]]:
+    """Get the modification time and size of all the files of a folder.
+
+    Args:
+        local_dir (Union[str, Path]): The path to the folder.
+
+    Returns:
+        dict[str, tuple[int, int]]: A {relative path: (mtime_ns, size)} mapping.
+    """
+    local_dir = Path(local_dir)
+    if not local_dir.is_dir():
+        return {}
+    snapshot = {}
+    for file in local_dir.rglob("*"):
+        if file.is_file():
+            stat = file.stat()
+            snapshot[file.relative_to(local_dir).as_posix()] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
+    return snapshot
+
+
+def upload_directory(  # noqa: PLR0913
+    run_id: str,
+    local_dir: Union[str, Path],
+    artifact_path: Optional[str] = None,
+    files: Optional[list[str]] = None,
+    max_workers: int = DEFAULT_DIRECTORY_UPLOAD_WORKERS,
+    retries: int = DEFAULT_UPLOAD_RETRIES,
+) -> None:
+    """Upload the files of a folder in parallel, with retries for each file.
+
+    The layout in the run is the same as ``MlflowClient().log_artifact(run_id, local_dir, artifact_path)``.
+
+    Args:
+        run_id (str): The ID of the mlflow run where the folder should be logged.
+        local_dir (Union[str, Path]): The path to the folder.
+        artifact_path (str, optional): The folder of the artifact in the run.
+        files (list[str], optional): The paths relative to ``local_dir`` of the files
+            to upload. Default to None, which uploads all the files.
+        max_workers (int): The number of files uploaded at the same time. Default to 8.
+        retries (int): The number of times the upload of a file is retried
+            if it fails. Default to 3.
+    """
+    local_dir = Path(local_dir)
+    if files is None:
+        files = list(snapshot_directory(local_dir).keys())
+    root_artifact_path = (
+        (Path(artifact_path) / local_dir.name).as_posix()
+        if artifact_path
+        else local_dir.name
+    )
+    # the repository is resolved once instead of once per file
+    artifact_repository = get_artifact_repository(
+        MlflowClient().get_run(run_id).info.artifact_uri
+    )
+
+    def _upload_file(file: str) -> None:
+        parent = Path(file).parent.as_posix()
+        file_artifact_path = (
+            root_artifact_path if parent == "." else f"{root_artifact_path}/{parent}"
+        )
+        for attempt in range(retries + 1):
+            try:
+                return artifact_repository.log_artifact(
+                    (local_dir / file).as_posix(), file_artifact_path
+                )
+            except Exception:
+                if attempt == retries:
+                    raise
+                time.sleep(0.5 * 2**attempt)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_upload_file, file): file for file in files}
+        wait(futures)
+
+    failed_files = {
+        file: future.exception()
+        for future, file in futures.items()
+        if future.exception() is not None
+    }
+    if failed_files:
+        file, error = next(iter(failed_files.items()))
+        raise DatasetError(
+            f"Failed to upload {len(failed_files)} files of '{local_dir}' after {retries} retries, e.g. '{file}': {error}"
+        ) from error
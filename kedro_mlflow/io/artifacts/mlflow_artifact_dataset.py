@@ -1,16 +1,74 @@
 import shutil
+from copy import deepcopy
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional, Union
+from tempfile import mkdtemp
+from threading import Lock
+from typing import Any, Iterator, Optional, Union
 
 import mlflow
-from kedro.io import AbstractVersionedDataset
-from kedro.io.core import parse_dataset_definition
+from fsspec.implementations.memory import MemoryFileSystem
+from kedro.io import AbstractVersionedDataset, DatasetError
+from kedro.io.core import VERSION_KEY, parse_dataset_definition
+from mlflow.entities import RunTag
 from mlflow.tracking import MlflowClient
 
+from kedro_mlflow.io.artifacts.artifact_cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    ArtifactCache,
+    link_or_copy,
+    break_hardlinks,
+)
+from kedro_mlflow.io.artifacts.artifact_dedup import (
+    ARTIFACT_REFERENCE_TAG,
+    ARTIFACT_SHA256_TAG,
+    ArtifactHashIndex,
+    artifact_exists,
+    compute_sha256,
+)
+from kedro_mlflow.io.artifacts.artifact_linking import (
+    LINK_STRATEGIES,
+    get_local_artifact_dir,
+    link_artifact,
+)
+from kedro_mlflow.io.artifacts.artifact_packing import (
+    PACK_FORMATS,
+    pack_directory,
+    unpack_archive,
+)
+from kedro_mlflow.io.artifacts.artifact_uploader import (
+    snapshot_directory,
+    submit_artifact_upload,
+    upload_directory,
+    wait_for_artifact_uploads,
+)
+
+SUPPORTED_UPLOAD_ARGS = {"max_workers", "retries", "incremental"}
+
+# the generated subclass of each wrapped dataset class
+_MLFLOW_ARTIFACT_DATASET_CLASSES: dict[type, type] = {}
+_MLFLOW_ARTIFACT_DATASET_CLASSES_LOCK = Lock()
+
 
 class MlflowArtifactDataset(AbstractVersionedDataset):
     """This class is a wrapper for any kedro AbstractDataset.
     It decorates their ``save`` method to log the dataset in mlflow when ``save`` is called.
+    With ``dedup=True``, an artifact identical to one already logged in the experiment
+    is not uploaded again: the run only references it with a tag.
+    With ``download_cache=True`` (or a ``{"dir": ..., "max_size": ...}`` dict),
+    the artifacts loaded with a ``run_id`` are downloaded once in a local LRU cache
+    and hardlinked to the dataset's path.
+    With ``link_strategy`` ("hardlink", "reflink" or "move"), an artifact logged
+    in a local artifact store (e.g. "mlruns") is not copied a second time.
+    The files of a folder (e.g. a ``PartitionedDataset``) are uploaded in parallel,
+    which is configured with ``upload_args`` ("max_workers", "retries" and "incremental").
+    With ``pack`` ("tar" or "zstd"), a folder is uploaded as a single archive instead,
+    which is extracted in the folder when it is loaded with a ``run_id``.
+    With ``local_persistence=False``, the data is serialized in memory and only
+    uploaded to mlflow: it is not written at the dataset's path.
+    With ``async_upload=True``, the upload runs in the background and ``save`` returns
+    as soon as the file is written locally. Within a kedro run, the ``MlflowHook`` waits
+    for the uploads before the run is ended.
     """
 
     def __new__(
@@ -20,138 +78,42 @@ class MlflowArtifactDataset(AbstractVersionedDataset):
         artifact_path: str = None,
         credentials: dict[str, Any] = None,
         metadata: Optional[dict[str, Any]] = None,
+        async_upload: bool = False,
+        dedup: bool = False,
+        download_cache: Union[bool, dict[str, Any]] = False,
+        link_strategy: Optional[str] = None,
+        upload_args: Optional[dict[str, Any]] = None,
+        pack: Optional[str] = None,
+        local_persistence: bool = True,
     ):
+        if pack is not None and pack not in PACK_FORMATS:
+            raise DatasetError(
+                f"pack must be one of {set(PACK_FORMATS)}, got '{pack}' instead."
+            )
+        unknown_upload_args = set(upload_args or {}) - SUPPORTED_UPLOAD_ARGS
+        if unknown_upload_args:
+            raise DatasetError(
+                f"upload_args only supports {SUPPORTED_UPLOAD_ARGS} keys, got {unknown_upload_args}."
+            )
+        if link_strategy is not None and link_strategy not in LINK_STRATEGIES:
+            raise DatasetError(
+                f"link_strategy must be one of {LINK_STRATEGIES}, got '{link_strategy}' instead."
+            )
         dataset_obj, dataset_args = parse_dataset_definition(config=dataset)
 
-        # fake inheritance : this mlflow class should be a mother class which wraps
-        # all dataset (i.e. it should replace AbstractVersionedDataset)
-        # instead and since we can't modify the core package,
-        # we create a subclass which inherits dynamically from the dataset class
-        class MlflowArtifactDatasetChildren(dataset_obj):
-            def __init__(self, run_id, artifact_path, metadata):
-                super().__init__(**dataset_args)
-                self.run_id = run_id
-                self.artifact_path = artifact_path
-                self._logging_activated = True
-                self.metadata = metadata
-
-            @property
-            def _logging_activated(self):
-                return self.__logging_activated
-
-            @_logging_activated.setter
-            def _logging_activated(self, flag):
-                if not isinstance(flag, bool):
-                    raise ValueError(
-                        f"_logging_activated must be a boolean, got {type(flag)}"
-                    )
-                self.__logging_activated = flag
-
-            def _save(self, data: Any):
-                # _get_save_path needs to be called before super, otherwise
-                # it will throw exception that file under path already exist.
-                if hasattr(self, "_version"):
-                    # all kedro datasets inherits from AbstractVersionedDataset
-                    local_path = self._get_save_path()
-                elif hasattr(self, "_filepath"):
-                    # in case custom datasets inherits from AbstractDataset without versioning
-                    local_path = self._filepath  # pragma: no cover
-                elif hasattr(self, "_path"):
-                    # special datasets with a folder instead of a specific files like PartitionedDataset
-                    local_path = Path(self._path)
-
-                # it must be converted to a string with as_posix()
-                # for logging on remote storage like Azure S3
-                local_path = local_path.as_posix()
-
-                if hasattr(super().save, "__wrapped__"):  # modern dataset
-                    super().save.__wrapped__(self, data)
-                else:  # legacy dataset
-                    super()._save(data)
-
-                if self._logging_activated:
-                    if self.run_id:
-                        # if a run id is specified, we have to use mlflow client
-                        # to avoid potential conflicts with an already active run
-                        mlflow_client = MlflowClient()
-                        mlflow_client.log_artifact(
-                            run_id=self.run_id,
-                            local_path=local_path,
-                            artifact_path=self.artifact_path,
-                        )
-                    else:
-                        mlflow.log_artifact(local_path, self.artifact_path)
-
-            def _load(self) -> Any:  # pragma: no cover
-                if self.run_id:
-                    # if no run_id is specified, we take the artifact from the local path rather that the active run:
-                    # there are a lot of chances that it has not been saved yet!
-
-                    if hasattr(self, "_version"):
-                        # all kedro datasets inherits from AbstractVersionedDataset
-                        local_path = self._get_load_path()
-                    elif hasattr(self, "_filepath"):
-                        # in case custom datasets inherits from AbstractDataset without versioning
-                        local_path = self._filepath  # pragma: no cover
-                    elif hasattr(self, "_path"):
-                        # special datasets with a folder instead of a specific files like PartitionedDataset
-                        local_path = Path(self._path)
-
-                    # BEWARE: we must enforce Path(local_path) because it is a PurePosixPath which fails on windows
-                    # this is very weird: if you assign the value, it is converted to a Pureposixpath again, e.g:
-                    # this fails:
-                    #      local_path = Path(local_path)
-                    #      local_path.name # local_path has been converted back to PurePosixPath on windows on this 2nd row
-                    # but this works as a one liner:
-                    #      filename = Path(local_path).name
-
-                    filename = Path(local_path).name
-                    artifact_path = (
-                        (self.artifact_path / Path(filename)).as_posix()
-                        if self.artifact_path
-                        else filename
-                    )
-
-                    mlflow_client = MlflowClient()
-                    # specific trick to manage different behaviour between mlflow 1 and 2
-                    if hasattr(mlflow_client, "download_artifacts"):
-                        # download in mlflow 1
-                        # we cannot use dst_path, because it downloads the file to "local_path / artifact_path /filename.pkl"
-                        # the artifact_path suffix prevents from loading when we call super._load()
-                        temp_download_filepath = mlflow_client.download_artifacts(
-                            run_id=self.run_id,
-                            path=artifact_path,
-                            # dst_path=local_path.parent.as_posix(),
-                        )
-                    else:
-                        # download in mlflow 2
-                        from mlflow.artifacts import download_artifacts
-
-                        temp_download_filepath = download_artifacts(
-                            run_id=self.run_id,
-                            artifact_path=artifact_path,
-                            # dst_path=local_path.parent.as_posix(),
-                        )
-
-                    shutil.copy(src=temp_download_filepath, dst=local_path)
-
-                # finally, read locally
-                if hasattr(super().load, "__wrapped__"):  # modern dataset
-                    return super().load.__wrapped__(self)
-                else:  # legacy dataset
-                    return super()._load()
-
-        # rename the class
-        parent_name = dataset_obj.__name__
-        MlflowArtifactDatasetChildren.__name__ = f"Mlflow{parent_name}"
-        MlflowArtifactDatasetChildren.__qualname__ = (
-            f"{parent_name}.Mlflow{parent_name}"
-        )
-
-        mlflow_dataset_instance = MlflowArtifactDatasetChildren(
+        mlflow_dataset_class = _get_mlflow_artifact_dataset_class(dataset_obj)
+        mlflow_dataset_instance = mlflow_dataset_class(
+            dataset_args=dataset_args,
             run_id=run_id,
             artifact_path=artifact_path,
             metadata=metadata,
+            async_upload=async_upload,
+            dedup=dedup,
+            download_cache=download_cache,
+            link_strategy=link_strategy,
+            upload_args=upload_args,
+            pack=pack,
+            local_persistence=local_persistence,
         )
         return mlflow_dataset_instance
 
@@ -177,6 +139,600 @@ class MlflowArtifactDataset(AbstractVersionedDataset):
         pass
 
 
+def _get_mlflow_artifact_dataset_class(dataset_obj: type) -> type:
+    """Get the subclass of a dataset class which logs it in mlflow.
+
+    The subclass is generated once per dataset class and then reused,
+    so that a catalog with many ``MlflowArtifactDataset`` entries does not
+    create as many classes.
+
+    Args:
+        dataset_obj (type): The dataset class to wrap.
+
+    Returns:
+        type: The generated subclass.
+    """
+    with _MLFLOW_ARTIFACT_DATASET_CLASSES_LOCK:
+        if dataset_obj not in _MLFLOW_ARTIFACT_DATASET_CLASSES:
+            _MLFLOW_ARTIFACT_DATASET_CLASSES[dataset_obj] = (
+                _make_mlflow_artifact_dataset_class(dataset_obj)
+            )
+        return _MLFLOW_ARTIFACT_DATASET_CLASSES[dataset_obj]
+
+
+def _rebuild_mlflow_artifact_dataset(dataset_obj: type, state: dict[str, Any]):
+    mlflow_dataset_class = _get_mlflow_artifact_dataset_class(dataset_obj)
+    mlflow_dataset_instance = mlflow_dataset_class.__new__(mlflow_dataset_class)
+    mlflow_dataset_instance.__dict__.update(state)
+    return mlflow_dataset_instance
+
+
+def _make_mlflow_artifact_dataset_class(dataset_obj: type) -> type:
+    # fake inheritance : this mlflow class should be a mother class which wraps
+    # all dataset (i.e. it should replace AbstractVersionedDataset)
+    # instead and since we can't modify the core package,
+    # we create a subclass which inherits dynamically from the dataset class
+    class MlflowArtifactDatasetChildren(dataset_obj):
+        def __init__(  # noqa: PLR0913
+            self,
+            dataset_args,
+            run_id,
+            artifact_path,
+            metadata,
+            async_upload,
+            dedup,
+            download_cache,
+            link_strategy,
+            upload_args,
+            pack,
+            local_persistence,
+        ):
+            super().__init__(**dataset_args)
+            self.run_id = run_id
+            self.artifact_path = artifact_path
+            self._logging_activated = True
+            self.metadata = metadata
+            self.async_upload = async_upload
+            self.dedup = dedup
+            self.download_cache = download_cache
+            self.link_strategy = link_strategy
+            self.upload_args = upload_args or {}
+            self.pack = pack
+            self.local_persistence = local_persistence
+            if not local_persistence and not hasattr(self, "_fs"):
+                raise DatasetError(
+                    f"local_persistence=False requires a dataset which writes its file through fsspec, which is not the case of '{dataset_obj.__name__}'."
+                )
+            if not local_persistence and getattr(self, "_version", None):
+                raise DatasetError(
+                    "local_persistence=False cannot be used with a versioned dataset, whose saved version is checked on the disk."
+                )
+            if not local_persistence and pack:
+                raise DatasetError(
+                    "local_persistence=False cannot be used with pack, which only supports folders."
+                )
+            if isinstance(download_cache, dict):
+                self._artifact_cache = ArtifactCache(
+                    cache_dir=download_cache.get("dir"),
+                    max_size=download_cache.get("max_size", DEFAULT_CACHE_MAX_SIZE),
+                )
+            elif download_cache:
+                self._artifact_cache = ArtifactCache()
+            else:
+                self._artifact_cache = None
+
+        def __reduce__(self):
+            # the class is generated, so it cannot be imported by its name:
+            # it is retrieved from the registry when the instance is unpickled
+            return (_rebuild_mlflow_artifact_dataset, (dataset_obj, self.__dict__))
+
+        @property
+        def _logging_activated(self):
+            return self.__logging_activated
+
+        @_logging_activated.setter
+        def _logging_activated(self, flag):
+            if not isinstance(flag, bool):
+                raise ValueError(
+                    f"_logging_activated must be a boolean, got {type(flag)}"
+                )
+            self.__logging_activated = flag
+
+        def _save(self, data: Any):
+            # _get_save_path needs to be called before super, otherwise
+            # it will throw exception that file under path already exist.
+            if hasattr(self, "_version"):
+                # all kedro datasets inherits from AbstractVersionedDataset
+                local_path = self._get_save_path()
+            elif hasattr(self, "_filepath"):
+                # in case custom datasets inherits from AbstractDataset without versioning
+                local_path = self._filepath  # pragma: no cover
+            elif hasattr(self, "_path"):
+                # special datasets with a folder instead of a specific files like PartitionedDataset
+                local_path = Path(self._path)
+
+            # it must be converted to a string with as_posix()
+            # for logging on remote storage like Azure S3
+            local_path = local_path.as_posix()
+
+            # the data is only written in memory to be uploaded
+            buffered = self._logging_activated and not self.local_persistence
+
+            # a file served by the download cache or linked in the artifact store
+            # is a hardlink: writing through it would modify the linked file too
+            if not buffered and (
+                self._artifact_cache is not None or self.link_strategy
+            ):
+                break_hardlinks(self._get_rewritten_files(local_path, data))
+
+            upload_args = dict(self.upload_args)
+            incremental = upload_args.pop("incremental", False)
+            if incremental:
+                # the partitions written by this save are found by comparing
+                # the folder before and after it
+                snapshot_before_save = snapshot_directory(local_path)
+
+            if buffered:
+                local_fs = self._fs
+                # a private store, instead of the one shared by all the memory filesystems
+                self._fs = MemoryFileSystem(skip_instance_cache=True)
+                self._fs.store = {}
+                self._fs.pseudo_dirs = [""]
+            try:
+                if hasattr(super().save, "__wrapped__"):  # modern dataset
+                    super().save.__wrapped__(self, data)
+                else:  # legacy dataset
+                    super()._save(data)
+                if buffered:
+                    content = self._fs.cat_file(local_path)
+            finally:
+                if buffered:
+                    self._fs = local_fs
+
+            if self._logging_activated:
+                # the run is resolved now: it may no longer be active
+                # when the background upload starts
+                active_run = mlflow.active_run()
+                run_id = self.run_id or (active_run and active_run.info.run_id)
+
+                tmp_dir = None
+                upload_path = local_path
+                if buffered:
+                    # mlflow only uploads files: the content is written in a temporary
+                    # file, which is removed as soon as it is uploaded
+                    tmp_dir = mkdtemp()
+                    upload_path = local_path = (
+                        Path(tmp_dir) / Path(local_path).name
+                    ).as_posix()
+                    Path(upload_path).write_bytes(content)
+                    del content
+                elif self.pack:
+                    if not Path(local_path).is_dir():
+                        raise DatasetError(
+                            f"pack only supports datasets saved in a folder, but '{local_path}' is not a folder."
+                        )
+                    # the folder is uploaded as a single archive
+                    # instead of one request per file
+                    tmp_dir = mkdtemp()
+                    upload_path = (
+                        Path(tmp_dir)
+                        / f"{Path(local_path).name}{PACK_FORMATS[self.pack]}"
+                    ).as_posix()
+                    pack_directory(local_path, upload_path, self.pack)
+
+                tmp_dir_removed_in_background = False
+                try:
+                    tmp_dir_removed_in_background = self._log_artifact(
+                        run_id=run_id,
+                        local_path=local_path,
+                        upload_path=upload_path,
+                        incremental=incremental,
+                        snapshot_before_save=snapshot_before_save
+                        if incremental
+                        else None,
+                        upload_args=upload_args,
+                        tmp_dir=tmp_dir,
+                    )
+                finally:
+                    if tmp_dir and not tmp_dir_removed_in_background:
+                        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        def _get_rewritten_files(self, local_path, data) -> list[str]:
+            if not Path(local_path).is_dir():
+                return [local_path]
+            if hasattr(self, "_partition_to_path") and isinstance(data, dict):
+                # a PartitionedDataset only rewrites the saved partitions,
+                # the other ones are left untouched
+                return [self._partition_to_path(partition) for partition in data]
+            # the files rewritten by other folder datasets are unknown
+            return [file for file in Path(local_path).rglob("*") if file.is_file()]
+
+        def _log_artifact(  # noqa: PLR0913
+            self,
+            run_id,
+            local_path,
+            upload_path,
+            incremental,
+            snapshot_before_save,
+            upload_args,
+            tmp_dir,
+        ) -> bool:
+            # returns True if tmp_dir, which holds a temporary file to upload,
+            # is removed by a background upload instead of the caller
+            tmp_dir_removed_in_background = False
+            sha256 = None
+            if self.dedup and run_id:
+                sha256 = compute_sha256(local_path)
+                run = MlflowClient().get_run(run_id)
+                hash_index = ArtifactHashIndex(run.info.experiment_id)
+                if self._log_artifact_reference(
+                    run_id, upload_path, sha256, hash_index
+                ):
+                    return False
+
+            record_sha256 = None
+            if sha256:
+
+                def record_sha256():
+                    # the artifact is only indexed once it is uploaded, so that
+                    # no later save references an artifact which does not exist
+                    artifact_file_path = self._get_artifact_file_path(upload_path)
+                    mlflow_client = MlflowClient()
+                    mlflow_client.set_tag(
+                        run_id,
+                        f"{ARTIFACT_SHA256_TAG}.{artifact_file_path}",
+                        sha256,
+                    )
+                    reference_tag = f"{ARTIFACT_REFERENCE_TAG}.{artifact_file_path}"
+                    if reference_tag in run.data.tags:
+                        # the artifact was a reference before this save
+                        mlflow_client.delete_tag(run_id, reference_tag)
+                    hash_index.add(sha256, run_id, artifact_file_path)
+
+            def _upload_and_record(upload):
+                def _upload():
+                    upload()
+                    if record_sha256 is not None:
+                        record_sha256()
+
+                return _upload
+
+            artifact_dir = (
+                get_local_artifact_dir(run_id)
+                if self.link_strategy and run_id
+                else None
+            )
+            if artifact_dir is not None:
+                # the artifact store is on a local filesystem:
+                # the file is put in it without a second full copy
+                link_artifact(
+                    local_path=upload_path,
+                    destination=artifact_dir
+                    / self._get_artifact_file_path(upload_path),
+                    strategy=self.link_strategy,
+                )
+            elif run_id and Path(upload_path).is_dir():
+                # a folder is uploaded file by file in parallel
+                files = None
+                if incremental:
+                    files = [
+                        file
+                        for file, stat in snapshot_directory(local_path).items()
+                        if snapshot_before_save.get(file) != stat
+                    ]
+                upload = partial(
+                    upload_directory,
+                    run_id=run_id,
+                    local_dir=local_path,
+                    artifact_path=self.artifact_path,
+                    files=files,
+                    **upload_args,
+                )
+                if self.async_upload:
+                    submit_artifact_upload(
+                        run_id=run_id,
+                        local_path=local_path,
+                        artifact_path=self.artifact_path,
+                        upload=_upload_and_record(upload),
+                    )
+                    return tmp_dir_removed_in_background
+                upload()
+            elif self.async_upload and run_id:
+                upload = partial(
+                    MlflowClient().log_artifact,
+                    run_id=run_id,
+                    local_path=upload_path,
+                    artifact_path=self.artifact_path,
+                )
+                if tmp_dir:
+                    tmp_dir_removed_in_background = True
+                    log_artifact = upload
+
+                    def upload():
+                        try:
+                            log_artifact()
+                        finally:
+                            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+                submit_artifact_upload(
+                    run_id=run_id,
+                    local_path=upload_path,
+                    artifact_path=self.artifact_path,
+                    upload=_upload_and_record(upload),
+                )
+                return tmp_dir_removed_in_background
+            elif self.run_id:
+                # if a run id is specified, we have to use mlflow client
+                # to avoid potential conflicts with an already active run
+                mlflow_client = MlflowClient()
+                mlflow_client.log_artifact(
+                    run_id=self.run_id,
+                    local_path=upload_path,
+                    artifact_path=self.artifact_path,
+                )
+            else:
+                mlflow.log_artifact(upload_path, self.artifact_path)
+
+            if record_sha256 is not None:
+                record_sha256()
+
+            return tmp_dir_removed_in_background
+
+        def _get_artifact_file_path(self, local_path) -> str:
+            # BEWARE: we must enforce Path(local_path) because it is a PurePosixPath which fails on windows
+            # this is very weird: if you assign the value, it is converted to a Pureposixpath again, e.g:
+            # this fails:
+            #      local_path = Path(local_path)
+            #      local_path.name # local_path has been converted back to PurePosixPath on windows on this 2nd row
+            # but this works as a one liner:
+            #      filename = Path(local_path).name
+            filename = Path(local_path).name
+            return (
+                (self.artifact_path / Path(filename)).as_posix()
+                if self.artifact_path
+                else filename
+            )
+
+        def _log_artifact_reference(
+            self, run_id, local_path, sha256, hash_index
+        ) -> bool:
+            # an identical artifact is already stored in the experiment:
+            # the run only references it instead of uploading it again
+            duplicate = hash_index.get(sha256)
+            if duplicate is None:
+                return False
+            if not artifact_exists(*duplicate):
+                # the run has been deleted since it was indexed
+                hash_index.remove(sha256)
+                return False
+
+            duplicate_run_id, duplicate_artifact_path = duplicate
+            artifact_file_path = self._get_artifact_file_path(local_path)
+            tags = [RunTag(f"{ARTIFACT_SHA256_TAG}.{artifact_file_path}", sha256)]
+            if duplicate != (run_id, artifact_file_path):
+                tags.append(
+                    RunTag(
+                        f"{ARTIFACT_REFERENCE_TAG}.{artifact_file_path}",
+                        f"runs:/{duplicate_run_id}/{duplicate_artifact_path}",
+                    )
+                )
+            MlflowClient().log_batch(run_id=run_id, tags=tags)
+            return True
+
+        def _verify_sha256(self, path, sha256, artifact_run_id, artifact_path):
+            if self.dedup and sha256 and compute_sha256(path) != sha256:
+                raise DatasetError(
+                    f"The artifact '{artifact_path}' of the run '{artifact_run_id}' is corrupted: its sha256 does not match the one recorded when it was saved."
+                )
+
+        def _fetch_artifact(self, run_id, artifact_path) -> str:
+            mlflow_client = MlflowClient()
+
+            def _download(dst_path=None):
+                # specific trick to manage different behaviour between mlflow 1 and 2
+                if hasattr(mlflow_client, "download_artifacts"):
+                    # download in mlflow 1
+                    # we cannot use dst_path=local_path.parent, because it downloads the file to "local_path / artifact_path /filename.pkl"
+                    # the artifact_path suffix prevents from loading when we call super._load()
+                    return mlflow_client.download_artifacts(
+                        run_id=run_id,
+                        path=artifact_path,
+                        dst_path=dst_path,
+                    )
+                else:
+                    # download in mlflow 2
+                    from mlflow.artifacts import download_artifacts
+
+                    return download_artifacts(
+                        run_id=run_id,
+                        artifact_path=artifact_path,
+                        dst_path=dst_path,
+                    )
+
+            if self._artifact_cache is not None:
+                # the artifact is downloaded once and then served from the cache
+                return self._artifact_cache.get(
+                    tracking_uri=mlflow.get_tracking_uri(),
+                    run_id=run_id,
+                    artifact_path=artifact_path,
+                    download=_download,
+                )
+            return _download()
+
+        def _copy_artifact(self, temp_download_filepath, local_path):
+            if self._artifact_cache is not None:
+                # the cached file must never be modified: the link
+                # is removed before the dataset is saved again
+                link_or_copy(src=temp_download_filepath, dst=local_path)
+            elif Path(temp_download_filepath).is_dir():
+                shutil.copytree(
+                    src=temp_download_filepath, dst=local_path, dirs_exist_ok=True
+                )
+            else:
+                Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy(src=temp_download_filepath, dst=local_path)
+
+        def _load_partitions(self, run_id, artifact_path):
+            # same as PartitionedDataset.load, but the partitions are
+            # listed in the run instead of the local folder
+            mlflow_client = MlflowClient()
+            partitions = {}
+            for partition_artifact_path in _list_artifact_files(
+                mlflow_client, run_id, artifact_path
+            ):
+                relative_path = partition_artifact_path[len(artifact_path) + 1 :]
+                if not relative_path.endswith(self._filename_suffix):
+                    continue
+                partition_id = (
+                    relative_path[: -len(self._filename_suffix)]
+                    if self._filename_suffix
+                    else relative_path
+                )
+                partitions[partition_id] = partial(
+                    self._load_partition,
+                    run_id=run_id,
+                    partition_artifact_path=partition_artifact_path,
+                    partition_id=partition_id,
+                )
+
+            if not partitions:
+                raise DatasetError(
+                    f"No partitions found in the artifact '{artifact_path}' of the run '{run_id}'"
+                )
+            return partitions
+
+        def _load_partition(self, run_id, partition_artifact_path, partition_id):
+            local_path = self._partition_to_path(partition_id)
+            temp_download_filepath = self._fetch_artifact(
+                run_id, partition_artifact_path
+            )
+            self._copy_artifact(temp_download_filepath, local_path)
+            kwargs = deepcopy(self._dataset_config)
+            kwargs[self._filepath_arg] = self._join_protocol(local_path)
+            return self._dataset_type(**kwargs).load()
+
+        def _resolve_artifact(self):
+            # returns the local path of the dataset, and the run, path and sha256
+            # of its artifact, which may be a reference to another run
+            if hasattr(self, "_version"):
+                # all kedro datasets inherits from AbstractVersionedDataset
+                local_path = self._get_load_path()
+            elif hasattr(self, "_filepath"):
+                # in case custom datasets inherits from AbstractDataset without versioning
+                local_path = self._filepath  # pragma: no cover
+            elif hasattr(self, "_path"):
+                # special datasets with a folder instead of a specific files like PartitionedDataset
+                local_path = Path(self._path)
+
+            artifact_path = self._get_artifact_file_path(local_path)
+            if self.pack:
+                artifact_path = f"{artifact_path}{PACK_FORMATS[self.pack]}"
+
+            artifact_run_id = self.run_id
+            reference = sha256 = None
+            if self.dedup:
+                # the artifact may be a reference to an identical artifact of another run
+                run_tags = MlflowClient().get_run(self.run_id).data.tags
+                reference = run_tags.get(f"{ARTIFACT_REFERENCE_TAG}.{artifact_path}")
+                sha256 = run_tags.get(f"{ARTIFACT_SHA256_TAG}.{artifact_path}")
+            if reference:
+                artifact_run_id, artifact_path = reference.removeprefix("runs:/").split(
+                    "/", 1
+                )
+            return local_path, artifact_run_id, artifact_path, sha256
+
+        def _loads_partitions_lazily(self, sha256) -> bool:
+            # a whole folder is needed to unpack it or to verify its sha256
+            return (
+                _is_partitioned_dataset(self)
+                and not self.pack
+                and not (self.dedup and sha256)
+            )
+
+        def prefetch(self) -> bool:
+            """Download the artifact of the run in the local cache, so that
+            it is ready when the dataset is loaded.
+
+            Returns:
+                bool: Was the artifact prefetched? It requires a ``run_id`` and
+                    a ``download_cache``. The partitions of a ``PartitionedDataset``
+                    are not prefetched, since they are downloaded on demand.
+            """
+            if self.run_id is None or self._artifact_cache is None:
+                return False
+            _, artifact_run_id, artifact_path, sha256 = self._resolve_artifact()
+            if self._loads_partitions_lazily(sha256):
+                return False
+            self._fetch_artifact(artifact_run_id, artifact_path)
+            return True
+
+        def _load(self) -> Any:  # pragma: no cover
+            if self.run_id:
+                # the artifact may still be uploading in the background
+                failed_uploads = wait_for_artifact_uploads(run_id=self.run_id)
+                if failed_uploads:
+                    raise DatasetError(
+                        f"The background upload of {[upload.local_path for upload, _ in failed_uploads]} failed: {failed_uploads[0][1]}"
+                    )
+
+                # if no run_id is specified, we take the artifact from the local path rather that the active run:
+                # there are a lot of chances that it has not been saved yet!
+
+                local_path, artifact_run_id, artifact_path, sha256 = (
+                    self._resolve_artifact()
+                )
+
+                if self._loads_partitions_lazily(sha256):
+                    # the partitions are only downloaded when they are loaded
+                    return self._load_partitions(artifact_run_id, artifact_path)
+
+                temp_download_filepath = self._fetch_artifact(
+                    artifact_run_id, artifact_path
+                )
+
+                if self.pack:
+                    unpack_archive(temp_download_filepath, local_path, self.pack)
+                    # the sha256 of a packed artifact is the one of the folder
+                    self._verify_sha256(
+                        local_path, sha256, artifact_run_id, artifact_path
+                    )
+                else:
+                    self._verify_sha256(
+                        temp_download_filepath,
+                        sha256,
+                        artifact_run_id,
+                        artifact_path,
+                    )
+                    self._copy_artifact(temp_download_filepath, local_path)
+
+            # finally, read locally
+            if hasattr(super().load, "__wrapped__"):  # modern dataset
+                return super().load.__wrapped__(self)
+            else:  # legacy dataset
+                return super()._load()
+
+    # rename the class
+    parent_name = dataset_obj.__name__
+    MlflowArtifactDatasetChildren.__name__ = f"Mlflow{parent_name}"
+    MlflowArtifactDatasetChildren.__qualname__ = f"{parent_name}.Mlflow{parent_name}"
+    return MlflowArtifactDatasetChildren
+
+
+def _is_partitioned_dataset(dataset_instance) -> bool:
+    # PartitionedDataset and its subclasses, with partitions which are not versioned
+    return hasattr(dataset_instance, "_partition_to_path") and (
+        VERSION_KEY not in getattr(dataset_instance, "_dataset_config", {})
+    )
+
+
+def _list_artifact_files(mlflow_client, run_id, artifact_path) -> Iterator[str]:
+    for file_info in mlflow_client.list_artifacts(run_id, artifact_path):
+        if file_info.is_dir:
+            yield from _list_artifact_files(mlflow_client, run_id, file_info.path)
+        else:
+            yield file_info.path
+
+
 def _is_instance_mlflow_artifact_dataset(dataset_instance):
     parent_classname = dataset_instance.__class__.__bases__[0].__name__
     instance_classname = f"Mlflow{parent_classname}"
@@ -0,0 +1,67 @@
+import time
+from concurrent.futures import Executor, Future
+from logging import getLogger
+from threading import Lock
+from typing import Iterable
+
+LOGGER = getLogger(__name__)
+
+
+def prefetch_catalog_datasets(
+    catalog, dataset_names: Iterable[str], executor: Executor
+) -> dict[str, Future]:
+    """Download in the background the datasets which are pinned to a mlflow run or model.
+
+    The datasets with a ``prefetch`` method (``MlflowArtifactDataset``,
+    ``MlflowModelTrackingDataset`` and ``MlflowModelRegistryDataset``) download
+    their artifact in their local cache, so that it is ready when they are loaded.
+
+    Args:
+        catalog (CatalogProtocol): The catalog of the datasets.
+        dataset_names (Iterable[str]): The names of the datasets to prefetch.
+        executor (Executor): The executor which runs the downloads.
+
+    Returns:
+        dict[str, Future]: The download of each dataset which can be prefetched.
+            Its result is True if the dataset has been prefetched.
+    """
+    datasets = {}
+    for name in sorted(dataset_names):
+        dataset = catalog.get(name) if name in catalog else None
+        if hasattr(dataset, "prefetch"):
+            datasets[name] = dataset
+    if not datasets:
+        return {}
+
+    start = time.perf_counter()
+    lock = Lock()
+    done = []
+
+    def _prefetch(name, dataset):
+        dataset_start = time.perf_counter()
+        prefetched = dataset.prefetch()
+        if prefetched:
+            LOGGER.info(
+                f"Prefetched '{name}' in {time.perf_counter() - dataset_start:.2f}s"
+            )
+        return prefetched
+
+    def _report(name, future):
+        with lock:
+            done.append(name)
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                # the dataset will be downloaded when it is loaded
+                LOGGER.warning(f"The prefetch of '{name}' failed: {future.exception()}")
+            if len(done) == len(datasets):
+                LOGGER.info(
+                    f"The prefetch of the mlflow datasets is done in {time.perf_counter() - start:.2f}s"
+                )
+
+    LOGGER.info(f"Prefetching the mlflow datasets {list(datasets)}")
+    futures = {}
+    for name, dataset in datasets.items():
+        futures[name] = executor.submit(_prefetch, name, dataset)
+        futures[name].add_done_callback(lambda future, name=name: _report(name, future))
+    return futures
@@ -1,9 +1,16 @@
+from .mlflow_experiment_metrics_dataset import MlflowExperimentMetricsDataset
 from .mlflow_metric_dataset import MlflowMetricDataset
 from .mlflow_metric_history_dataset import MlflowMetricHistoryDataset
+from .mlflow_metric_logger import MlflowMetricLogger, get_metric_logger
+from .mlflow_metric_series_dataset import MlflowMetricSeriesDataset
 from .mlflow_metrics_history_dataset import MlflowMetricsHistoryDataset
 
 __all__ = [
+    "MlflowExperimentMetricsDataset",
     "MlflowMetricDataset",
     "MlflowMetricHistoryDataset",
+    "MlflowMetricLogger",
+    "MlflowMetricSeriesDataset",
     "MlflowMetricsHistoryDataset",
+    "get_metric_logger",
 ]
@@ -0,0 +1,191 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import mlflow
+import pandas as pd
+from kedro.io import AbstractDataset, DatasetError
+from mlflow.entities import ViewType
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.tracking import MlflowClient
+
+
+class MlflowExperimentMetricsDataset(AbstractDataset):
+    """This class loads the metrics of all the runs of an experiment matching
+    a filter into a single pandas DataFrame."""
+
+    def __init__(
+        self,
+        experiment_name: Optional[str] = None,
+        filter_string: str = "",
+        metric_keys: Optional[list[str]] = None,
+        load_args: Optional[dict[str, Any]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ):
+        """Initialise MlflowExperimentMetricsDataset.
+
+        Args:
+            experiment_name (Optional[str]): The name of the experiment to search in.
+                If None, the experiment of the active run is used.
+            filter_string (str): A valid mlflow search filter,
+                e.g. "attributes.status = 'FINISHED'". Default to "" (all runs).
+            metric_keys (Optional[list[str]]): The metrics to retrieve. If None,
+                all the metrics of the runs are retrieved.
+            load_args (dict[str, Any], optional): Options for loading:
+                - max_results (int): the maximum number of runs to return. Default to None (all runs).
+                - order_by (list[str]): the ordering of the runs, e.g. ["attributes.start_time DESC"].
+                - history (bool): if True, return the full history of each metric
+                  in long format (one row per run, key and step). If False, return the
+                  last value of each metric (one row per run). Default to False.
+                - max_workers (int): the number of threads used to fetch the histories
+                  concurrently when 'history' is True. Default to None (sequential fetching).
+            metadata: Any arbitrary metadata.
+                This is ignored by Kedro, but may be consumed by users or external plugins.
+        """
+        self.experiment_name = experiment_name
+        self.filter_string = filter_string
+        self.metric_keys = metric_keys
+        self._load_args = load_args or {}
+        self.metadata = metadata
+
+    def _get_experiment_id(self, mlflow_client: MlflowClient) -> str:
+        if self.experiment_name is None:
+            run = mlflow.active_run()
+            if run is None:
+                raise DatasetError(
+                    "You must either specify an 'experiment_name' or have a mlflow active run opened."
+                )
+            return run.info.experiment_id
+
+        experiment = mlflow_client.get_experiment_by_name(self.experiment_name)
+        if experiment is None:
+            raise DatasetError(
+                f"The experiment '{self.experiment_name}' does not exist."
+            )
+        return experiment.experiment_id
+
+    def _search_runs(self, mlflow_client: MlflowClient) -> list[mlflow.entities.Run]:
+        # we paginate over a single search query instead of querying the runs one by one
+        experiment_id = self._get_experiment_id(mlflow_client)
+        max_results = self._load_args.get("max_results")
+        runs = []
+        page_token = None
+        while True:
+            page_size = SEARCH_MAX_RESULTS_DEFAULT
+            if max_results is not None:
+                page_size = min(page_size, max_results - len(runs))
+            page: PagedList = mlflow_client.search_runs(
+                experiment_ids=[experiment_id],
+                filter_string=self.filter_string,
+                run_view_type=ViewType.ACTIVE_ONLY,
+                max_results=page_size,
+                order_by=self._load_args.get("order_by"),
+                page_token=page_token,
+            )
+            runs.extend(page)
+            page_token = page.token
+            if not page_token or (max_results is not None and len(runs) >= max_results):
+                break
+        return runs
+
+    def _load(self) -> pd.DataFrame:
+        mlflow_client = MlflowClient()
+        runs = self._search_runs(mlflow_client)
+
+        if self._load_args.get("history", False):
+            return self._load_histories(mlflow_client, runs)
+
+        records = []
+        for run in runs:
+            metrics = run.data.metrics
+            keys = self.metric_keys if self.metric_keys is not None else metrics.keys()
+            records.append(
+                {
+                    "run_id": run.info.run_id,
+                    "run_name": run.info.run_name,
+                    "start_time": run.info.start_time,
+                    **{key: metrics.get(key) for key in keys},
+                }
+            )
+        return pd.DataFrame.from_records(records, columns=self._columns(records))
+
+    def _load_histories(
+        self, mlflow_client: MlflowClient, runs: list[mlflow.entities.Run]
+    ) -> pd.DataFrame:
+        # there is no batch endpoint for histories, so we fetch them concurrently if requested
+        requests = [
+            (run.info.run_id, key)
+            for run in runs
+            for key in (
+                self.metric_keys
+                if self.metric_keys is not None
+                else run.data.metrics.keys()
+            )
+            if key in run.data.metrics
+        ]
+
+        def fetch(request):
+            run_id, key = request
+            return [
+                {
+                    "run_id": run_id,
+                    "key": key,
+                    "step": metric.step,
+                    "timestamp": metric.timestamp,
+                    "value": metric.value,
+                }
+                for metric in mlflow_client.get_metric_history(run_id, key)
+            ]
+
+        max_workers = self._load_args.get("max_workers")
+        if max_workers:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                histories = list(executor.map(fetch, requests))
+        else:
+            histories = [fetch(request) for request in requests]
+
+        return pd.DataFrame.from_records(
+            [record for history in histories for record in history],
+            columns=["run_id", "key", "step", "timestamp", "value"],
+        )
+
+    def _columns(self, records: list[dict[str, Any]]) -> list[str]:
+        columns = ["run_id", "run_name", "start_time"]
+        if self.metric_keys is not None:
+            return columns + list(self.metric_keys)
+        # keep the order of appearance of the metric keys across runs
+        metric_columns = dict.fromkeys(
+            key for record in records for key in record if key not in columns
+        )
+        return columns + list(metric_columns)
+
+    def _save(self, data: pd.DataFrame) -> None:
+        raise NotImplementedError(
+            "The 'save' method is not implemented for MlflowExperimentMetricsDataset. Use 'MlflowMetricDataset', 'MlflowMetricHistoryDataset' or 'MlflowMetricsHistoryDataset' to log metrics."
+        )
+
+    def _exists(self) -> bool:
+        mlflow_client = MlflowClient()
+        try:
+            experiment_id = self._get_experiment_id(mlflow_client)
+        except DatasetError:
+            return False
+        runs = mlflow_client.search_runs(
+            experiment_ids=[experiment_id],
+            filter_string=self.filter_string,
+            max_results=1,
+        )
+        return len(runs) > 0
+
+    def _describe(self) -> dict[str, Any]:
+        """Describe MLflow experiment metrics dataset.
+
+        Returns:
+            dict[str, Any]: dictionary with MLflow experiment metrics dataset description.
+        """
+        return {
+            "experiment_name": self.experiment_name,
+            "filter_string": self.filter_string,
+            "metric_keys": self.metric_keys,
+            "load_args": self._load_args,
+        }
@@ -1,11 +1,18 @@
 from copy import deepcopy
 from typing import Any, Optional
 
+from mlflow.entities import Metric
 from mlflow.tracking import MlflowClient
+from mlflow.utils.time import get_current_time_millis
 
 from kedro_mlflow.io.metrics.mlflow_abstract_metric_dataset import (
     MlflowAbstractMetricDataset,
 )
+from kedro_mlflow.io.metrics.mlflow_metric_logger import (
+    _log_dataset_metrics,
+    _pending_dataset_metrics,
+)
+from kedro_mlflow.io.metrics.utils import load_metric_histories
 
 
 class MlflowMetricDataset(MlflowAbstractMetricDataset):
@@ -34,28 +41,24 @@ class MlflowMetricDataset(MlflowAbstractMetricDataset):
 
     def _load(self):
         self._validate_run_id()
-        mlflow_client = MlflowClient()
-        metric_history = mlflow_client.get_metric_history(
-            run_id=self.run_id, key=self.key
-        )  # gets active run if no run_id was given
+        metric_history = load_metric_histories(
+            run_id=self.run_id,
+            keys=[self.key],
+            file_store_fast_path=self._load_args.get("file_store_fast_path", False),
+        )[self.key]  # gets active run if no run_id was given
 
-        # the metric history is always a list of mlflow.entities.metric.Metric
         # we want the value of the last one stored because this dataset only deal with one single metric
         step = self._load_args.get("step")
 
         if step is None:
             # we take the last value recorded
-            metric_value = metric_history[-1].value
+            metric_value = metric_history.value[-1]
         else:
             # we should take the last historical value with the given step
             # (it is possible to have several values with the same step)
-            metric_value = next(
-                metric.value
-                for metric in reversed(metric_history)
-                if metric.step == step
-            )
+            metric_value = metric_history.value[metric_history.step == step][-1]
 
-        return metric_value
+        return float(metric_value)
 
     def _save(self, data: float):
         if self._logging_activated:
@@ -72,6 +75,9 @@ class MlflowMetricDataset(MlflowAbstractMetricDataset):
                 if self._exists()
                 else []
             )
+            # within a kedro run, the metric may also have been saved
+            # in the same node and not be flushed yet
+            metric_history += _pending_dataset_metrics(run_id=run_id, key=self.key)
 
             save_args = deepcopy(self._save_args)
             step = save_args.pop("step", None)
@@ -88,10 +94,18 @@ class MlflowMetricDataset(MlflowAbstractMetricDataset):
                         f"save_args['mode'] must be one of {self.SUPPORTED_SAVE_MODES}, got '{self.mode}' instead."
                     )
 
-            mlflow_client.log_metric(
+            # metrics are always sent with log_batch, possibly after the node ends
+            save_args.pop("synchronous", None)
+            timestamp = save_args.pop("timestamp", None) or get_current_time_millis()
+            _log_dataset_metrics(
                 run_id=run_id,
-                key=self.key,
-                value=data,
-                step=step,
-                **save_args,
+                metrics=[
+                    Metric(
+                        key=self.key,
+                        value=data,
+                        timestamp=timestamp,
+                        step=step,
+                        **save_args,
+                    )
+                ],
             )
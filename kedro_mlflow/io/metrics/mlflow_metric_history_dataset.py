@@ -1,10 +1,13 @@
 from typing import Any, Optional, Union
 
-from mlflow.tracking import MlflowClient
+from mlflow.entities import Metric
+from mlflow.utils.time import get_current_time_millis
 
 from kedro_mlflow.io.metrics.mlflow_abstract_metric_dataset import (
     MlflowAbstractMetricDataset,
 )
+from kedro_mlflow.io.metrics.mlflow_metric_logger import _log_dataset_metrics
+from kedro_mlflow.io.metrics.utils import load_metric_histories
 
 
 class MlflowMetricHistoryDataset(MlflowAbstractMetricDataset):
@@ -26,26 +29,29 @@ class MlflowMetricHistoryDataset(MlflowAbstractMetricDataset):
     def _load(self):
         self._validate_run_id()
         mode = self._load_args.get("mode", "list")
-        mlflow_client = MlflowClient()
 
-        metric_history = mlflow_client.get_metric_history(self.run_id, key=self.key)
+        metric_history = load_metric_histories(
+            run_id=self.run_id,
+            keys=[self.key],
+            file_store_fast_path=self._load_args.get("file_store_fast_path", False),
+        )[self.key]
 
         if mode == "list":
-            simplified_history = [metric.value for metric in metric_history]
+            simplified_history = metric_history.value.tolist()
         elif mode == "dict":
-            simplified_history = {
-                metric.step: metric.value for metric in metric_history
-            }
+            simplified_history = dict(
+                zip(metric_history.step.tolist(), metric_history.value.tolist())
+            )
         elif mode == "history":
             # history is a list of dict whom keys are "log_metric" arguments. The following is equivalent to dict mode:
             # [{"step": 0, "value": 0.1}, {"step": 1, "value": 0.2}, {"step": 2, "value": 0.3}]
             simplified_history = [
-                {
-                    "step": metric.step,
-                    "value": metric.value,
-                    "timestamp": metric.timestamp,
-                }
-                for metric in metric_history
+                {"step": step, "value": value, "timestamp": timestamp}
+                for step, value, timestamp in zip(
+                    metric_history.step.tolist(),
+                    metric_history.value.tolist(),
+                    metric_history.timestamp.tolist(),
+                )
             ]
         return simplified_history
 
@@ -58,23 +64,35 @@ class MlflowMetricHistoryDataset(MlflowAbstractMetricDataset):
             run_id = self.run_id
 
             mode = self._save_args.get("mode", "list")
-            mlflow_client = MlflowClient()
+            timestamp = get_current_time_millis()
             if mode == "list":
                 # list is a list of value in sequential order:
                 # [0.1,0.2,0.3]
-                for i, value in enumerate(data):
-                    mlflow_client.log_metric(
-                        run_id=run_id, key=self.key, step=i, value=value
-                    )
+                metrics = [
+                    Metric(key=self.key, value=value, timestamp=timestamp, step=i)
+                    for i, value in enumerate(data)
+                ]
             elif mode == "dict":
                 # dict is a {step: value} mapping:
                 # [{0: 0.1}, {1: 0.2}, {2: 0.3}]
-                for step, value in data.items():
-                    mlflow_client.log_metric(
-                        run_id=run_id, key=self.key, step=step, value=value
-                    )
+                metrics = [
+                    Metric(key=self.key, value=value, timestamp=timestamp, step=step)
+                    for step, value in data.items()
+                ]
             elif mode == "history":
                 # history is a list of dict whom keys are "log_metric" arguments. The following is equivalent to dict mode:
                 # [{"step": 0, "value": 0.1}, {"step": 1, "value": 0.2}, {"step": 2, "value": 0.3}]
-                for log_kwargs in data:
-                    mlflow_client.log_metric(run_id=run_id, key=self.key, **log_kwargs)
+                metrics = [
+                    Metric(
+                        key=self.key,
+                        value=log_kwargs["value"],
+                        timestamp=log_kwargs.get("timestamp") or timestamp,
+                        step=log_kwargs.get("step") or 0,
+                    )
+                    for log_kwargs in data
+                ]
+            else:
+                raise ValueError(
+                    f"save_args['mode'] must be one of {{'list', 'dict', 'history'}}, got '{mode}' instead."
+                )
+            _log_dataset_metrics(run_id=run_id, metrics=metrics)
@@ -0,0 +1,248 @@
+import time
+from collections import defaultdict
+from threading import Lock
+from typing import Optional, Union
+from weakref import WeakSet
+
+import mlflow
+from mlflow.entities import Metric
+from mlflow.tracking import MlflowClient
+from mlflow.utils.time import get_current_time_millis
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+# all the loggers alive in the process, so that the hook can flush them
+# at the end of each node without keeping them alive
+_METRIC_LOGGERS = WeakSet()
+
+
+class MlflowMetricLogger:
+    """Log metrics from inside a node while it is running.
+
+    The metrics are buffered in memory and sent to mlflow with ``log_batch``
+    when the buffer reaches ``max_buffer_size`` points or when
+    ``flush_interval`` seconds have passed since the last flush. Within a
+    kedro run, the ``MlflowHook`` flushes all the loggers at the end of each node.
+    """
+
+    def __init__(
+        self,
+        run_id: Optional[str] = None,
+        max_buffer_size: int = MAX_METRICS_PER_BATCH,
+        flush_interval: Optional[float] = 10.0,
+    ):
+        """Initialise MlflowMetricLogger.
+
+        Args:
+            run_id (str, optional): The ID of the mlflow run where the metrics
+                should be logged. Default to None, which logs in the active run
+                (i.e. the pipeline run within a kedro run).
+            max_buffer_size (int): The number of points which triggers a flush.
+                Default to the maximum number of metrics in a single mlflow batch.
+            flush_interval (float, optional): The number of seconds after which
+                the buffer is flushed when a new point is logged. If None,
+                the buffer is only flushed when it is full or when ``flush``
+                is called. Default to 10 seconds.
+        """
+        self.run_id = run_id
+        self.max_buffer_size = max_buffer_size
+        self.flush_interval = flush_interval
+        self._logging_activated = True  # by default, logging is activated!
+        self._buffer = defaultdict(list)
+        self._buffer_size = 0
+        self._last_steps = {}
+        self._last_flush_time = time.monotonic()
+        self._lock = Lock()
+        _METRIC_LOGGERS.add(self)
+
+    @property
+    def run_id(self) -> Union[str, None]:
+        """Get run id."""
+        run = mlflow.active_run()
+        if (self._run_id is None) and (run is not None):
+            # this is useful because during a kedro run, the hook
+            # reopens the pipeline run in each node
+            return run.info.run_id
+        return self._run_id
+
+    @run_id.setter
+    def run_id(self, run_id: str):
+        self._run_id = run_id
+
+    # we want to be able to turn logging off for an entire pipeline run
+    @property
+    def _logging_activated(self):
+        return self.__logging_activated
+
+    @_logging_activated.setter
+    def _logging_activated(self, flag):
+        if not isinstance(flag, bool):
+            raise ValueError(f"_logging_activated must be a boolean, got {type(flag)}")
+        self.__logging_activated = flag
+
+    def log(
+        self,
+        key: str,
+        value: float,
+        step: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """Buffer a metric point.
+
+        Args:
+            key (str): The name of the metric.
+            value (float): The value of the metric.
+            step (int, optional): The step of the metric. Default to None,
+                which uses the step following the last one logged by this
+                logger for this key (starting at 0).
+            timestamp (int, optional): The time of the point in milliseconds
+                since the epoch. Default to the current time.
+        """
+        if not self._logging_activated:
+            return
+
+        run_id = self.run_id
+        if run_id is None:
+            raise ValueError(
+                "You must either specify a run_id or have a mlflow active run opened. Use mlflow.start_run() if necessary."
+            )
+
+        with self._lock:
+            if step is None:
+                step = self._last_steps.get((run_id, key), -1) + 1
+            self._last_steps[(run_id, key)] = step
+
+        self._append(
+            run_id,
+            [
+                Metric(
+                    key=key,
+                    value=value,
+                    timestamp=timestamp or get_current_time_millis(),
+                    step=step,
+                )
+            ],
+        )
+
+    def _append(self, run_id: str, metrics: list[Metric]) -> None:
+        with self._lock:
+            self._buffer[run_id].extend(metrics)
+            self._buffer_size += len(metrics)
+            should_flush = self._buffer_size >= self.max_buffer_size or (
+                self.flush_interval is not None
+                and time.monotonic() - self._last_flush_time >= self.flush_interval
+            )
+
+        if should_flush:
+            self.flush()
+
+    def _pending_metrics(self, run_id: str, key: str) -> list[Metric]:
+        with self._lock:
+            return [metric for metric in self._buffer[run_id] if metric.key == key]
+
+    def log_metrics(
+        self,
+        metrics: dict[str, float],
+        step: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """Buffer several metrics at the same step.
+
+        Args:
+            metrics (dict[str, float]): A {key: value} mapping of metrics.
+            step (int, optional): The step of the metrics. See ``log``.
+            timestamp (int, optional): The time of the points. See ``log``.
+        """
+        timestamp = timestamp or get_current_time_millis()
+        for key, value in metrics.items():
+            self.log(key=key, value=value, step=step, timestamp=timestamp)
+
+    def flush(self) -> None:
+        """Send all the buffered points to mlflow."""
+        with self._lock:
+            buffer = self._buffer
+            self._buffer = defaultdict(list)
+            self._buffer_size = 0
+            self._last_flush_time = time.monotonic()
+
+        if not buffer:
+            return
+
+        mlflow_client = MlflowClient()
+        for run_id, metrics in buffer.items():
+            for start in range(0, len(metrics), MAX_METRICS_PER_BATCH):
+                mlflow_client.log_batch(
+                    run_id=run_id,
+                    metrics=metrics[start : start + MAX_METRICS_PER_BATCH],
+                )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+
+_default_metric_logger = None
+
+
+def get_metric_logger() -> MlflowMetricLogger:
+    """Get the metric logger shared by all the nodes of the process.
+
+    Within a kedro run, it logs in the pipeline run and it is flushed
+    by the ``MlflowHook`` at the end of each node.
+
+    Returns:
+        MlflowMetricLogger: The shared metric logger.
+    """
+    global _default_metric_logger
+    if _default_metric_logger is None:
+        _default_metric_logger = MlflowMetricLogger()
+    return _default_metric_logger
+
+
+# metric datasets write in the buffer of their run within a kedro run, so that all
+# the metrics saved by a node are sent with a single log_batch. The MlflowHook
+# buffers the metrics of its own run for the duration of the pipeline: the metrics
+# of the other runs, e.g. outside a kedro run, are logged right away.
+_DATASET_METRIC_BUFFERS = {}
+_DATASET_METRIC_BUFFERS_LOCK = Lock()
+
+
+def _start_dataset_metric_buffering(run_id: str) -> None:
+    with _DATASET_METRIC_BUFFERS_LOCK:
+        previous_buffer = _DATASET_METRIC_BUFFERS.get(run_id)
+        _DATASET_METRIC_BUFFERS[run_id] = MlflowMetricLogger(flush_interval=None)
+    if previous_buffer is not None:
+        # a previous pipeline of this run did not end through the hook
+        previous_buffer.flush()
+
+
+def _stop_dataset_metric_buffering(run_id: str) -> None:
+    with _DATASET_METRIC_BUFFERS_LOCK:
+        buffer = _DATASET_METRIC_BUFFERS.pop(run_id, None)
+    if buffer is not None:
+        buffer.flush()
+
+
+def _log_dataset_metrics(run_id: str, metrics: list[Metric]) -> None:
+    buffer = _DATASET_METRIC_BUFFERS.get(run_id)
+    if buffer is not None:
+        buffer._append(run_id, metrics)
+    else:
+        mlflow_client = MlflowClient()
+        for start in range(0, len(metrics), MAX_METRICS_PER_BATCH):
+            mlflow_client.log_batch(
+                run_id=run_id, metrics=metrics[start : start + MAX_METRICS_PER_BATCH]
+            )
+
+
+def _pending_dataset_metrics(run_id: str, key: str) -> list[Metric]:
+    buffer = _DATASET_METRIC_BUFFERS.get(run_id)
+    if buffer is not None:
+        return buffer._pending_metrics(run_id, key)
+    return []
+
+
+def _flush_metric_loggers() -> None:
+    for metric_logger in list(_METRIC_LOGGERS):
+        metric_logger.flush()
@@ -0,0 +1,219 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import DatasetError
+from mlflow.artifacts import download_artifacts
+from mlflow.entities import Metric
+from mlflow.tracking import MlflowClient
+from mlflow.utils.time import get_current_time_millis
+
+from kedro_mlflow.io.metrics.mlflow_abstract_metric_dataset import (
+    MlflowAbstractMetricDataset,
+)
+from kedro_mlflow.io.metrics.mlflow_metric_logger import _log_dataset_metrics
+
+MetricSeries = Union[
+    list[float], dict[int, float], list[dict[str, Union[float, int]]], pd.DataFrame
+]
+
+
+class MlflowMetricSeriesDataset(MlflowAbstractMetricDataset):
+    """Log a (very long) metric history as a columnar artifact.
+
+    The full series is stored as a Parquet or Arrow IPC file in the run
+    artifacts, and only its summary statistics (``<key>.min``, ``<key>.max``,
+    ``<key>.last`` and ``<key>.mean``) are logged as mlflow metrics.
+    """
+
+    SUPPORTED_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+    SUPPORTED_MODES = {"list", "dict", "history", "dataframe", "table"}
+    SUMMARY_STATISTICS = ("min", "max", "last", "mean")
+
+    def __init__(
+        self,
+        key: str = None,
+        run_id: str = None,
+        load_args: dict[str, Any] = None,
+        save_args: dict[str, Any] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ):
+        """Initialise MlflowMetricSeriesDataset.
+
+        Args:
+            key (str): The name of the metric. If None, the name of the dataset
+                in the catalog is used within a kedro run.
+            run_id (str): The ID of the mlflow run where the metric should be logged
+            load_args (dict[str, Any], optional): Options for loading:
+                - mode (str): the output format, one of "list", "dict", "history",
+                  "dataframe" or "table" (a ``pyarrow.Table``). Default to "list".
+            save_args (dict[str, Any], optional): Options for saving:
+                - mode (str): the input format, one of "list", "dict" or "history"
+                  (see ``MlflowMetricHistoryDataset``). A ``pandas.DataFrame`` with
+                  "step" and "value" columns is always accepted. Default to "list".
+                - format (str): either "parquet" or "arrow" (Arrow IPC). Default to "parquet".
+                - compression (str): the compression codec. Default to "zstd" for parquet
+                  and None for arrow, which enables zero-copy memory-mapped reads.
+                - artifact_path (str): the folder of the artifact in the run. Default to "metrics".
+            metadata: Any arbitrary metadata.
+                This is ignored by Kedro, but may be consumed by users or external plugins.
+        """
+        super().__init__(key, run_id, load_args, save_args, metadata)
+
+        self.format = self._save_args.get("format", "parquet")
+        if self.format not in self.SUPPORTED_FORMATS:
+            raise DatasetError(
+                f"save_args['format'] must be one of {set(self.SUPPORTED_FORMATS)}, got '{self.format}' instead."
+            )
+        self.compression = self._save_args.get(
+            "compression", "zstd" if self.format == "parquet" else None
+        )
+        self.artifact_path = self._save_args.get("artifact_path", "metrics")
+
+    @property
+    def _artifact_file_path(self) -> str:
+        filename = f"{self.key}{self.SUPPORTED_FORMATS[self.format]}"
+        return (
+            (Path(self.artifact_path) / filename).as_posix()
+            if self.artifact_path
+            else filename
+        )
+
+    def _to_table(self, data: MetricSeries) -> pa.Table:
+        if isinstance(data, pd.DataFrame):
+            return pa.Table.from_pandas(data, preserve_index=False)
+
+        mode = self._save_args.get("mode", "list")
+        if mode == "list":
+            # [0.1,0.2,0.3]
+            values = np.asarray(data, dtype=np.float64)
+            return pa.table(
+                {"step": np.arange(len(values), dtype=np.int64), "value": values}
+            )
+        elif mode == "dict":
+            # {0: 0.1, 1: 0.2, 2: 0.3}
+            return pa.table(
+                {
+                    "step": np.fromiter(data.keys(), dtype=np.int64, count=len(data)),
+                    "value": np.fromiter(
+                        data.values(), dtype=np.float64, count=len(data)
+                    ),
+                }
+            )
+        elif mode == "history":
+            # [{"step": 0, "value": 0.1}, {"step": 1, "value": 0.2}]
+            return pa.Table.from_pylist(data)
+        raise DatasetError(
+            f"save_args['mode'] must be one of {{'list', 'dict', 'history'}}, got '{mode}' instead."
+        )
+
+    def _save(self, data: MetricSeries) -> None:
+        if self._logging_activated:
+            self._validate_run_id()
+            run_id = self.run_id
+
+            table = self._to_table(data)
+            if table.num_rows == 0:
+                raise DatasetError(
+                    f"Cannot save an empty series for metric '{self.key}'"
+                )
+
+            with TemporaryDirectory() as tmp_dir:
+                local_path = Path(tmp_dir) / Path(self._artifact_file_path).name
+                if self.format == "parquet":
+                    pq.write_table(table, local_path, compression=self.compression)
+                else:
+                    options = pa.ipc.IpcWriteOptions(compression=self.compression)
+                    with pa.OSFile(local_path.as_posix(), "wb") as sink:
+                        with pa.ipc.new_file(
+                            sink, table.schema, options=options
+                        ) as writer:
+                            writer.write_table(table)
+
+                mlflow_client = MlflowClient()
+                mlflow_client.log_artifact(
+                    run_id=run_id,
+                    local_path=local_path.as_posix(),
+                    artifact_path=self.artifact_path,
+                )
+
+            # only a few summary points are stored in the metric store
+            values = table.column("value").to_numpy()
+            summary = {
+                "min": float(np.min(values)),
+                "max": float(np.max(values)),
+                "last": float(values[-1]),
+                "mean": float(np.mean(values)),
+            }
+            timestamp = get_current_time_millis()
+            _log_dataset_metrics(
+                run_id=run_id,
+                metrics=[
+                    Metric(
+                        key=f"{self.key}.{statistic}",
+                        value=summary[statistic],
+                        timestamp=timestamp,
+                        step=0,
+                    )
+                    for statistic in self.SUMMARY_STATISTICS
+                ],
+            )
+
+    def _load(self) -> Union[MetricSeries, pa.Table]:
+        self._validate_run_id()
+        local_path = download_artifacts(
+            run_id=self.run_id, artifact_path=self._artifact_file_path
+        )
+
+        # memory mapping avoids reading the whole file in memory before decoding
+        if self.format == "parquet":
+            table = pq.read_table(local_path, memory_map=True)
+        else:
+            # the memory map must stay open as long as the table references it
+            table = pa.ipc.open_file(pa.memory_map(local_path, "r")).read_all()
+
+        mode = self._load_args.get("mode", "list")
+        if mode == "list":
+            return table.column("value").to_pylist()
+        elif mode == "dict":
+            return dict(
+                zip(table.column("step").to_pylist(), table.column("value").to_pylist())
+            )
+        elif mode == "history":
+            return table.to_pylist()
+        elif mode == "dataframe":
+            return table.to_pandas()
+        elif mode == "table":
+            return table
+        raise DatasetError(
+            f"load_args['mode'] must be one of {self.SUPPORTED_MODES}, got '{mode}' instead."
+        )
+
+    def _exists(self) -> bool:
+        """Check if the summary of the metric exists in the mlflow run.
+
+        Returns:
+            bool: Does the metric series exist in the given run_id?
+        """
+        run_id = self.run_id
+        if run_id is None:
+            return False
+        run = MlflowClient().get_run(run_id)
+        return f"{self.key}.last" in run.data.metrics.keys()
+
+    def _describe(self) -> dict[str, Any]:
+        """Describe MLflow metric series dataset.
+
+        Returns:
+            dict[str, Any]: dictionary with MLflow metric series dataset description.
+        """
+        return {
+            "key": self.key,
+            "run_id": self.run_id,
+            "format": self.format,
+            "artifact_path": self.artifact_path,
+        }
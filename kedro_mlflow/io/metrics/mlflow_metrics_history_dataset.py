@@ -1,10 +1,13 @@
-from functools import partial
 from itertools import chain
 from typing import Any, Generator, Optional, Tuple, Union
 
 import mlflow
 from kedro.io import AbstractDataset, DatasetError
+from mlflow.entities import Metric
 from mlflow.tracking import MlflowClient
+from mlflow.utils.time import get_current_time_millis
+
+from kedro_mlflow.io.metrics.mlflow_metric_logger import _log_dataset_metrics
 
 MetricItem = Union[dict[str, float], list[dict[str, float]]]
 MetricTuple = Tuple[str, float, int]
@@ -95,25 +98,29 @@ class MlflowMetricsHistoryDataset(AbstractDataset):
         Args:
             data (Metricsdict): MLflow metrics dataset.
         """
-        client = MlflowClient()
         try:
             run_id = self.run_id
         except DatasetError:
             # If run_id can't be found log_metric would create new run.
             run_id = None
 
-        log_metric = (
-            partial(client.log_metric, run_id)
-            if run_id is not None
-            else mlflow.log_metric
-        )
         metrics = (
             self._build_args_list_from_metric_item(k, v) for k, v in data.items()
         )
 
         if self._logging_activated:
-            for k, v, i in chain.from_iterable(metrics):
-                log_metric(k, v, step=i)
+            if run_id is None:
+                for k, v, i in chain.from_iterable(metrics):
+                    mlflow.log_metric(k, v, step=i)
+            else:
+                timestamp = get_current_time_millis()
+                _log_dataset_metrics(
+                    run_id=run_id,
+                    metrics=[
+                        Metric(key=k, value=v, timestamp=timestamp, step=i)
+                        for k, v, i in chain.from_iterable(metrics)
+                    ],
+                )
 
     def _exists(self) -> bool:
         """Check if MLflow metrics dataset exists.
@@ -0,0 +1,121 @@
+import warnings
+from pathlib import Path
+from typing import NamedTuple, Optional
+from urllib.parse import urlparse
+
+import mlflow
+import numpy as np
+from mlflow.tracking import MlflowClient
+from mlflow.utils.file_utils import local_file_uri_to_path
+
+
+class MetricHistory(NamedTuple):
+    """The history of a metric as arrays, in the order it was logged."""
+
+    timestamp: np.ndarray
+    value: np.ndarray
+    step: np.ndarray
+
+
+def load_metric_histories(
+    run_id: str,
+    keys: Optional[list[str]] = None,
+    file_store_fast_path: bool = False,
+) -> dict[str, MetricHistory]:
+    """Load the histories of several metrics of a run.
+
+    Args:
+        run_id (str): The ID of the mlflow run.
+        keys (Optional[list[str]]): The metrics to load. If None, all the metrics of the run are loaded.
+        file_store_fast_path (bool): If True and the tracking uri is a local
+            file store (e.g. the default "mlruns" folder), the metric files of
+            the run are parsed directly instead of going through the MlflowClient.
+            It falls back to the MlflowClient for any other tracking uri. Default to False.
+
+    Returns:
+        dict[str, MetricHistory]: A {key: history} mapping. A key which
+            has never been logged has an empty history.
+    """
+    if file_store_fast_path:
+        metrics_dir = _find_file_store_metrics_dir(mlflow.get_tracking_uri(), run_id)
+        if metrics_dir is not None:
+            if keys is None:
+                keys = [
+                    path.relative_to(metrics_dir).as_posix()
+                    for path in metrics_dir.rglob("*")
+                    if path.is_file()
+                ]
+            return {key: _read_metric_file(metrics_dir / key) for key in keys}
+
+    mlflow_client = MlflowClient()
+    if keys is None:
+        keys = list(mlflow_client.get_run(run_id).data.metrics.keys())
+    histories = {}
+    for key in keys:
+        metrics = mlflow_client.get_metric_history(run_id, key)
+        histories[key] = MetricHistory(
+            timestamp=np.array(
+                [metric.timestamp for metric in metrics], dtype=np.int64
+            ),
+            value=np.array([metric.value for metric in metrics], dtype=np.float64),
+            step=np.array([metric.step for metric in metrics], dtype=np.int64),
+        )
+    return histories
+
+
+def _find_file_store_metrics_dir(tracking_uri: str, run_id: str) -> Optional[Path]:
+    # the file store layout is <root>/<experiment_id>/<run_id>/metrics/<key>
+    scheme = urlparse(tracking_uri).scheme
+    # a single letter scheme is a windows drive, which is a valid local path
+    if scheme not in ("", "file") and not (len(scheme) == 1 and scheme.isalpha()):
+        return None
+    root = Path(local_file_uri_to_path(tracking_uri))
+    if not root.is_dir():
+        return None
+    for experiment_dir in (*root.iterdir(), *(root / ".trash").glob("*")):
+        run_dir = experiment_dir / run_id
+        if (run_dir / "meta.yaml").is_file():
+            return run_dir / "metrics"
+    return None
+
+
+def _read_metric_file(path: Path) -> MetricHistory:
+    if not path.is_file():
+        return MetricHistory(
+            timestamp=np.array([], dtype=np.int64),
+            value=np.array([], dtype=np.float64),
+            step=np.array([], dtype=np.int64),
+        )
+
+    content = path.read_text()
+    nb_lines = len(content.splitlines())
+    # the vast majority of files have "<timestamp> <value> <step>" lines,
+    # which can be parsed in bulk. Other formats are parsed line by line.
+    try:
+        with warnings.catch_warnings():
+            # depending on its version, numpy warns or raises
+            # when it stops parsing at a non numeric field
+            warnings.simplefilter("ignore", DeprecationWarning)
+            parsed = np.fromstring(content, sep=" ") if content else np.array([])
+    except ValueError:
+        parsed = None
+    if parsed is not None and parsed.size == 3 * nb_lines:
+        parsed = parsed.reshape(nb_lines, 3)
+        return MetricHistory(
+            timestamp=parsed[:, 0].astype(np.int64),
+            value=parsed[:, 1],
+            step=parsed[:, 2].astype(np.int64),
+        )
+
+    timestamps, values, steps = [], [], []
+    for line in content.splitlines():
+        parts = line.strip().split(" ")
+        timestamps.append(int(parts[0]))
+        values.append(float(parts[1]))
+        # legacy lines have no step, and dataset lines have 5 fields
+        steps.append(int(parts[2]) if len(parts) >= 3 else 0)  # noqa: PLR2004
+    return MetricHistory(
+        timestamp=np.array(timestamps, dtype=np.int64),
+        value=np.array(values, dtype=np.float64),
+        step=np.array(steps, dtype=np.int64),
+    )
@@ -1,11 +1,27 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from importlib import import_module
 from importlib.util import find_spec
 from pathlib import Path
+from threading import Lock
 from typing import Any, Optional
 
 from kedro.io import AbstractVersionedDataset, Version
 from kedro.io.core import DatasetError
 
+from kedro_mlflow.io.models.model_benchmark import benchmark_model
+from kedro_mlflow.io.models.model_cache import (
+    fetch_model,
+    load_memory_mapped_model,
+    load_model_in_memory_cache,
+    resolve_model_uri,
+)
+
+# the flavor modules are imported once per process: the datasets only store
+# the name of their flavor, and get the module from this cache
+_FLAVOR_MODULES: dict[str, Future] = {}
+_FLAVOR_MODULES_LOCK = Lock()
+_flavor_import_executor = None
+
 
 class MlflowAbstractModelDataSet(AbstractVersionedDataset):
     """
@@ -21,6 +37,7 @@ class MlflowAbstractModelDataSet(AbstractVersionedDataset):
         save_args: dict[str, Any] = None,
         version: Version = None,
         metadata: Optional[dict[str, Any]] = None,
+        background_import: bool = False,
     ) -> None:
         """Initialize the Kedro MlflowAbstractModelDataSet.
 
@@ -42,6 +59,9 @@ class MlflowAbstractModelDataSet(AbstractVersionedDataset):
             version (Version, optional): Specific version to load.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
+            background_import (bool, optional): Import the flavor module in a
+                background thread instead of when the dataset is created.
+                Default to False.
 
         Raises:
             DatasetError: When passed `flavor` does not exist.
@@ -64,11 +84,15 @@ class MlflowAbstractModelDataSet(AbstractVersionedDataset):
             )
 
         self._load_args = load_args or {}
-        self._save_args = save_args or {}
+        # the benchmark_args are popped from the save_args by the child datasets
+        self._save_args = {**save_args} if save_args else {}
         self.metadata = metadata
 
         try:
-            self._mlflow_model_module
+            if background_import:
+                self._import_module_in_background(self._flavor)
+            else:
+                self._mlflow_model_module
         except ImportError as err:
             raise DatasetError(err)
 
@@ -115,13 +139,101 @@ class MlflowAbstractModelDataSet(AbstractVersionedDataset):
     #             parsed_kargs[key] = value
     #     return parsed_kargs
 
+    def _load_model(self, model_uri: str) -> Any:
+        model_cache = getattr(self, "_model_cache", None)
+        memory_cache = getattr(self, "_memory_cache", False)
+        resolve_ttl = getattr(self, "_resolve_ttl", None)
+        if memory_cache or model_cache is not None or resolve_ttl:
+            # the caches are keyed by version, not by a stage or an alias
+            model_uri = resolve_model_uri(model_uri, ttl=resolve_ttl)
+
+        def _load_from_uri(local_uri: str) -> Any:
+            return self._mlflow_model_module.load_model(
+                model_uri=local_uri, **self._load_args
+            )
+
+        def _load():
+            if getattr(self, "_mmap", False):
+                return load_memory_mapped_model(
+                    model_uri,
+                    model_cache,
+                    self._flavor,
+                    self._load_args,
+                    _load_from_uri,
+                )
+            # the model is read from the local cache when the dataset has one
+            if model_cache is not None:
+                return _load_from_uri(fetch_model(model_uri, model_cache))
+            return _load_from_uri(model_uri)
+
+        if memory_cache:
+            return load_model_in_memory_cache(
+                model_uri, self._flavor, self._load_args, _load
+            )
+        return _load()
+
+    def _benchmark(self, model_path: Path) -> Optional[dict[str, float]]:
+        """Measure how fast the model saved in a local folder loads and predicts,
+        with the ``benchmark_args`` of the dataset.
+
+        A model which cannot be benchmarked is still saved: the error is logged
+        as a warning and None is returned.
+        """
+        try:
+            return benchmark_model(
+                load=lambda: self._mlflow_model_module.load_model(
+                    model_uri=model_path.as_uri(), **self._load_args
+                ),
+                model_path=model_path,
+                **self._benchmark_args,
+            )
+        except Exception as err:
+            self._logger.warning(
+                f"The model saved at '{model_path}' could not be benchmarked: {err!r}"
+            )
+            return None
+
     @staticmethod
     def _import_module(import_path: str) -> Any:
+        with _FLAVOR_MODULES_LOCK:
+            future = _FLAVOR_MODULES.get(import_path)
+        if future is None:
+            MlflowAbstractModelDataSet._check_module_exists(import_path)
+            module = import_module(import_path)
+            future = Future()
+            future.set_result(module)
+            with _FLAVOR_MODULES_LOCK:
+                _FLAVOR_MODULES.setdefault(import_path, future)
+            return module
+        try:
+            return future.result()
+        except BaseException:
+            # a failed import is retried at the next access
+            with _FLAVOR_MODULES_LOCK:
+                if _FLAVOR_MODULES.get(import_path) is future:
+                    del _FLAVOR_MODULES[import_path]
+            raise
+
+    @staticmethod
+    def _import_module_in_background(import_path: str) -> None:
+        global _flavor_import_executor
+        with _FLAVOR_MODULES_LOCK:
+            if import_path in _FLAVOR_MODULES:
+                return
+            MlflowAbstractModelDataSet._check_module_exists(import_path)
+            if _flavor_import_executor is None:
+                _flavor_import_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="kedro_mlflow_import"
+                )
+            _FLAVOR_MODULES[import_path] = _flavor_import_executor.submit(
+                import_module, import_path
+            )
+
+    @staticmethod
+    def _check_module_exists(import_path: str) -> None:
         exists = find_spec(import_path)
 
         if not exists:
             raise ImportError(
                 f"'{import_path}' module not found. Check valid flavor in mlflow documentation: https://www.mlflow.org/docs/latest/python_api/index.html"
             )
-
-        return import_module(import_path)
@@ -1,12 +1,26 @@
+import hashlib
+import json
+import os
 import shutil
+import tempfile
 from os.path import exists
+from pathlib import Path
 from typing import Any, Optional
 
+import yaml
 from kedro.io import Version
 
 from kedro_mlflow.io.models.mlflow_abstract_model_dataset import (
     MlflowAbstractModelDataSet,
 )
+from kedro_mlflow.io.models.model_benchmark import pop_benchmark_args
+
+# the file where the benchmark of the model is written, in the model folder
+BENCHMARK_FILE_NAME = "benchmark.json"
+
+# the serialization formats of mlflow.sklearn which never save the same model
+# twice identically (None is the default format, i.e. "skops")
+_NON_DETERMINISTIC_SKLEARN_FORMATS = (None, "skops")
 
 
 class MlflowModelLocalFileSystemDataset(MlflowAbstractModelDataSet):
@@ -22,6 +36,8 @@ class MlflowModelLocalFileSystemDataset(MlflowAbstractModelDataSet):
         log_args: dict[str, Any] = None,
         version: Version = None,
         metadata: Optional[dict[str, Any]] = None,
+        fingerprint: bool = False,
+        background_import: bool = False,
     ) -> None:
         """Initialize the Kedro MlflowModelDataSet.
 
@@ -39,10 +55,20 @@ class MlflowModelLocalFileSystemDataset(MlflowAbstractModelDataSet):
             load_args (dict[str, Any], optional): Arguments to `load_model`
                 function from specified `flavor`. Defaults to None.
             save_args (dict[str, Any], optional): Arguments to `save_model`
-                function from specified `flavor`. Defaults to None.
+                function from specified `flavor`. Defaults to None. It can contain
+                'benchmark_args' with 'input_example', 'warmup' and 'repeat' keys
+                to measure how fast the saved model loads and predicts.
             version (Version, optional): Kedro version to use. Defaults to None.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
+            fingerprint (bool, optional): Keep the existing model, its files and their
+                modification times when the new model has the same content. The creation
+                time and the uuid of the model are ignored. It is ignored with the
+                "skops" serialization format of "mlflow.sklearn", which is never
+                identical. Defaults to False.
+            background_import (bool, optional): Import the flavor module in a
+                background thread instead of when the dataset is created.
+                Default to False.
 
         Raises:
             DatasetError: When passed `flavor` does not exist.
@@ -55,7 +81,20 @@ class MlflowModelLocalFileSystemDataset(MlflowAbstractModelDataSet):
             save_args=save_args,
             version=version,
             metadata=metadata,
+            background_import=background_import,
         )
+        if (
+            fingerprint
+            and flavor == "mlflow.sklearn"
+            and self._save_args.get("serialization_format")
+            in _NON_DETERMINISTIC_SKLEARN_FORMATS
+        ):
+            self._logger.warning(
+                "'fingerprint' is ignored with the 'skops' serialization format of 'mlflow.sklearn', which stores the ids of the objects: the same model is never identical to the saved one. Set 'serialization_format' to 'cloudpickle' or 'pickle' in 'save_args' to keep unchanged models."
+            )
+            fingerprint = False
+        self._fingerprint = fingerprint
+        self._benchmark_args = pop_benchmark_args(self._save_args)
 
     def _load(self) -> Any:
         """Loads an MLflow model from local path or from MLflow run.
@@ -73,22 +112,58 @@ class MlflowModelLocalFileSystemDataset(MlflowAbstractModelDataSet):
         Args:
             model (Any): A model object supported by the given MLflow flavor.
         """
-        save_path = self._get_save_path()
-        # In case of an unversioned model we need to remove the save path
-        # because MLflow cannot overwrite the target directory.
-        if exists(save_path):
-            shutil.rmtree(save_path)
-
-        if self._flavor == "mlflow.pyfunc":
-            # PyFunc models utilise either `python_model` or `loader_module`
-            # workflow. We we assign the passed `model` object to one of those keys
-            # depending on the chosen `pyfunc_workflow`.
-            self._save_args[self._pyfunc_workflow] = model
-            self._mlflow_model_module.save_model(save_path, **self._save_args)
-        else:
-            # Otherwise we save using the common workflow where first argument is the
-            # model object and second is the path.
-            self._mlflow_model_module.save_model(model, save_path, **self._save_args)
+        save_path = Path(self._get_save_path())
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        # the model is saved in a sibling folder and moved in place once it is
+        # complete, so that a failed save does not remove the previous model
+        tmp_dir = Path(
+            tempfile.mkdtemp(dir=save_path.parent, prefix=f".{save_path.name}.")
+        )
+        tmp_path = tmp_dir / "model"
+        try:
+            if self._flavor == "mlflow.pyfunc":
+                # PyFunc models utilise either `python_model` or `loader_module`
+                # workflow. We we assign the passed `model` object to one of those keys
+                # depending on the chosen `pyfunc_workflow`.
+                self._save_args[self._pyfunc_workflow] = model
+                self._mlflow_model_module.save_model(tmp_path, **self._save_args)
+            else:
+                # Otherwise we save using the common workflow where first argument is the
+                # model object and second is the path.
+                self._mlflow_model_module.save_model(model, tmp_path, **self._save_args)
+
+            if (
+                exists(save_path)
+                and self._fingerprint
+                and _fingerprint_model(tmp_path) == _fingerprint_model(save_path)
+            ):
+                self._logger.info(
+                    f"The model at '{save_path}' is unchanged, it is not rewritten."
+                )
+                return
+
+            benchmark = (
+                self._benchmark(tmp_path) if self._benchmark_args is not None else None
+            )
+            if benchmark is not None:
+                (tmp_path / BENCHMARK_FILE_NAME).write_text(
+                    json.dumps(benchmark, indent=2)
+                )
+            if not exists(save_path):
+                os.rename(tmp_path, save_path)
+            else:
+                # MLflow cannot overwrite the target directory, and a folder cannot
+                # replace another one atomically: the previous model is moved aside
+                # and removed only once the new one is in place
+                previous_path = tmp_dir / "previous_model"
+                os.rename(save_path, previous_path)
+                try:
+                    os.rename(tmp_path, save_path)
+                except OSError:
+                    os.rename(previous_path, save_path)
+                    raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
     def _describe(self) -> dict[str, Any]:
         return dict(
@@ -98,4 +173,32 @@ class MlflowModelLocalFileSystemDataset(MlflowAbstractModelDataSet):
             load_args=self._load_args,
             save_args=self._save_args,
             version=self._version,
+            fingerprint=self._fingerprint,
         )
+
+
+# these fields of the MLmodel file change each time a model is saved
+_VOLATILE_MLMODEL_FIELDS = ("utc_time_created", "model_uuid")
+
+
+def _fingerprint_model(model_dir: Path) -> str:
+    """Hash the files of a saved model, except the fields of the MLmodel file
+    which change each time the model is saved."""
+    digest = hashlib.sha256()
+    for path in sorted(model_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        relative_path = path.relative_to(model_dir).as_posix()
+        if relative_path == BENCHMARK_FILE_NAME:
+            # the timings change each time the model is saved
+            continue
+        if relative_path == "MLmodel":
+            mlmodel = yaml.safe_load(path.read_text())
+            for field in _VOLATILE_MLMODEL_FIELDS:
+                mlmodel.pop(field, None)
+            content = yaml.safe_dump(mlmodel, sort_keys=True).encode()
+        else:
+            content = path.read_bytes()
+        digest.update(relative_path.encode() + b"\0")
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
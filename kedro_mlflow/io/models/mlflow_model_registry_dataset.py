@@ -6,6 +6,7 @@ from kedro.io.core import DatasetError
 from kedro_mlflow.io.models.mlflow_abstract_model_dataset import (
     MlflowAbstractModelDataSet,
 )
+from kedro_mlflow.io.models.model_cache import fetch_model, get_model_cache
 
 
 class MlflowModelRegistryDataset(MlflowAbstractModelDataSet):
@@ -20,6 +21,11 @@ class MlflowModelRegistryDataset(MlflowAbstractModelDataSet):
         pyfunc_workflow: Optional[str] = "python_model",
         load_args: Optional[dict[str, Any]] = None,
         metadata: Optional[dict[str, Any]] = None,
+        download_cache: Union[bool, dict[str, Any]] = False,
+        memory_cache: bool = False,
+        mmap: bool = False,
+        resolve_ttl: Optional[float] = None,
+        background_import: bool = False,
     ) -> None:
         """Initialize the Kedro MlflowModelRegistryDataset.
 
@@ -40,6 +46,23 @@ class MlflowModelRegistryDataset(MlflowAbstractModelDataSet):
                 function from specified `flavor`. Defaults to None.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
+            download_cache (Union[bool, dict[str, Any]], optional): Download each version
+                of the model once in a local cache, which can be configured with a dict
+                with "dir" and "max_size" (in bytes) keys. Default to False.
+            memory_cache (bool, optional): Keep the loaded model in memory, so that
+                all the loads of the same version in the process share the same object.
+                Default to False.
+            mmap (bool, optional): Memory-map the arrays of the model (e.g. the numpy
+                arrays of a scikit-learn model) from the local cache in read-only mode,
+                so that the processes which load the same version share their memory.
+                It requires 'download_cache' and joblib. Default to False.
+            resolve_ttl (Optional[float], optional): Resolve the stage or alias to
+                a version through the registry, and reuse this version during
+                ``resolve_ttl`` seconds. Default to None, which lets mlflow resolve
+                it at each load (or resolves it at each load when a cache is used).
+            background_import (bool, optional): Import the flavor module in a
+                background thread instead of when the dataset is created.
+                Default to False.
 
         Raises:
             DatasetError: When passed `flavor` does not exist.
@@ -52,6 +75,7 @@ class MlflowModelRegistryDataset(MlflowAbstractModelDataSet):
             save_args={},
             version=None,
             metadata=metadata,
+            background_import=background_import,
         )
 
         if alias is None and stage_or_version is None:
@@ -71,6 +95,14 @@ class MlflowModelRegistryDataset(MlflowAbstractModelDataSet):
             if alias
             else f"models:/{model_name}/{stage_or_version}"
         )
+        self._model_cache = get_model_cache(download_cache)
+        self._memory_cache = memory_cache
+        if mmap and self._model_cache is None:
+            raise DatasetError(
+                "'mmap' requires a 'download_cache' to memory-map the model from."
+            )
+        self._mmap = mmap
+        self._resolve_ttl = resolve_ttl
 
     @property
     def _logger(self) -> Logger:
@@ -86,9 +118,7 @@ class MlflowModelRegistryDataset(MlflowAbstractModelDataSet):
         # If `run_id` is specified, pull the model from MLflow.
         # TODO: enable loading from another mlflow conf (with a client with another tracking uri)
         # Alternatively, use local path to load the model.
-        model = self._mlflow_model_module.load_model(
-            model_uri=self.model_uri, **self._load_args
-        )
+        model = self._load_model(self.model_uri)
 
         # log some info because "latest" model is not very informative
         # the model itself does not have information about its registry
@@ -102,6 +132,17 @@ class MlflowModelRegistryDataset(MlflowAbstractModelDataSet):
             self._logger.info(f"Loading model from run_id='{model.metadata.run_id}'")
         return model
 
+    def prefetch(self) -> bool:
+        """Download the model in the local cache, so that it is ready when the dataset is loaded.
+
+        Returns:
+            bool: Was the model prefetched? It requires 'download_cache'.
+        """
+        if self._model_cache is None:
+            return False
+        fetch_model(self.model_uri, self._model_cache, resolve_ttl=self._resolve_ttl)
+        return True
+
     def _save(self, model: Any) -> None:
         raise NotImplementedError(
             "The 'save' method is not implemented for MlflowModelRegistryDataset. You can pass 'registered_model_name' argument in 'MLflowModelTrackingDataset(..., save_args={registered_model_name='my_model'}' to save and register a model in the same step. "
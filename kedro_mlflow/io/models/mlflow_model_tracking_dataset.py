@@ -1,11 +1,28 @@
-from typing import Any, Optional
+import inspect
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
 
 import mlflow
 from kedro.io.core import DatasetError
+from mlflow.entities import Metric
+from mlflow.models import Model
+from mlflow.tracking import MlflowClient
+from mlflow.utils.time import get_current_time_millis
 
+from kedro_mlflow.io.artifacts.artifact_uploader import submit_artifact_upload
 from kedro_mlflow.io.models.mlflow_abstract_model_dataset import (
     MlflowAbstractModelDataSet,
 )
+from kedro_mlflow.io.models.model_benchmark import pop_benchmark_args
+from kedro_mlflow.io.models.model_cache import fetch_model, get_model_cache
+
+# the arguments of log_model which describe the LoggedModel itself
+_LOGGED_MODEL_ARGS = ("name", "params", "tags", "model_type")
+# the fields of the MLmodel file which identify the logged model
+_LOGGED_MODEL_FIELDS = ("artifact_path", "model_uuid", "model_id", "run_id")
 
 
 class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
@@ -18,6 +35,11 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
         load_args: Optional[dict[str, Any]] = None,
         save_args: Optional[dict[str, Any]] = None,
         metadata: Optional[dict[str, Any]] = None,
+        download_cache: Union[bool, dict[str, Any]] = False,
+        memory_cache: bool = False,
+        mmap: bool = False,
+        async_upload: bool = False,
+        background_import: bool = False,
     ) -> None:
         """Initialize the Kedro MlflowModelDataSet.
 
@@ -35,8 +57,25 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
                 function from specified `flavor`, see mlflow documentation. Defaults to None.
             save_args (dict[str, Any], optional): Arguments to `log_model`
                 function from specified `flavor`, see mlflow documentation. Default to None, it is recommended to specify 'name'.
+                It can contain 'benchmark_args' with 'input_example', 'warmup' and 'repeat'
+                keys to log how fast the logged model loads and predicts as metrics.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
+            download_cache (Union[bool, dict[str, Any]], optional): Download the model
+                once in a local cache, which can be configured with a dict with "dir"
+                and "max_size" (in bytes) keys. Default to False.
+            memory_cache (bool, optional): Keep the loaded model in memory, so that
+                all the loads of the same model in the process share the same object.
+                Default to False.
+            mmap (bool, optional): Memory-map the arrays of the model (e.g. the numpy
+                arrays of a scikit-learn model) from the local cache in read-only mode,
+                so that the processes which load the same model share their memory.
+                It requires 'download_cache' and joblib. Default to False.
+            async_upload (bool, optional): Serialize the model in a local folder, and
+                log it to mlflow in the background. Default to False.
+            background_import (bool, optional): Import the flavor module in a
+                background thread instead of when the dataset is created.
+                Default to False.
 
         Raises:
             DatasetError: When passed `flavor` does not exist.
@@ -49,6 +88,7 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
             save_args=save_args,
             version=None,
             metadata=metadata,
+            background_import=background_import,
         )
 
         if self._save_args.get("name") is None:
@@ -59,8 +99,18 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
         # but if the user specified a model_uri when instantiating the class we should not override it
         # we keep track of both to choose the right one when loading
         self._user_defined_model_uri = self._load_args.pop("model_uri", None)
+        self._benchmark_args = pop_benchmark_args(self._save_args)
         self._last_saved_model_uri = None
         self.model_info = None
+        self._model_cache = get_model_cache(download_cache)
+        self._memory_cache = memory_cache
+        if mmap and self._model_cache is None:
+            raise DatasetError(
+                "'mmap' requires a 'download_cache' to memory-map the model from."
+            )
+        self._mmap = mmap
+        self.async_upload = async_upload
+        self._pending_upload = None
 
     # create an attribute model_uri which will store the model uri of the last saved model
     @property
@@ -82,10 +132,23 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
         Returns:
             LoggedModel: Deserialized model.
         """
+        if self._pending_upload is not None:
+            # the model is loaded once it is logged, and an upload error is raised here
+            self._pending_upload.result()
 
-        return self._mlflow_model_module.load_model(
-            model_uri=self.model_uri, **self._load_args
-        )
+        return self._load_model(self.model_uri)
+
+    def prefetch(self) -> bool:
+        """Download the model specified by 'model_uri' in the local cache, so that
+        it is ready when the dataset is loaded.
+
+        Returns:
+            bool: Was the model prefetched? It requires 'download_cache'.
+        """
+        if self._model_cache is None or self._user_defined_model_uri is None:
+            return False
+        fetch_model(self._user_defined_model_uri, self._model_cache)
+        return True
 
     def _save(self, model: Any) -> None:
         """Save a model to local path and then logs it to MLflow.
@@ -100,6 +163,9 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
                     "Because mlflow does not let you override an existing model."
                     "You should specify 'model_uri' only for loading an existing model."
                 )
+            if self.async_upload:
+                self._save_in_background(model)
+                return
             if self._flavor == "mlflow.pyfunc":
                 # PyFunc models uses either `python_model` or `loader_module`
                 # workflow. We assign the passed `model` object to one of those keys
@@ -120,6 +186,88 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
             # keep track of the last saved model uri for later loading
             self._last_saved_model_uri = self.model_info.model_uri
 
+            if self._benchmark_args is not None:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    model_path = mlflow.artifacts.download_artifacts(
+                        artifact_uri=self.model_info.model_uri, dst_path=tmp_dir
+                    )
+                    benchmark = self._benchmark(Path(model_path))
+                if benchmark is not None:
+                    self._log_benchmark(self.model_info, benchmark)
+
+    def _save_in_background(self, model: Any) -> None:
+        """Serialize the model in a local folder, and log it to mlflow in the background.
+
+        The model is serialized (and its requirements are inferred) by the
+        ``save_model`` function of the flavor. Then ``Model.log`` creates the
+        LoggedModel, uploads the folder and registers the model in the background.
+        """
+        active_run = mlflow.active_run()
+        run_id = active_run.info.run_id if active_run else None
+        save_model_params = inspect.signature(
+            self._mlflow_model_module.save_model
+        ).parameters
+        save_args = {**self._save_args}
+        if self._flavor == "mlflow.pyfunc":
+            save_args[self._pyfunc_workflow] = model
+        else:
+            save_args[next(iter(save_model_params))] = model
+        save_model_args = {
+            key: value for key, value in save_args.items() if key in save_model_params
+        }
+        log_model_args = {
+            key: value
+            for key, value in save_args.items()
+            if key not in save_model_params and key not in _LOGGED_MODEL_ARGS
+        }
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            staging_path = Path(tmp_dir) / "model"
+            self._mlflow_model_module.save_model(path=staging_path, **save_model_args)
+            # the LoggedModel is created in the active run and experiment,
+            # which are not visible from the background thread
+            logged_model = mlflow.initialize_logged_model(
+                source_run_id=run_id,
+                **{
+                    key: save_args[key]
+                    for key in _LOGGED_MODEL_ARGS
+                    if save_args.get(key) is not None
+                },
+            )
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        def _log_model():
+            try:
+                benchmark = (
+                    self._benchmark(staging_path)
+                    if self._benchmark_args is not None
+                    else None
+                )
+                model_info = Model.log(
+                    artifact_path=None,
+                    flavor=_StagedModelFlavor(staging_path),
+                    run_id=run_id,
+                    model_id=logged_model.model_id,
+                    **log_model_args,
+                )
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            self.model_info = model_info
+            self._last_saved_model_uri = model_info.model_uri
+            if benchmark is not None:
+                self._log_benchmark(model_info, benchmark)
+            return model_info
+
+        self._pending_upload = submit_artifact_upload(
+            run_id=run_id,
+            local_path=staging_path.as_posix(),
+            artifact_path=logged_model.artifact_location,
+            upload=_log_model,
+        )
+
     def _describe(self) -> dict[str, Any]:
         return dict(
             flavor=self._flavor,
@@ -133,3 +281,48 @@ class MlflowModelTrackingDataset(MlflowAbstractModelDataSet):
             model_id=self.model_info._model_uuid if self.model_info else None,
             run_id=self.model_info._run_id if self.model_info else None,
         )
+
+    def _log_benchmark(self, model_info, benchmark: dict[str, float]) -> None:
+        """Log the benchmark of a model as metrics of its run and its LoggedModel."""
+        if model_info.run_id is None:
+            self._logger.warning(
+                f"The benchmark of the model '{model_info.model_uri}' is not logged, because it was not logged in a mlflow run."
+            )
+            return
+        timestamp = get_current_time_millis()
+        MlflowClient().log_batch(
+            run_id=model_info.run_id,
+            metrics=[
+                Metric(
+                    key=f"{model_info.name}.benchmark.{key}",
+                    value=value,
+                    timestamp=timestamp,
+                    step=0,
+                    model_id=model_info.model_id,
+                )
+                for key, value in benchmark.items()
+            ],
+        )
+
+    def __getstate__(self):
+        # a pending upload cannot be copied
+        state = self.__dict__.copy()
+        state["_pending_upload"] = None
+        return state
+
+
+class _StagedModelFlavor:
+    """A flavor whose ``save_model`` moves a model already saved in a local folder,
+    so that ``Model.log`` uploads it without serializing it again."""
+
+    def __init__(self, staging_path: Path):
+        self.staging_path = staging_path
+
+    def save_model(self, path: str, mlflow_model: Model, **kwargs) -> None:
+        shutil.move(self.staging_path, path)
+        staged_model = Model.load(path)
+        # the content comes from the staged model, the identity from the logged model
+        for key, value in vars(staged_model).items():
+            if key not in _LOGGED_MODEL_FIELDS:
+                setattr(mlflow_model, key, value)
+        mlflow_model.save(os.path.join(path, "MLmodel"))
@@ -0,0 +1,98 @@
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+from kedro.io.core import DatasetError
+
+SUPPORTED_BENCHMARK_ARGS = {"input_example", "warmup", "repeat"}
+DEFAULT_BENCHMARK_WARMUP = 1
+DEFAULT_BENCHMARK_REPEAT = 10
+
+
+def pop_benchmark_args(save_args: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Extract and validate the ``benchmark_args`` of the ``save_args`` of a model dataset.
+
+    Args:
+        save_args (dict[str, Any]): The ``save_args`` of the dataset.
+            ``benchmark_args`` is removed from them.
+
+    Raises:
+        DatasetError: When the arguments are not valid.
+
+    Returns:
+        Optional[dict[str, Any]]: The benchmark arguments with their default values,
+            or None if the model should not be benchmarked.
+    """
+    benchmark_args = save_args.pop("benchmark_args", None)
+    if benchmark_args is None:
+        return None
+
+    unsupported_args = set(benchmark_args) - SUPPORTED_BENCHMARK_ARGS
+    if unsupported_args:
+        raise DatasetError(
+            f"The following 'benchmark_args' are not supported: {sorted(unsupported_args)}. Supported arguments are {sorted(SUPPORTED_BENCHMARK_ARGS)}."
+        )
+    benchmark_args = {
+        "warmup": DEFAULT_BENCHMARK_WARMUP,
+        "repeat": DEFAULT_BENCHMARK_REPEAT,
+        # the input example of the model is the natural sample to predict on
+        "input_example": save_args.get("input_example"),
+        **benchmark_args,
+    }
+    if benchmark_args["input_example"] is None:
+        raise DatasetError(
+            "'benchmark_args' requires an 'input_example', either in 'benchmark_args' or in 'save_args'."
+        )
+    if benchmark_args["repeat"] < 1:
+        raise DatasetError(
+            f"'repeat' must be a positive integer in 'benchmark_args', got {benchmark_args['repeat']}."
+        )
+    return benchmark_args
+
+
+def benchmark_model(
+    load: Callable[[], Any],
+    model_path: Union[str, Path],
+    input_example: Any,
+    warmup: int = DEFAULT_BENCHMARK_WARMUP,
+    repeat: int = DEFAULT_BENCHMARK_REPEAT,
+) -> dict[str, float]:
+    """Measure how fast a saved model loads and predicts.
+
+    Args:
+        load (Callable[[], Any]): A function which loads the model.
+        model_path (Union[str, Path]): The local folder of the saved model.
+        input_example (Any): The data passed to the ``predict`` method of the model.
+        warmup (int): The number of predictions which are not measured. Default to 1.
+        repeat (int): The number of measured predictions. Default to 10.
+
+    Returns:
+        dict[str, float]: The load time, the 50th and 95th percentiles of the
+            prediction latency (in seconds) and the size of the model on disk (in bytes).
+    """
+    start = time.perf_counter()
+    model = load()
+    load_time = time.perf_counter() - start
+
+    if not hasattr(model, "predict"):
+        raise DatasetError(
+            f"The model of type '{type(model).__name__}' has no 'predict' method to benchmark."
+        )
+    for _ in range(warmup):
+        model.predict(input_example)
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.predict(input_example)
+        latencies.append(time.perf_counter() - start)
+
+    model_path = Path(model_path)
+    return {
+        "load_time": load_time,
+        "predict_latency_p50": float(np.percentile(latencies, 50)),
+        "predict_latency_p95": float(np.percentile(latencies, 95)),
+        "size": float(
+            sum(file.stat().st_size for file in model_path.rglob("*") if file.is_file())
+        ),
+    }
@@ -0,0 +1,323 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, Union
+
+import mlflow
+from mlflow.tracking import MlflowClient
+
+from kedro_mlflow.io.artifacts.artifact_cache import (
+    DEFAULT_CACHE_MAX_SIZE,
+    ArtifactCache,
+    get_cache_dir,
+)
+
+DEFAULT_MEMORY_CACHE_MAX_MODELS = 4
+
+
+class LoadedModelCache:
+    """A least recently used cache of the models loaded in the process.
+
+    The maximum number of models can be set with the
+    ``KEDRO_MLFLOW_MEMORY_CACHE_MAX_MODELS`` environment variable.
+    """
+
+    def __init__(self):
+        self._models = OrderedDict()
+        self._lock = Lock()
+        # a model is loaded once even if several threads ask for it
+        self._key_locks = {}
+
+    @property
+    def max_models(self) -> int:
+        return int(
+            os.environ.get(
+                "KEDRO_MLFLOW_MEMORY_CACHE_MAX_MODELS", DEFAULT_MEMORY_CACHE_MAX_MODELS
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Get a model, and load it if it is not in the cache yet.
+
+        Args:
+            key (Hashable): The identifier of the model.
+            load (Callable[[], Any]): A function which loads the model.
+
+        Returns:
+            Any: The model, which is shared by all the callers.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    return self._models[key]
+            model = load()
+            with self._lock:
+                self._models[key] = model
+                while len(self._models) > max(self.max_models, 0):
+                    evicted_key, _ = self._models.popitem(last=False)
+                    self._key_locks.pop(evicted_key, None)
+            return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._key_locks.clear()
+
+
+_LOADED_MODELS = LoadedModelCache()
+
+
+def clear_memory_cache() -> None:
+    """Release the models kept in memory by the datasets with ``memory_cache``."""
+    _LOADED_MODELS.clear()
+
+
+def is_immutable_model_uri(model_uri: str) -> bool:
+    """Does the uri always point to the same model?
+
+    It is the case for the uris returned by ``resolve_model_uri`` with the
+    "models:/" and "runs:/" schemes, but not for a local path or a storage uri,
+    whose content can be overwritten.
+    """
+    return model_uri.startswith(("models:/", "runs:/"))
+
+
+def load_model_in_memory_cache(
+    model_uri: str,
+    flavor: str,
+    load_args: dict[str, Any],
+    load: Callable[[], Any],
+) -> Any:
+    """Load a model once per process, and share it between all its loads.
+
+    Args:
+        model_uri (str): An uri returned by ``resolve_model_uri``.
+        flavor (str): The flavor used to load the model.
+        load_args (dict[str, Any]): The arguments passed to the flavor's ``load_model``.
+        load (Callable[[], Any]): A function which loads the model.
+
+    Returns:
+        Any: The model. It must not be modified, because all the loads share it.
+    """
+    if not is_immutable_model_uri(model_uri):
+        return load()
+    key = (
+        mlflow.get_tracking_uri(),
+        mlflow.get_registry_uri(),
+        model_uri,
+        flavor,
+        json.dumps(load_args, sort_keys=True, default=repr),
+    )
+    return _LOADED_MODELS.get(key, load)
+
+
+def get_model_cache(
+    download_cache: Union[bool, dict[str, Any]],
+) -> Optional[ArtifactCache]:
+    """Create the local cache of the models from the ``download_cache`` option of a dataset.
+
+    Args:
+        download_cache (Union[bool, dict[str, Any]]): Either a boolean, or a dict
+            with "dir" and "max_size" keys to configure the cache.
+
+    Returns:
+        Optional[ArtifactCache]: The cache, or None if it is deactivated.
+    """
+    if isinstance(download_cache, dict):
+        return ArtifactCache(
+            cache_dir=download_cache.get("dir", get_cache_dir() / "models"),
+            max_size=download_cache.get("max_size", DEFAULT_CACHE_MAX_SIZE),
+        )
+    if download_cache:
+        return ArtifactCache(cache_dir=get_cache_dir() / "models")
+    return None
+
+
+# the registry uri and model uri of a reference -> (resolved model uri, resolution time)
+_RESOLVED_MODEL_URIS = {}
+_RESOLVED_MODEL_URIS_LOCK = Lock()
+
+
+def resolve_model_uri(model_uri: str, ttl: Optional[float] = None) -> str:
+    """Resolve a reference to a registered model which may move to a concrete version.
+
+    "models:/<name>/latest", "models:/<name>/<stage>" and "models:/<name>@<alias>"
+    are resolved to "models:/<name>/<version>". Other uris are returned as is.
+
+    Args:
+        model_uri (str): The uri of the model.
+        ttl (Optional[float]): The number of seconds during which a resolved
+            reference is reused without querying the registry again.
+            Default to None, which always queries the registry.
+
+    Returns:
+        str: An uri which always points to the same model.
+    """
+    if not ttl:
+        return _resolve_model_uri(model_uri)
+
+    key = (mlflow.get_registry_uri(), model_uri)
+    with _RESOLVED_MODEL_URIS_LOCK:
+        resolved_model_uri, resolution_time = _RESOLVED_MODEL_URIS.get(
+            key, (None, None)
+        )
+    if resolved_model_uri is not None and time.monotonic() - resolution_time < ttl:
+        return resolved_model_uri
+
+    resolved_model_uri = _resolve_model_uri(model_uri)
+    with _RESOLVED_MODEL_URIS_LOCK:
+        _RESOLVED_MODEL_URIS[key] = (resolved_model_uri, time.monotonic())
+    return resolved_model_uri
+
+
+def _resolve_model_uri(model_uri: str) -> str:
+    if not model_uri.startswith("models:/"):
+        return model_uri
+
+    reference, _, sub_path = model_uri.removeprefix("models:/").partition("/")
+    mlflow_client = MlflowClient()
+    if "@" in reference:
+        name, alias = reference.split("@", 1)
+        version = mlflow_client.get_model_version_by_alias(name, alias).version
+    elif not sub_path:
+        # "models:/<model_id>" is a logged model, which is immutable
+        return model_uri
+    else:
+        name = reference
+        reference, _, sub_path = sub_path.partition("/")
+        if reference.isdigit():
+            return model_uri
+        elif reference.lower() == "latest":
+            version = max(
+                int(model_version.version)
+                for model_version in mlflow_client.search_model_versions(
+                    f"name='{name}'"
+                )
+            )
+        else:
+            version = mlflow_client.get_latest_versions(name, stages=[reference])[
+                0
+            ].version
+
+    resolved_model_uri = f"models:/{name}/{version}"
+    return f"{resolved_model_uri}/{sub_path}" if sub_path else resolved_model_uri
+
+
+def fetch_model(
+    model_uri: str, model_cache: ArtifactCache, resolve_ttl: Optional[float] = None
+) -> str:
+    """Get the local path of a model, and download it in the cache if it is not there yet.
+
+    Args:
+        model_uri (str): The uri of the model.
+        model_cache (ArtifactCache): The local cache of the models.
+        resolve_ttl (Optional[float]): See the ``ttl`` argument of ``resolve_model_uri``.
+
+    Returns:
+        str: The local path of the model. It must not be modified.
+    """
+    return fetch_resolved_model(
+        resolve_model_uri(model_uri, ttl=resolve_ttl), model_cache
+    )
+
+
+def fetch_resolved_model(resolved_model_uri: str, model_cache: ArtifactCache) -> str:
+    """Same as ``fetch_model`` for an uri already returned by ``resolve_model_uri``,
+    without querying the registry again.
+
+    Args:
+        resolved_model_uri (str): The resolved uri of the model.
+        model_cache (ArtifactCache): The local cache of the models.
+
+    Returns:
+        str: The local path of the model. It must not be modified.
+    """
+
+    def _download(dst_path: str) -> str:
+        # a subfolder, because some artifact repositories
+        # download a whole model in dst_path itself
+        return mlflow.artifacts.download_artifacts(
+            artifact_uri=resolved_model_uri,
+            dst_path=(Path(dst_path) / "model").as_posix(),
+        )
+
+    # the models are identified by their uri instead of a run
+    return model_cache.get(
+        tracking_uri=mlflow.get_tracking_uri(),
+        run_id="",
+        artifact_path=resolved_model_uri,
+        download=_download,
+    ).as_posix()
+
+
+def _import_joblib():
+    try:
+        import joblib
+    except ImportError as err:
+        raise ImportError(
+            "The 'mmap' option requires the 'joblib' package. Install it with 'pip install joblib'."
+        ) from err
+    return joblib
+
+
+def load_memory_mapped_model(
+    model_uri: str,
+    model_cache: ArtifactCache,
+    flavor: str,
+    load_args: dict[str, Any],
+    load: Callable[[str], Any],
+    resolve_ttl: Optional[float] = None,
+) -> Any:
+    """Load a model whose arrays are memory-mapped from the local cache.
+
+    The model is loaded once with its flavor and dumped with joblib in the cache.
+    Its numpy arrays are then memory-mapped in read-only mode from this dump, so
+    that all the processes of the machine which load it share the same memory.
+
+    Args:
+        model_uri (str): The uri of the model.
+        model_cache (ArtifactCache): The local cache of the models.
+        flavor (str): The flavor used to load the model.
+        load_args (dict[str, Any]): The arguments passed to the flavor's ``load_model``.
+        load (Callable[[str], Any]): A function which loads the model from a local uri.
+        resolve_ttl (Optional[float]): See the ``ttl`` argument of ``resolve_model_uri``.
+
+    Returns:
+        Any: The model. Its arrays are read-only.
+    """
+    joblib = _import_joblib()
+    resolved_model_uri = resolve_model_uri(model_uri, ttl=resolve_ttl)
+    # the model is fetched first, because the cache cannot be read
+    # while an entry is downloaded
+    local_model_uri = fetch_resolved_model(resolved_model_uri, model_cache)
+
+    def _dump(dst_path: str) -> str:
+        dump_dir = Path(dst_path) / "mmap_model"
+        dump_dir.mkdir()
+        joblib.dump(load(local_model_uri), dump_dir / "model.joblib")
+        return dump_dir.as_posix()
+
+    dump_dir = model_cache.get(
+        tracking_uri=mlflow.get_tracking_uri(),
+        run_id="",
+        # the dump depends on how the model was loaded
+        artifact_path=json.dumps(
+            ["mmap", resolved_model_uri, flavor, load_args],
+            sort_keys=True,
+            default=repr,
+        ),
+        download=_dump,
+    )
+    return joblib.load(dump_dir / "model.joblib", mmap_mode="r")
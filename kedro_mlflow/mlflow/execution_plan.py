@@ -0,0 +1,165 @@
+import inspect
+from typing import Any, Optional
+
+from kedro.io import DataCatalog
+from kedro.io.memory_dataset import _copy_with_mode, _infer_copy_mode
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+_EMPTY = object()
+
+
+def _copy(data: Any, copy_mode: Optional[str]) -> Any:
+    # the same copy as a MemoryDataset with this copy_mode on save and load
+    return _copy_with_mode(data, copy_mode=copy_mode or _infer_copy_mode(data))
+
+
+class ExecutionPlan:
+    """The nodes of an inference pipeline compiled to run one after another
+    without a runner.
+
+    Each dataset of the pipeline is a slot of a list, and each node is compiled
+    to its function with the slots of its inputs and outputs. Running the plan
+    gives the same result as a ``SequentialRunner`` with the ``MemoryDataset`` of
+    the pipeline, without the validation, the scheduling and the hooks of the
+    runner on each call.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        input_name: str,
+        output_name: str,
+        copy_mode: dict[str, Optional[str]],
+    ):
+        """Compile the pipeline.
+
+        Args:
+            pipeline (Pipeline): The inference pipeline.
+            catalog (DataCatalog): The catalog with the loaded artifacts,
+                i.e. all the inputs of the pipeline except ``input_name``.
+            input_name (str): The name of the input of the pipeline.
+            output_name (str): The name of the output of the pipeline.
+            copy_mode (dict[str, Optional[str]]): The copy mode of each dataset
+                of the pipeline. The output uses the default copy mode.
+        """
+        names = sorted(pipeline.datasets())
+        self._slots = {name: slot for slot, name in enumerate(names)}
+        self._input_slot = self._slots[input_name]
+        self._output_slot = self._slots[output_name]
+        # None is the default copy mode of kedro, which is inferred from the data
+        self._copy_modes = [
+            copy_mode.get(name) if name != output_name else None for name in names
+        ]
+
+        # the values of the artifacts which are the same for every call are set once,
+        # the others are loaded from their dataset with their copy mode on each call
+        self._initial_values = [_EMPTY] * len(names)
+        self._artifacts = []
+        for name in pipeline.inputs() - {input_name}:
+            slot = self._slots[name]
+            if self._copy_modes[slot] == "assign":
+                self._initial_values[slot] = catalog.load(name)
+            else:
+                self._artifacts.append((slot, catalog[name]))
+
+        # the intermediate datasets are released after their last use, like the runners do
+        last_uses = {}
+        for index, node in enumerate(pipeline.nodes):
+            for name in node.outputs + node.inputs:
+                last_uses[name] = index
+        released_slots = [[] for _ in pipeline.nodes]
+        for name, index in last_uses.items():
+            if name not in pipeline.inputs() and name != output_name:
+                released_slots[index].append(self._slots[name])
+
+        self._steps = [
+            self._compile_node(node, released_slots[index])
+            for index, node in enumerate(pipeline.nodes)
+        ]
+
+    @staticmethod
+    def can_compile(pipeline: Pipeline) -> bool:
+        """The generator functions must run lazily through a runner."""
+        return not any(
+            inspect.isgeneratorfunction(node.func) for node in pipeline.nodes
+        )
+
+    def _compile_node(self, node: Node, released_slots: list[int]) -> tuple:
+        if isinstance(node._inputs, dict):
+            args = []
+            kwargs = {arg: self._slots[name] for arg, name in node._inputs.items()}
+        else:
+            args = [self._slots[name] for name in node.inputs]
+            kwargs = {}
+
+        if isinstance(node._outputs, dict):
+            outputs = {key: self._slots[name] for key, name in node._outputs.items()}
+        elif isinstance(node._outputs, list):
+            outputs = [self._slots[name] for name in node._outputs]
+        elif isinstance(node._outputs, str):
+            outputs = self._slots[node._outputs]
+        else:
+            outputs = None
+        return node, args, kwargs, outputs, released_slots
+
+    def _load(self, values: list, slot: int) -> Any:
+        copy_mode = self._copy_modes[slot]
+        if copy_mode == "assign":
+            return values[slot]
+        return _copy(values[slot], copy_mode)
+
+    def _save(self, values: list, slot: int, data: Any) -> None:
+        copy_mode = self._copy_modes[slot]
+        values[slot] = data if copy_mode == "assign" else _copy(data, copy_mode)
+
+    def run(self, model_input: Any, params: Optional[dict[str, Any]] = None) -> Any:
+        """Run the pipeline on an input.
+
+        Args:
+            model_input (Any): The data of the input of the pipeline.
+            params (Optional[dict[str, Any]]): The values of the "params:<name>"
+                datasets which replace the loaded ones for this call.
+
+        Returns:
+            Any: The data of the output of the pipeline.
+        """
+        params = params or {}
+        values = self._initial_values.copy()
+        for slot, dataset in self._artifacts:
+            values[slot] = dataset.load()
+        for name, value in params.items():
+            if name in self._slots:
+                self._save(values, self._slots[name], value)
+        self._save(values, self._input_slot, model_input)
+
+        for node, args, kwargs, outputs, released_slots in self._steps:
+            result = node.func(
+                *(self._load(values, slot) for slot in args),
+                **{arg: self._load(values, slot) for arg, slot in kwargs.items()},
+            )
+            if isinstance(outputs, int):
+                self._save(values, outputs, result)
+            elif isinstance(outputs, list):
+                if not isinstance(result, (list, tuple)) or len(result) != len(outputs):
+                    raise ValueError(
+                        f"Failed to save outputs of node {node}.\n"
+                        f"The node definition contains a list of {len(outputs)} outputs, "
+                        f"whereas the node function returned a '{type(result).__name__}'."
+                    )
+                for slot, data in zip(outputs, result):
+                    self._save(values, slot, data)
+            elif isinstance(outputs, dict):
+                if not isinstance(result, dict) or set(result) != set(outputs):
+                    raise ValueError(
+                        f"Failed to save outputs of node {node}.\n"
+                        f"The node's output keys {set(outputs)} do not match "
+                        f"with the returned '{type(result).__name__}'."
+                    )
+                for key, slot in outputs.items():
+                    self._save(values, slot, result[key])
+            for slot in released_slots:
+                values[slot] = _EMPTY
+
+        return self._load(values, self._output_slot)
@@ -3,7 +3,7 @@ import os
 import re
 from copy import deepcopy
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from kedro.framework.hooks import _create_hook_manager
 from kedro.io import DataCatalog, MemoryDataset
@@ -13,6 +13,7 @@ from kedro.utils import load_obj
 from kedro_datasets.pickle import PickleDataset
 from mlflow.pyfunc import PythonModel
 
+from kedro_mlflow.mlflow.execution_plan import ExecutionPlan
 from kedro_mlflow.pipeline.pipeline_ml import PipelineML
 
 
@@ -225,6 +226,45 @@ class KedroPipelineModel(PythonModel):
             updated_catalog[name]._filepath = path_uri
             self.loaded_catalog[name].save(updated_catalog.load(name))
 
+        # the pipeline is compiled once for all the predictions with the SequentialRunner
+        self._execution_plan = (
+            ExecutionPlan(
+                pipeline=self.pipeline,
+                catalog=self.loaded_catalog,
+                input_name=self.input_name,
+                output_name=self.output_name,
+                copy_mode=self.copy_mode,
+            )
+            if ExecutionPlan.can_compile(self.pipeline)
+            else None
+        )
+
+    def _create_runtime_catalog(
+        self, model_input, runtime_params: dict[str, Any]
+    ) -> DataCatalog:
+        # the catalog will be modified inplace at runtime, e.g. if the outputs "predictions" is not in the catalog it will be added inplace
+        # instead of deepcopying the whole loaded catalog on each predict, the artifacts
+        # loaded in load_context are shared: the runner only loads them, and it never releases the inputs of the pipeline.
+        # The input, the runtime parameters and the intermediate datasets are new datasets for each call,
+        # so that a predict never modifies the loaded catalog
+        artifact_names = self.pipeline.inputs() - {self.input_name}
+        datasets = {
+            name: (
+                self.loaded_catalog[name]
+                if name in artifact_names
+                else MemoryDataset(copy_mode=copy_mode)
+            )
+            for name, copy_mode in self.copy_mode.items()
+            if name not in runtime_params
+        }
+        for name, value in runtime_params.items():
+            datasets[name] = MemoryDataset(
+                data=value, copy_mode=self.copy_mode.get(name)
+            )
+        runtime_catalog = DataCatalog(datasets=datasets)
+        runtime_catalog[self.input_name].save(model_input)
+        return runtime_catalog
+
     def predict(self, context, model_input, params=None):
         # we create an empty hook manager but do NOT register hooks
         # because we want this model be executable outside of a kedro project
@@ -251,19 +291,25 @@ class KedroPipelineModel(PythonModel):
             )()  # do not forget to instantiate the class with ending ()
         )
 
-        hook_manager = _create_hook_manager()
-        # _register_hooks(hook_manager, predict_params.hooks)
-
+        runtime_params = {}
         for name, value in params.items():
             # no need to check if params are in the catalog, because mlflow already checks that the params matching the signature
             param = f"params:{name}"
             self._logger.info(f"Using {param}={value} for the prediction")
-            self.loaded_catalog[param].save(value)
+            runtime_params[param] = value
 
-        # the catalog will be modified inplace at runtime, e.g. if the outputs "predictions" is not in the catalog it will be added inplace
-        # to avoid duplications, we deepcopy at runtime
-        runtime_catalog = deepcopy(self.loaded_catalog)
-        runtime_catalog[self.input_name].save(model_input)
+        # the models pickled before the execution plan existed do not have it
+        # until load_context is called
+        execution_plan = getattr(self, "_execution_plan", None)
+        if execution_plan is not None and type(runner) is SequentialRunner:
+            # no hook is registered, so running the nodes directly is equivalent
+            # and skips the validation and the scheduling of the runner
+            return execution_plan.run(model_input, runtime_params)
+
+        hook_manager = _create_hook_manager()
+        # _register_hooks(hook_manager, predict_params.hooks)
+
+        runtime_catalog = self._create_runtime_catalog(model_input, runtime_params)
 
         run_output = runner.run(
             pipeline=self.pipeline,
@@ -76,7 +76,9 @@ def test_mlflow_commands_inside_kedro_project(
     # launch the command to initialize the project
     cli_runner = CliRunner()
     result = cli_runner.invoke(cli_mlflow)
-    assert {"init", "ui", "modelify"} == set(extract_cmd_from_help(result.output))
+    assert {"init", "ui", "modelify", "models"} == set(
+        extract_cmd_from_help(result.output)
+    )
     assert "You have not updated your template yet" not in result.output
 
 
@@ -0,0 +1,104 @@
+import mlflow
+import pytest
+import yaml
+from click.testing import CliRunner
+from sklearn.linear_model import LinearRegression
+
+from kedro_mlflow.framework.cli.cli import pull as cli_pull
+from kedro_mlflow.io.models import model_cache
+
+
+@pytest.fixture(autouse=True)
+def mock_validate_settings(mocker):
+    # KedroSession eagerly validates that a project's settings.py is correct by
+    # importing it. settings.py does not actually exists as part of this test suite
+    # since we are testing session in isolation, so the validation is patched.
+    mocker.patch("kedro.framework.session.session.validate_settings")
+
+
+@pytest.fixture
+def kp_for_pull(monkeypatch, tmp_path, kedro_project_with_mlflow_conf):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", (tmp_path / "cache").as_posix())
+    tracking_uri = (tmp_path / "mlruns").as_uri()
+    mlflow_yml_path = kedro_project_with_mlflow_conf / "conf" / "local" / "mlflow.yml"
+    mlflow_yml = yaml.safe_load(mlflow_yml_path.read_text())
+    mlflow_yml["server"]["mlflow_tracking_uri"] = tracking_uri
+    mlflow_yml_path.write_text(yaml.dump(mlflow_yml))
+
+    mlflow.set_tracking_uri(tracking_uri)
+    model_uris = []
+    for _ in range(2):
+        with mlflow.start_run():
+            model_uris.append(
+                mlflow.sklearn.log_model(
+                    LinearRegression(), name="model", serialization_format="cloudpickle"
+                ).model_uri
+            )
+
+    catalog = {
+        "cached_model": {
+            "type": "kedro_mlflow.io.models.MlflowModelTrackingDataset",
+            "flavor": "mlflow.sklearn",
+            "load_args": {"model_uri": model_uris[0]},
+            "download_cache": {"dir": (tmp_path / "model_cache").as_posix()},
+        },
+        "uncached_model": {
+            "type": "kedro_mlflow.io.models.MlflowModelTrackingDataset",
+            "flavor": "mlflow.sklearn",
+            "load_args": {"model_uri": model_uris[1]},
+        },
+        "trained_model": {
+            "type": "kedro_mlflow.io.models.MlflowModelTrackingDataset",
+            "flavor": "mlflow.sklearn",
+        },
+        "data": {"type": "pandas.CSVDataset", "filepath": "data/data.csv"},
+    }
+    (kedro_project_with_mlflow_conf / "conf" / "base" / "catalog.yml").write_text(
+        yaml.dump(catalog)
+    )
+    monkeypatch.chdir(kedro_project_with_mlflow_conf)
+    return model_uris
+
+
+def test_cli_models_pull_catalog(mocker, tmp_path, kp_for_pull):
+    download_spy = mocker.spy(mlflow.artifacts, "download_artifacts")
+    resolve_spy = mocker.spy(model_cache, "_resolve_model_uri")
+
+    result = CliRunner().invoke(cli_pull)
+
+    assert result.exit_code == 0, result.output
+    # the models which are logged by the pipeline are not pulled
+    assert f"Pulled 'cached_model' ({kp_for_pull[0]})" in result.output
+    # the models without a cache would be downloaded again when they are loaded
+    assert "Skipped 'uncached_model'" in result.output
+    assert "Pulled 1/1 models" in result.output
+    assert download_spy.call_count == 1
+    # the model uri is resolved once
+    assert resolve_spy.call_count == 1
+    assert not (tmp_path / "cache").exists()
+    assert any((tmp_path / "model_cache").iterdir())
+
+    # the models are not downloaded again
+    result = CliRunner().invoke(cli_pull)
+    assert result.exit_code == 0, result.output
+    assert download_spy.call_count == 1
+
+
+def test_cli_models_pull_explicit(tmp_path, kp_for_pull):
+    result = CliRunner().invoke(
+        cli_pull, ["--model-uri", kp_for_pull[1], "--model-uri", "models:/m-unknown"]
+    )
+
+    assert result.exit_code == 1
+    assert f"Pulled '{kp_for_pull[1]}'" in result.output
+    assert "Failed to pull 'models:/m-unknown'" in result.output
+    assert "Pulled 1/2 models" in result.output
+    # the explicit model uris are pulled in the default cache
+    assert any((tmp_path / "cache" / "models").iterdir())
+
+
+def test_cli_models_pull_invalid_dataset(kp_for_pull):
+    result = CliRunner().invoke(cli_pull, ["--dataset", "data"])
+
+    assert result.exit_code == 1
+    assert "'data' is not a MlflowModelRegistryDataset" in str(result.exception)
@@ -7,7 +7,7 @@ from kedro.framework.session import KedroSession
 from kedro.framework.startup import bootstrap_project
 from kedro.io import DataCatalog, MemoryDataset
 from kedro.pipeline import Pipeline, node
-from kedro.runner import ThreadRunner
+from kedro.runner import SequentialRunner, ThreadRunner
 from kedro_datasets.pickle import PickleDataset
 
 from kedro_mlflow.framework.hooks.mlflow_hook import MlflowHook
@@ -128,3 +128,58 @@ def test_mlflow_hook_log_artifacts_within_same_run_with_thread_runner(
 
         artifacts_list = mlflow_client.list_artifacts(run_id_before_run)
         assert len(artifacts_list) == 1
+
+
+@pytest.mark.parametrize("upload_fails", [False, True])
+def test_mlflow_hook_waits_for_async_artifact_uploads(
+    mocker, kedro_project, dummy_run_params, dummy_pipeline, tmp_path, upload_fails
+):
+    dummy_catalog = DataCatalog(
+        {
+            "raw_data": MemoryDataset(pd.DataFrame(data=[1], columns=["a"])),
+            "data": MemoryDataset(),
+            "model": MlflowArtifactDataset(
+                dataset=dict(
+                    type=PickleDataset, filepath=(tmp_path / "model.pkl").as_posix()
+                ),
+                async_upload=True,
+            ),
+        }
+    )
+    if upload_fails:
+        mocker.patch(
+            "mlflow.tracking.MlflowClient.log_artifact", side_effect=OSError("Boom!")
+        )
+
+    bootstrap_project(kedro_project)
+    with KedroSession.create(project_path=kedro_project) as session:
+        context = session.load_context()
+        mlflow_hook = MlflowHook()
+        mlflow_hook.after_context_created(context)
+        mlflow_hook.before_pipeline_run(
+            run_params=dummy_run_params,
+            pipeline=dummy_pipeline,
+            catalog=dummy_catalog,
+        )
+        run_id = mlflow.active_run().info.run_id
+
+        hook_manager = _create_hook_manager()
+        _register_hooks(hook_manager, (mlflow_hook,))
+        SequentialRunner().run(dummy_pipeline, dummy_catalog, hook_manager)
+
+        mlflow_hook.after_pipeline_run(
+            run_params=dummy_run_params,
+            pipeline=dummy_pipeline,
+            catalog=dummy_catalog,
+        )
+
+        mlflow_client = context.mlflow.server._mlflow_client
+        run = mlflow_client.get_run(run_id)
+        artifacts_list = mlflow_client.list_artifacts(run_id)
+
+    if upload_fails:
+        assert run.info.status == "FAILED"
+        assert artifacts_list == []
+    else:
+        assert run.info.status == "FINISHED"
+        assert [artifact.path for artifact in artifacts_list] == ["model.pkl"]
@@ -9,12 +9,15 @@ from kedro.io import DataCatalog, MemoryDataset
 from kedro.pipeline import Pipeline, node
 from kedro.runner import SequentialRunner
 from kedro_datasets.pickle import PickleDataset
+from mlflow.tracking import MlflowClient
 
 from kedro_mlflow.framework.hooks.mlflow_hook import MlflowHook
 from kedro_mlflow.io.metrics import (
     MlflowMetricDataset,
     MlflowMetricHistoryDataset,
+    MlflowMetricSeriesDataset,
     MlflowMetricsHistoryDataset,
+    get_metric_logger,
 )
 
 TEST_METRIC_VALUE = 1.1
@@ -115,6 +118,8 @@ def dummy_catalog(tmp_path):
             "another_metric": MlflowMetricDataset(key="foo"),
             "my_metric_history": MlflowMetricHistoryDataset(),
             "another_metric_history": MlflowMetricHistoryDataset(key="bar"),
+            "my_metric_series": MlflowMetricSeriesDataset(),
+            "another_metric_series": MlflowMetricSeriesDataset(key="baz"),
         }
     )
     return dummy_catalog
@@ -165,6 +170,8 @@ def test_mlflow_hook_automatically_prefix_metrics_dataset(
         assert dummy_catalog["another_metrics"]._prefix == "foo"
         assert dummy_catalog["my_metric"].key == "my_metric"
         assert dummy_catalog["another_metric"].key == "foo"
+        assert dummy_catalog["my_metric_series"].key == "my_metric_series"
+        assert dummy_catalog["another_metric_series"].key == "baz"
 
 
 def test_mlflow_hook_metrics_dataset_with_run_id(
@@ -263,3 +270,115 @@ def test_mlflow_hook_metrics_dataset_with_run_id(
         assert (
             run_data.metrics["bar"] == 0.2  # noqa: PLR2004
         )  # the list is stored, but only the last value is retrieved
+
+
+def test_mlflow_hook_flushes_metric_logger_after_each_node(
+    kedro_project_with_mlflow_conf, dummy_run_params
+):
+    def train_fun(data):
+        metric_logger = get_metric_logger()
+        for loss in [0.3, 0.2, 0.1]:
+            metric_logger.log("loss", loss)
+        return 2
+
+    def check_fun(model):
+        # the metrics logged by the previous node must be available
+        run_id = mlflow.active_run().info.run_id
+        return [
+            metric.value
+            for metric in mlflow.tracking.MlflowClient().get_metric_history(
+                run_id, "loss"
+            )
+        ]
+
+    pipeline = Pipeline(
+        [
+            node(func=train_fun, inputs="raw_data", outputs="model"),
+            node(func=check_fun, inputs="model", outputs="logged_losses"),
+        ]
+    )
+    catalog = DataCatalog(
+        {
+            "raw_data": MemoryDataset(1),
+            "model": MemoryDataset(),
+            "logged_losses": MemoryDataset(),
+        }
+    )
+
+    bootstrap_project(kedro_project_with_mlflow_conf)
+    with KedroSession.create(project_path=kedro_project_with_mlflow_conf) as session:
+        context = session.load_context()
+        mlflow_hook = MlflowHook()
+        mlflow_hook.after_context_created(context)
+        mlflow_hook.before_pipeline_run(
+            run_params=dummy_run_params, pipeline=pipeline, catalog=catalog
+        )
+
+        hook_manager = _create_hook_manager()
+        _register_hooks(hook_manager, (mlflow_hook,))
+        SequentialRunner().run(pipeline, catalog, hook_manager)
+
+        mlflow_hook.after_pipeline_run(
+            run_params=dummy_run_params, pipeline=pipeline, catalog=catalog
+        )
+
+    assert catalog.load("logged_losses") == [0.3, 0.2, 0.1]
+
+
+def test_mlflow_hook_logs_metric_datasets_of_a_node_in_a_single_batch(
+    mocker, kedro_project_with_mlflow_conf, dummy_run_params
+):
+    def metrics_fun(data):
+        return 0.5, [0.3, 0.2, 0.1], {"accuracy": {"step": 0, "value": 0.7}}
+
+    def check_fun(metric):
+        # the metrics saved by the previous node must be available
+        return metric
+
+    pipeline = Pipeline(
+        [
+            node(
+                func=metrics_fun,
+                inputs="raw_data",
+                outputs=["my_metric", "my_metric_history", "my_metrics"],
+            ),
+            node(func=check_fun, inputs="my_metric", outputs="reloaded_metric"),
+        ]
+    )
+    catalog = DataCatalog(
+        {
+            "raw_data": MemoryDataset(1),
+            "my_metric": MlflowMetricDataset(key="my_metric"),
+            "my_metric_history": MlflowMetricHistoryDataset(key="my_metric_history"),
+            "my_metrics": MlflowMetricsHistoryDataset(prefix="my_metrics"),
+            "reloaded_metric": MemoryDataset(),
+        }
+    )
+
+    bootstrap_project(kedro_project_with_mlflow_conf)
+    with KedroSession.create(project_path=kedro_project_with_mlflow_conf) as session:
+        context = session.load_context()
+        mlflow_hook = MlflowHook()
+        mlflow_hook.after_context_created(context)
+        mlflow_hook.before_pipeline_run(
+            run_params=dummy_run_params, pipeline=pipeline, catalog=catalog
+        )
+        run_id = mlflow.active_run().info.run_id
+
+        log_batch_spy = mocker.spy(MlflowClient, "log_batch")
+        hook_manager = _create_hook_manager()
+        _register_hooks(hook_manager, (mlflow_hook,))
+        SequentialRunner().run(pipeline, catalog, hook_manager)
+        assert log_batch_spy.call_count == 1
+
+        mlflow_hook.after_pipeline_run(
+            run_params=dummy_run_params, pipeline=pipeline, catalog=catalog
+        )
+
+    assert catalog.load("reloaded_metric") == 0.5  # noqa: PLR2004
+    run = MlflowClient().get_run(run_id)
+    assert run.data.metrics == {
+        "my_metric": 0.5,
+        "my_metric_history": 0.1,
+        "my_metrics.accuracy": 0.7,
+    }
@@ -0,0 +1,144 @@
+import mlflow
+import pandas as pd
+import pytest
+from kedro.framework.hooks import _create_hook_manager
+from kedro.framework.hooks.manager import _register_hooks
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, node
+from kedro.runner import SequentialRunner
+from kedro_datasets.pickle import PickleDataset
+
+from kedro_mlflow.framework.hooks.mlflow_hook import MlflowHook
+from kedro_mlflow.io.artifacts import MlflowArtifactDataset
+
+
+@pytest.fixture
+def dummy_pipeline():
+    return Pipeline(
+        [
+            node(func=lambda data: data, inputs="raw_data", outputs="data"),
+            node(func=lambda data: data, inputs="other_data", outputs="other"),
+        ]
+    )
+
+
+@pytest.fixture
+def dummy_run_params(tmp_path):
+    return {
+        "project_path": tmp_path.as_posix(),
+        "env": "local",
+        "kedro_version": "0.16.0",
+        "tags": [],
+        "from_nodes": [],
+        "to_nodes": [],
+        "node_names": [],
+        "from_inputs": [],
+        "load_versions": [],
+        "pipeline_name": "my_cool_pipeline",
+        "extra_params": [],
+    }
+
+
+def test_mlflow_hook_prefetch_pinned_inputs(
+    mocker, kedro_project, dummy_run_params, dummy_pipeline, tmp_path
+):
+    bootstrap_project(kedro_project)
+    with KedroSession.create(project_path=kedro_project) as session:
+        context = session.load_context()
+        raw_data = pd.DataFrame(data=[1], columns=["a"])
+        filepath = (tmp_path / "raw_data.pkl").as_posix()
+        with mlflow.start_run():
+            run_id = mlflow.active_run().info.run_id
+            MlflowArtifactDataset(
+                dataset=dict(type=PickleDataset, filepath=filepath)
+            ).save(raw_data)
+
+        dummy_catalog = DataCatalog(
+            {
+                "raw_data": MlflowArtifactDataset(
+                    dataset=dict(type=PickleDataset, filepath=filepath),
+                    run_id=run_id,
+                    download_cache={"dir": tmp_path / "cache"},
+                ),
+                # not pinned to a run: it cannot be prefetched
+                "other_data": MlflowArtifactDataset(
+                    dataset=dict(type=PickleDataset, filepath=filepath),
+                    download_cache={"dir": tmp_path / "cache"},
+                ),
+                "data": MemoryDataset(),
+                "other": MemoryDataset(),
+            }
+        )
+        download_spy = mocker.spy(mlflow.artifacts, "download_artifacts")
+        logger_mock = mocker.patch(
+            "kedro_mlflow.io.catalog.prefetch_catalog_datasets.LOGGER"
+        )
+
+        mlflow_hook = MlflowHook()
+        mlflow_hook.after_context_created(context)
+        mlflow_hook.before_pipeline_run(
+            run_params=dummy_run_params,
+            pipeline=dummy_pipeline,
+            catalog=dummy_catalog,
+        )
+        # wait for the background downloads
+        mlflow_hook._prefetch_executor.shutdown(wait=True)
+
+        assert download_spy.call_count == 1
+        messages = [call.args[0] for call in logger_mock.info.call_args_list]
+        assert any(message.startswith("Prefetched 'raw_data'") for message in messages)
+        assert not any(
+            message.startswith("Prefetched 'other_data'") for message in messages
+        )
+        assert messages[-1].startswith("The prefetch of the mlflow datasets is done")
+
+        hook_manager = _create_hook_manager()
+        _register_hooks(hook_manager, (mlflow_hook,))
+        SequentialRunner().run(dummy_pipeline, dummy_catalog, hook_manager)
+        mlflow_hook.after_pipeline_run(
+            run_params=dummy_run_params,
+            pipeline=dummy_pipeline,
+            catalog=dummy_catalog,
+        )
+
+    # the node loaded the prefetched artifact from the cache
+    assert download_spy.call_count == 1
+    assert mlflow_hook._prefetch_executor is None
+
+
+def test_mlflow_hook_prefetch_failure_is_only_logged(
+    mocker, kedro_project, dummy_run_params, dummy_pipeline, tmp_path
+):
+    bootstrap_project(kedro_project)
+    with KedroSession.create(project_path=kedro_project) as session:
+        context = session.load_context()
+        dummy_catalog = DataCatalog(
+            {
+                "raw_data": MlflowArtifactDataset(
+                    dataset=dict(
+                        type=PickleDataset,
+                        filepath=(tmp_path / "raw_data.pkl").as_posix(),
+                    ),
+                    run_id="not_a_run_id",
+                    download_cache={"dir": tmp_path / "cache"},
+                ),
+            }
+        )
+        logger_mock = mocker.patch(
+            "kedro_mlflow.io.catalog.prefetch_catalog_datasets.LOGGER"
+        )
+        mlflow_hook = MlflowHook()
+        mlflow_hook.after_context_created(context)
+        mlflow_hook.before_pipeline_run(
+            run_params=dummy_run_params,
+            pipeline=dummy_pipeline,
+            catalog=dummy_catalog,
+        )
+        mlflow_hook._prefetch_executor.shutdown(wait=True)
+
+    logger_mock.warning.assert_called_once()
+    assert logger_mock.warning.call_args.args[0].startswith(
+        "The prefetch of 'raw_data' failed"
+    )
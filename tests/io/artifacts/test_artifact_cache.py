@@ -0,0 +1,112 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from kedro_mlflow.io.artifacts.artifact_cache import (
+    ArtifactCache,
+    get_cache_dir,
+    link_or_copy,
+    break_hardlinks,
+)
+
+
+def _downloader(content: bytes, calls: list):
+    def download(dst_path):
+        calls.append(dst_path)
+        filepath = Path(dst_path) / "artifact.bin"
+        filepath.write_bytes(content)
+        return filepath.as_posix()
+
+    return download
+
+
+def test_get_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", tmp_path.as_posix())
+    assert get_cache_dir() == tmp_path
+
+
+def test_artifact_cache_downloads_once(tmp_path):
+    cache = ArtifactCache(cache_dir=tmp_path / "cache")
+    calls = []
+    first_path = cache.get("file:///mlruns", "run", "a.bin", _downloader(b"a", calls))
+    second_path = cache.get("file:///mlruns", "run", "a.bin", _downloader(b"b", calls))
+
+    assert len(calls) == 1
+    assert first_path == second_path
+    assert first_path.name == "artifact.bin"
+    assert first_path.read_bytes() == b"a"
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        ("http://other_server", "run", "a.bin"),
+        ("file:///mlruns", "other_run", "a.bin"),
+        ("file:///mlruns", "run", "other/a.bin"),
+    ],
+)
+def test_artifact_cache_key(tmp_path, key):
+    cache = ArtifactCache(cache_dir=tmp_path / "cache")
+    calls = []
+    cache.get("file:///mlruns", "run", "a.bin", _downloader(b"a", calls))
+    cache.get(*key, _downloader(b"a", calls))
+
+    assert len(calls) == 2  # noqa: PLR2004
+
+
+def test_artifact_cache_lru_eviction(tmp_path):
+    cache = ArtifactCache(cache_dir=tmp_path / "cache", max_size=25)
+    calls = []
+    first_path = cache.get("uri", "run", "1", _downloader(b"1" * 10, calls))
+    os.utime(first_path.parent, (0, 0))
+    second_path = cache.get("uri", "run", "2", _downloader(b"2" * 10, calls))
+    os.utime(second_path.parent, (1, 1))
+    # the first artifact is used again, so the second is the least recently used
+    cache.get("uri", "run", "1", _downloader(b"1" * 10, calls))
+    third_path = cache.get("uri", "run", "3", _downloader(b"3" * 10, calls))
+
+    assert first_path.exists()
+    assert not second_path.exists()
+    assert third_path.exists()
+
+
+def test_artifact_cache_keeps_entry_larger_than_max_size(tmp_path):
+    cache = ArtifactCache(cache_dir=tmp_path / "cache", max_size=5)
+    cached_path = cache.get("uri", "run", "1", _downloader(b"1" * 10, []))
+    assert cached_path.exists()
+
+
+def test_artifact_cache_clear(tmp_path):
+    cache = ArtifactCache(cache_dir=tmp_path / "cache")
+    cached_path = cache.get("uri", "run", "1", _downloader(b"1", []))
+    cache.clear()
+    assert not cached_path.exists()
+
+
+def test_link_or_copy_and_break_hardlinks(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("cached")
+    dst = tmp_path / "dst" / "dst.txt"
+
+    link_or_copy(src, dst)
+    assert dst.read_text() == "cached"
+    assert dst.stat().st_nlink == 2  # noqa: PLR2004
+
+    break_hardlinks([dst])
+    assert dst.read_text() == "cached"
+    assert dst.stat().st_nlink == 1
+    dst.write_text("modified")
+    assert src.read_text() == "cached"
+    assert list(dst.parent.iterdir()) == [dst]
+
+
+def test_link_or_copy_falls_back_to_copy(mocker, tmp_path):
+    mocker.patch("os.link", side_effect=OSError("Invalid cross-device link"))
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "file.txt").write_text("cached")
+
+    link_or_copy(src, tmp_path / "dst")
+    assert (tmp_path / "dst" / "file.txt").read_text() == "cached"
+    assert (tmp_path / "dst" / "file.txt").stat().st_nlink == 1
@@ -0,0 +1,60 @@
+import hashlib
+
+import mlflow
+
+from kedro_mlflow.io.artifacts.artifact_dedup import (
+    ArtifactHashIndex,
+    artifact_exists,
+    compute_sha256,
+)
+
+
+def test_compute_sha256_file(tmp_path):
+    filepath = tmp_path / "file.txt"
+    filepath.write_bytes(b"hello")
+    assert compute_sha256(filepath) == hashlib.sha256(b"hello").hexdigest()
+
+
+def test_compute_sha256_folder_depends_on_layout(tmp_path):
+    folder = tmp_path / "folder"
+    (folder / "sub").mkdir(parents=True)
+    (folder / "a.txt").write_bytes(b"hello")
+    (folder / "sub" / "b.txt").write_bytes(b"world")
+    sha256 = compute_sha256(folder)
+
+    (folder / "sub" / "b.txt").rename(folder / "b.txt")
+    assert compute_sha256(folder) != sha256
+
+
+def test_artifact_hash_index(tmp_path):
+    hash_index = ArtifactHashIndex(experiment_id="1", index_dir=tmp_path)
+    assert hash_index.get("abc") is None
+
+    hash_index.add("abc", "run_1", "folder/file.csv")
+    # the index is persisted and shared by all the instances
+    assert ArtifactHashIndex(experiment_id="1", index_dir=tmp_path).get("abc") == (
+        "run_1",
+        "folder/file.csv",
+    )
+    assert ArtifactHashIndex(experiment_id="2", index_dir=tmp_path).get("abc") is None
+    # the same experiment ID on another tracking server is another experiment
+    assert (
+        ArtifactHashIndex(
+            experiment_id="1", index_dir=tmp_path, tracking_uri="http://other:5000"
+        ).get("abc")
+        is None
+    )
+
+    hash_index.remove("abc")
+    assert hash_index.get("abc") is None
+
+
+def test_artifact_exists(tmp_path, mlflow_client):
+    filepath = tmp_path / "file.txt"
+    filepath.write_text("hello")
+    with mlflow.start_run() as run:
+        mlflow.log_artifact(filepath.as_posix(), "folder")
+
+    assert artifact_exists(run.info.run_id, "folder/file.txt")
+    assert not artifact_exists(run.info.run_id, "file.txt")
+    assert not artifact_exists("unknown_run", "folder/file.txt")
@@ -0,0 +1,66 @@
+import mlflow
+import pytest
+
+from kedro_mlflow.io.artifacts.artifact_linking import (
+    get_local_artifact_dir,
+    link_artifact,
+)
+
+
+@pytest.fixture
+def local_file(tmp_path):
+    filepath = tmp_path / "local" / "file.txt"
+    filepath.parent.mkdir()
+    filepath.write_text("content")
+    return filepath
+
+
+def test_get_local_artifact_dir(tmp_path, mlflow_client):
+    with mlflow.start_run() as run:
+        pass
+    artifact_dir = get_local_artifact_dir(run.info.run_id)
+    assert artifact_dir == tmp_path / "mlruns" / "0" / run.info.run_id / "artifacts"
+
+
+def test_get_local_artifact_dir_remote_store(mocker, mlflow_client):
+    with mlflow.start_run() as run:
+        pass
+    run.info._artifact_uri = "s3://bucket/artifacts"
+    mocker.patch("mlflow.tracking.MlflowClient.get_run", return_value=run)
+    assert get_local_artifact_dir(run.info.run_id) is None
+
+
+def test_link_artifact_hardlink(tmp_path, local_file):
+    destination = tmp_path / "store" / "file.txt"
+    link_artifact(local_file, destination, "hardlink")
+    assert destination.read_text() == "content"
+    assert destination.stat().st_ino == local_file.stat().st_ino
+
+
+def test_link_artifact_reflink(tmp_path, local_file):
+    destination = tmp_path / "store" / "file.txt"
+    # the clone falls back to a copy if the filesystem does not support it
+    link_artifact(local_file, destination, "reflink")
+    assert destination.read_text() == "content"
+    assert destination.stat().st_ino != local_file.stat().st_ino
+
+
+def test_link_artifact_reflink_folder(tmp_path, local_file):
+    destination = tmp_path / "store" / "local"
+    link_artifact(local_file.parent, destination, "reflink")
+    assert (destination / "file.txt").read_text() == "content"
+
+
+@pytest.mark.parametrize("cross_device", [False, True])
+def test_link_artifact_move(mocker, tmp_path, local_file, cross_device):
+    if cross_device:
+        mocker.patch("os.rename", side_effect=OSError(18, "Invalid cross-device link"))
+    destination = tmp_path / "store" / "file.txt"
+    link_artifact(local_file, destination, "move")
+    assert destination.read_text() == "content"
+    assert not local_file.exists()
+
+
+def test_link_artifact_unknown_strategy(tmp_path, local_file):
+    with pytest.raises(ValueError, match="link_strategy must be one of"):
+        link_artifact(local_file, tmp_path / "store" / "file.txt", "symlink")
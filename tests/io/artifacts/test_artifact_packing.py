@@ -0,0 +1,42 @@
+import pytest
+
+from kedro_mlflow.io.artifacts.artifact_packing import pack_directory, unpack_archive
+
+
+@pytest.fixture
+def local_dir(tmp_path):
+    local_dir = tmp_path / "folder"
+    (local_dir / "subfolder").mkdir(parents=True)
+    (local_dir / "a.txt").write_text("a")
+    (local_dir / "subfolder" / "b.txt").write_text("b")
+    return local_dir
+
+
+def test_pack_and_unpack_tar(tmp_path, local_dir):
+    archive_path = tmp_path / "folder.tar"
+    pack_directory(local_dir, archive_path, "tar")
+
+    extracted_dir = tmp_path / "extracted"
+    extracted_dir.mkdir()
+    (extracted_dir / "stale.txt").write_text("stale")
+    unpack_archive(archive_path, extracted_dir, "tar")
+
+    # the folder is identical to the packed one
+    assert sorted(
+        path.relative_to(extracted_dir).as_posix() for path in extracted_dir.rglob("*")
+    ) == ["a.txt", "subfolder", "subfolder/b.txt"]
+    assert (extracted_dir / "subfolder" / "b.txt").read_text() == "b"
+
+
+def test_pack_and_unpack_zstd(tmp_path, local_dir):
+    pytest.importorskip("zstandard")
+    archive_path = tmp_path / "folder.tar.zst"
+    pack_directory(local_dir, archive_path, "zstd")
+    unpack_archive(archive_path, tmp_path / "extracted", "zstd")
+    assert (tmp_path / "extracted" / "subfolder" / "b.txt").read_text() == "b"
+
+
+def test_pack_zstd_without_zstandard(mocker, tmp_path, local_dir):
+    mocker.patch.dict("sys.modules", {"zstandard": None})
+    with pytest.raises(ImportError, match="pip install zstandard"):
+        pack_directory(local_dir, tmp_path / "folder.tar.zst", "zstd")
@@ -1,15 +1,21 @@
+import os
+import pickle
+import shutil
 from pathlib import Path
 
 import mlflow
 import pandas as pd
 import pytest
-from kedro.io import AbstractDataset
+from kedro.io import AbstractDataset, DatasetError
 from kedro_datasets.pandas import CSVDataset
 from kedro_datasets.partitions import PartitionedDataset
 from kedro_datasets.pickle import PickleDataset
 from pytest_lazy_fixtures import lf
 
+import kedro_mlflow.io.artifacts.mlflow_artifact_dataset
 from kedro_mlflow.io.artifacts import MlflowArtifactDataset
+from kedro_mlflow.io.artifacts.artifact_dedup import ArtifactHashIndex, compute_sha256
+from kedro_mlflow.io.artifacts.artifact_uploader import wait_for_artifact_uploads
 
 
 @pytest.fixture
@@ -390,3 +396,630 @@ def test_artifact_dataset_with_metadata(metadata):
 
     # Metadata should not show in _describe
     assert "metadata" not in mlflow_csv_dataset._describe()
+
+
+def test_artifact_dataset_async_upload(tmp_path, mlflow_client, df1):
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+        artifact_path="artifact_dir",
+        async_upload=True,
+    )
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_csv_dataset.save(df1)
+
+    # the upload still targets the run, even if it is closed meanwhile
+    assert wait_for_artifact_uploads() == []
+    run_artifacts = [
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(run_id=run_id, path="artifact_dir")
+    ]
+    assert run_artifacts == ["artifact_dir/df1.csv"]
+
+
+def test_artifact_dataset_async_upload_load_waits_for_upload(
+    mocker, tmp_path, mlflow_client, df1
+):
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+        run_id=run_id,
+        async_upload=True,
+    )
+    mlflow_csv_dataset.save(df1)
+
+    mocker.patch(
+        "mlflow.tracking.MlflowClient.log_artifact", side_effect=OSError("Boom!")
+    )
+    mlflow_csv_dataset.save(df1)
+    with pytest.raises(DatasetError, match="Boom!"):
+        mlflow_csv_dataset.load()
+
+    # the failure is only reported once
+    assert wait_for_artifact_uploads() == []
+
+
+def test_artifact_dataset_async_upload_reports_failures(mocker, tmp_path, df1):
+    mocker.patch(
+        "mlflow.tracking.MlflowClient.log_artifact", side_effect=OSError("Boom!")
+    )
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+        run_id="123456",
+        async_upload=True,
+    )
+    mlflow_csv_dataset.save(df1)
+
+    failed_uploads = wait_for_artifact_uploads(run_id="123456")
+    assert len(failed_uploads) == 1
+    upload, error = failed_uploads[0]
+    assert upload.local_path == (tmp_path / "df1.csv").as_posix()
+    assert isinstance(error, OSError)
+
+
+def test_artifact_dataset_dedup(monkeypatch, mocker, tmp_path, mlflow_client, df1):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", (tmp_path / "cache").as_posix())
+    filepath = (tmp_path / "df1.csv").as_posix()
+
+    with mlflow.start_run():
+        first_run_id = mlflow.active_run().info.run_id
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=filepath),
+            artifact_path="data",
+            dedup=True,
+        ).save(df1)
+
+    log_artifact_spy = mocker.spy(mlflow.tracking.MlflowClient, "log_artifact")
+    with mlflow.start_run():
+        second_run_id = mlflow.active_run().info.run_id
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=filepath),
+            artifact_path="data",
+            dedup=True,
+        ).save(df1)
+
+    # the identical artifact is not uploaded again, the run references it
+    log_artifact_spy.assert_not_called()
+    assert mlflow_client.list_artifacts(second_run_id) == []
+    second_run_tags = mlflow_client.get_run(second_run_id).data.tags
+    assert (
+        second_run_tags["kedro_mlflow.artifact_reference.data/df1.csv"]
+        == f"runs:/{first_run_id}/data/df1.csv"
+    )
+    assert (
+        second_run_tags["kedro_mlflow.artifact_sha256.data/df1.csv"]
+        == mlflow_client.get_run(first_run_id).data.tags[
+            "kedro_mlflow.artifact_sha256.data/df1.csv"
+        ]
+    )
+
+    # the reference is resolved when loading
+    (tmp_path / "loaded").mkdir()
+    loaded_df = MlflowArtifactDataset(
+        dataset=dict(
+            type=CSVDataset, filepath=(tmp_path / "loaded" / "df1.csv").as_posix()
+        ),
+        artifact_path="data",
+        run_id=second_run_id,
+        dedup=True,
+    ).load()
+    assert df1.equals(loaded_df)
+
+
+def test_artifact_dataset_without_dedup_does_not_read_run_tags(
+    mocker, tmp_path, mlflow_client, df1
+):
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+        ).save(df1)
+
+    get_run_calls = {}
+    for dedup in [False, True]:
+        get_run_spy = mocker.spy(mlflow.tracking.MlflowClient, "get_run")
+        assert df1.equals(
+            MlflowArtifactDataset(
+                dataset=dict(
+                    type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()
+                ),
+                run_id=run_id,
+                dedup=dedup,
+            ).load()
+        )
+        get_run_calls[dedup] = get_run_spy.call_count
+        mocker.stop(get_run_spy)
+
+    # the tags of the run are only read to resolve the references of dedup
+    assert get_run_calls[True] == get_run_calls[False] + 1
+
+
+def test_artifact_dataset_dedup_does_not_index_failed_uploads(
+    monkeypatch, mocker, tmp_path, mlflow_client, df1
+):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", (tmp_path / "cache").as_posix())
+    filepath = (tmp_path / "df1.csv").as_posix()
+    mocker.patch(
+        "mlflow.tracking.MlflowClient.log_artifact", side_effect=OSError("Boom!")
+    )
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=filepath),
+            dedup=True,
+            async_upload=True,
+        ).save(df1)
+        assert len(wait_for_artifact_uploads(run_id=run_id)) == 1
+
+    hash_index = ArtifactHashIndex(mlflow_client.get_run(run_id).info.experiment_id)
+    assert hash_index.get(compute_sha256(filepath)) is None
+    assert (
+        "kedro_mlflow.artifact_sha256.df1.csv"
+        not in mlflow_client.get_run(run_id).data.tags
+    )
+
+
+def test_artifact_dataset_dedup_uploads_modified_artifacts(
+    monkeypatch, tmp_path, mlflow_client, df1, df2
+):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", (tmp_path / "cache").as_posix())
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=(tmp_path / "df.csv").as_posix()),
+        dedup=True,
+    )
+
+    with mlflow.start_run():
+        mlflow_csv_dataset.save(df1)
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_csv_dataset.save(df1)
+        mlflow_csv_dataset.save(df2)
+
+    run_tags = mlflow_client.get_run(run_id).data.tags
+    assert "kedro_mlflow.artifact_reference.df.csv" not in run_tags
+    assert [artifact.path for artifact in mlflow_client.list_artifacts(run_id)] == [
+        "df.csv"
+    ]
+    mlflow_csv_dataset.run_id = run_id
+    assert df2.equals(mlflow_csv_dataset.load())
+
+
+def test_artifact_dataset_dedup_verifies_hash_on_load(
+    monkeypatch, tmp_path, mlflow_client, df1
+):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", (tmp_path / "cache").as_posix())
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+        dedup=True,
+    )
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_csv_dataset.save(df1)
+        mlflow.set_tag("kedro_mlflow.artifact_sha256.df1.csv", "wrong_hash")
+
+    mlflow_csv_dataset.run_id = run_id
+    with pytest.raises(DatasetError, match="is corrupted"):
+        mlflow_csv_dataset.load()
+
+
+@pytest.mark.parametrize("download_cache", [True, {"max_size": 10**6}])
+def test_artifact_dataset_download_cache(
+    monkeypatch, mocker, tmp_path, mlflow_client, df1, df2, download_cache
+):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", (tmp_path / "cache").as_posix())
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix())
+        ).save(df1)
+
+    download_spy = mocker.spy(mlflow.tracking.MlflowClient, "download_artifacts")
+    for i in range(2):
+        (tmp_path / f"session_{i}").mkdir()
+        mlflow_csv_dataset = MlflowArtifactDataset(
+            dataset=dict(
+                type=CSVDataset,
+                filepath=(tmp_path / f"session_{i}" / "df1.csv").as_posix(),
+            ),
+            run_id=run_id,
+            download_cache=download_cache,
+        )
+        assert df1.equals(mlflow_csv_dataset.load())
+
+    assert download_spy.call_count == 1
+    assert (tmp_path / "session_1" / "df1.csv").stat().st_nlink == 3  # noqa: PLR2004
+
+    # saving again must not modify the cached artifact
+    mlflow_csv_dataset._logging_activated = False
+    mlflow_csv_dataset.save(df2)
+    assert (tmp_path / "session_0" / "df1.csv").stat().st_nlink == 2  # noqa: PLR2004
+    assert df1.equals(pd.read_csv(tmp_path / "session_0" / "df1.csv"))
+
+
+@pytest.mark.parametrize("link_strategy", ["hardlink", "reflink", "move"])
+def test_artifact_dataset_link_strategy(
+    mocker, tmp_path, mlflow_client, df1, df2, link_strategy
+):
+    log_artifact_spy = mocker.spy(mlflow.tracking.MlflowClient, "log_artifact")
+    filepath = tmp_path / "df1.csv"
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=filepath.as_posix()),
+        artifact_path="artifact_dir",
+        link_strategy=link_strategy,
+    )
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_csv_dataset.save(df1)
+        if link_strategy != "move":
+            # saving again must not modify the logged artifact
+            mlflow_csv_dataset._logging_activated = False
+            mlflow_csv_dataset.save(df2)
+
+    log_artifact_spy.assert_not_called()
+    assert filepath.exists() == (link_strategy != "move")
+    run_artifacts = [
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(run_id=run_id, path="artifact_dir")
+    ]
+    assert run_artifacts == ["artifact_dir/df1.csv"]
+
+    mlflow_csv_dataset.run_id = run_id
+    assert df1.equals(mlflow_csv_dataset.load())
+
+
+@pytest.mark.parametrize("link_strategy", ["hardlink", "reflink", "move"])
+def test_artifact_dataset_link_strategy_partitioned_dataset(
+    tmp_path, mlflow_client, df1, df2, link_strategy
+):
+    mlflow_dataset = MlflowArtifactDataset(
+        dataset=dict(
+            type=PartitionedDataset,
+            path=(tmp_path / "parts").as_posix(),
+            dataset="pandas.CSVDataset",
+            filename_suffix=".csv",
+        ),
+        link_strategy=link_strategy,
+    )
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_dataset.save(dict(a=df1))
+        # the partitions logged by the first save must not be removed
+        mlflow_dataset.save(dict(b=df2))
+
+    run_artifacts = sorted(
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(run_id=run_id, path="parts")
+    )
+    assert run_artifacts == ["parts/a.csv", "parts/b.csv"]
+    if link_strategy != "move":
+        assert sorted(mlflow_dataset.load()) == ["a", "b"]
+        assert sorted(file.name for file in (tmp_path / "parts").iterdir()) == [
+            "a.csv",
+            "b.csv",
+        ]
+
+
+def test_artifact_dataset_keeps_hardlinked_partitions(tmp_path, df1, df2):
+    parts_dir = tmp_path / "parts"
+    parts_dir.mkdir()
+    df1.to_csv(tmp_path / "kept.csv", index=False)
+    # e.g. a partition linked by a data versioning tool
+    os.link(tmp_path / "kept.csv", parts_dir / "kept.csv")
+    mlflow_dataset = MlflowArtifactDataset(
+        dataset=dict(
+            type=PartitionedDataset,
+            path=parts_dir.as_posix(),
+            dataset="pandas.CSVDataset",
+            filename_suffix=".csv",
+        ),
+    )
+    mlflow_dataset._logging_activated = False
+
+    mlflow_dataset.save(dict(new=df2))
+
+    assert sorted(file.name for file in parts_dir.iterdir()) == ["kept.csv", "new.csv"]
+    assert (parts_dir / "kept.csv").stat().st_nlink == 2  # noqa: PLR2004
+
+
+def test_artifact_dataset_link_strategy_remote_store(mocker, tmp_path, df1):
+    mocker.patch(
+        "kedro_mlflow.io.artifacts.mlflow_artifact_dataset.get_local_artifact_dir",
+        return_value=None,
+    )
+    log_artifact_mock = mocker.patch("mlflow.tracking.MlflowClient.log_artifact")
+    MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+        run_id="123456",
+        link_strategy="hardlink",
+    ).save(df1)
+    log_artifact_mock.assert_called_once()
+
+
+def test_artifact_dataset_unknown_link_strategy(tmp_path):
+    with pytest.raises(DatasetError, match="link_strategy must be one of"):
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+            link_strategy="symlink",
+        )
+
+
+def test_artifact_dataset_partitioned_dataset_incremental_upload(
+    mocker, tmp_path, mlflow_client, df1, df2
+):
+    upload_directory_spy = mocker.spy(
+        kedro_mlflow.io.artifacts.mlflow_artifact_dataset, "upload_directory"
+    )
+    mlflow_dataset = MlflowArtifactDataset(
+        artifact_path="partitioned_data",
+        dataset=dict(
+            type=PartitionedDataset,
+            path=(tmp_path / "df_dir").as_posix(),
+            dataset="pandas.CSVDataset",
+            filename_suffix=".csv",
+        ),
+        upload_args=dict(max_workers=2, incremental=True),
+    )
+
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_dataset.save(dict(df1=df1))
+        mlflow_dataset.save(dict(df2=df2))
+
+    # only the new partition is uploaded by the second save
+    assert upload_directory_spy.call_args_list[0].kwargs["files"] == ["df1.csv"]
+    assert upload_directory_spy.call_args_list[1].kwargs["files"] == ["df2.csv"]
+    assert upload_directory_spy.call_args_list[1].kwargs["max_workers"] == 2  # noqa: PLR2004
+    run_artifacts = sorted(
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(
+            run_id=run_id, path="partitioned_data/df_dir"
+        )
+    )
+    assert run_artifacts == [
+        "partitioned_data/df_dir/df1.csv",
+        "partitioned_data/df_dir/df2.csv",
+    ]
+
+
+def test_artifact_dataset_partitioned_dataset_upload_retries(
+    mocker, tmp_path, mlflow_client, df1
+):
+    mocker.patch("kedro_mlflow.io.artifacts.artifact_uploader.time.sleep")
+    log_artifact_mock = mocker.patch(
+        "mlflow.store.artifact.local_artifact_repo.LocalArtifactRepository.log_artifact",
+        side_effect=[OSError("Boom!"), None],
+    )
+    mlflow_dataset = MlflowArtifactDataset(
+        dataset=dict(
+            type=PartitionedDataset,
+            path=(tmp_path / "df_dir").as_posix(),
+            dataset="pandas.CSVDataset",
+            filename_suffix=".csv",
+        ),
+    )
+    with mlflow.start_run():
+        mlflow_dataset.save(dict(df1=df1))
+
+    # the transient failure is retried
+    assert log_artifact_mock.call_count == 2  # noqa: PLR2004
+
+    log_artifact_mock.side_effect = OSError("Boom!")
+    mlflow_dataset.upload_args = dict(retries=1)
+    with mlflow.start_run():
+        with pytest.raises(DatasetError, match="Failed to upload 1 files"):
+            mlflow_dataset.save(dict(df1=df1))
+
+
+def test_artifact_dataset_unknown_upload_args(tmp_path):
+    with pytest.raises(DatasetError, match="upload_args only supports"):
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+            upload_args=dict(chunk_size=1024),
+        )
+
+
+@pytest.mark.parametrize("async_upload", [False, True])
+def test_artifact_dataset_partitioned_dataset_pack(
+    tmp_path, mlflow_client, df1, df2, async_upload
+):
+    mlflow_dataset = MlflowArtifactDataset(
+        artifact_path="partitioned_data",
+        dataset=dict(
+            type=PartitionedDataset,
+            path=(tmp_path / "df_dir").as_posix(),
+            dataset="pandas.CSVDataset",
+            filename_suffix=".csv",
+        ),
+        pack="tar",
+        async_upload=async_upload,
+    )
+    data = dict(df1=df1, df2=df2)
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_dataset.save(data)
+
+    assert wait_for_artifact_uploads() == []
+    # the whole folder is uploaded as a single file
+    run_artifacts = [
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(
+            run_id=run_id, path="partitioned_data"
+        )
+    ]
+    assert run_artifacts == ["partitioned_data/df_dir.tar"]
+
+    (tmp_path / "df_dir" / "df1.csv").unlink()
+    mlflow_dataset.run_id = run_id
+    reloaded_data = {k: loader() for k, loader in mlflow_dataset.load().items()}
+    assert reloaded_data.keys() == data.keys()
+    for k, df in data.items():
+        pd.testing.assert_frame_equal(df, reloaded_data[k])
+
+
+def test_artifact_dataset_pack_requires_a_folder(tmp_path, df1):
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+        pack="tar",
+    )
+    with mlflow.start_run():
+        with pytest.raises(DatasetError, match="pack only supports"):
+            mlflow_csv_dataset.save(df1)
+
+
+def test_artifact_dataset_unknown_pack(tmp_path):
+    with pytest.raises(DatasetError, match="pack must be one of"):
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=(tmp_path / "df1.csv").as_posix()),
+            pack="zip",
+        )
+
+
+@pytest.mark.parametrize("async_upload", [False, True])
+def test_artifact_dataset_without_local_persistence(
+    mocker, tmp_path, mlflow_client, df1, async_upload
+):
+    mkdtemp_spy = mocker.spy(
+        kedro_mlflow.io.artifacts.mlflow_artifact_dataset, "mkdtemp"
+    )
+    filepath = tmp_path / "df1.csv"
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=filepath.as_posix()),
+        artifact_path="artifact_dir",
+        local_persistence=False,
+        async_upload=async_upload,
+    )
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        mlflow_csv_dataset.save(df1)
+
+    assert wait_for_artifact_uploads() == []
+    # nothing is left on the disk after the upload
+    assert not filepath.exists()
+    assert not Path(mkdtemp_spy.spy_return).exists()
+    run_artifacts = [
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(run_id=run_id, path="artifact_dir")
+    ]
+    assert run_artifacts == ["artifact_dir/df1.csv"]
+
+    mlflow_csv_dataset.run_id = run_id
+    assert df1.equals(mlflow_csv_dataset.load())
+
+
+def test_artifact_dataset_without_local_persistence_logging_deactivated(tmp_path, df1):
+    filepath = tmp_path / "df1.csv"
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(type=CSVDataset, filepath=filepath.as_posix()),
+        local_persistence=False,
+    )
+    # the data must not be lost when it is not logged
+    mlflow_csv_dataset._logging_activated = False
+    mlflow_csv_dataset.save(df1)
+    assert df1.equals(pd.read_csv(filepath))
+
+
+def test_artifact_dataset_without_local_persistence_unsupported_dataset(tmp_path):
+    with pytest.raises(DatasetError, match="requires a dataset which writes"):
+        MlflowArtifactDataset(
+            dataset=dict(
+                type=PartitionedDataset,
+                path=(tmp_path / "df_dir").as_posix(),
+                dataset="pandas.CSVDataset",
+            ),
+            local_persistence=False,
+        )
+
+    with pytest.raises(DatasetError, match="cannot be used with a versioned dataset"):
+        MlflowArtifactDataset(
+            dataset=dict(
+                type=CSVDataset,
+                filepath=(tmp_path / "df1.csv").as_posix(),
+                versioned=True,
+            ),
+            local_persistence=False,
+        )
+
+
+def test_artifact_dataset_class_is_generated_once(tmp_path):
+    mlflow_datasets = [
+        MlflowArtifactDataset(
+            dataset=dict(type=CSVDataset, filepath=(tmp_path / f"df{i}.csv").as_posix())
+        )
+        for i in range(3)
+    ]
+    mlflow_pickle_dataset = MlflowArtifactDataset(
+        dataset=dict(type=PickleDataset, filepath=(tmp_path / "df.pkl").as_posix())
+    )
+
+    assert len({type(mlflow_dataset) for mlflow_dataset in mlflow_datasets}) == 1
+    assert type(mlflow_datasets[0]).__name__ == "MlflowCSVDataset"
+    assert type(mlflow_pickle_dataset).__name__ == "MlflowPickleDataset"
+
+
+@pytest.mark.parametrize("versioned", [False, True])
+def test_artifact_dataset_pickle(tmp_path, mlflow_client, df1, versioned):
+    mlflow_csv_dataset = MlflowArtifactDataset(
+        dataset=dict(
+            type=CSVDataset,
+            filepath=(tmp_path / "df1.csv").as_posix(),
+            versioned=versioned,
+        ),
+        artifact_path="artifact_dir",
+    )
+    mlflow_csv_dataset._logging_activated = False
+    unpickled_dataset = pickle.loads(pickle.dumps(mlflow_csv_dataset))
+
+    assert type(unpickled_dataset) is type(mlflow_csv_dataset)
+    assert unpickled_dataset.artifact_path == "artifact_dir"
+    assert unpickled_dataset._logging_activated is False
+
+    unpickled_dataset._logging_activated = True
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        unpickled_dataset.save(df1)
+    assert [
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(run_id=run_id, path="artifact_dir")
+    ] == ["artifact_dir/df1.csv"]
+
+
+@pytest.mark.parametrize("download_cache", [False, True])
+def test_artifact_dataset_partitioned_dataset_lazy_load_with_run_id(
+    monkeypatch, mocker, tmp_path, df1, df2, download_cache
+):
+    monkeypatch.setenv("KEDRO_MLFLOW_CACHE_DIR", (tmp_path / "cache").as_posix())
+    dataset_config = dict(
+        type=PartitionedDataset,
+        path=(tmp_path / "df_dir").as_posix(),
+        dataset="pandas.CSVDataset",
+        filename_suffix=".csv",
+    )
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        MlflowArtifactDataset(
+            dataset=dataset_config, artifact_path="partitioned_data"
+        ).save({"df1": df1, "subfolder/df2": df2})
+
+    shutil.rmtree(tmp_path / "df_dir")
+    download_spy = mocker.spy(mlflow.artifacts, "download_artifacts")
+    mlflow_dataset = MlflowArtifactDataset(
+        dataset=dataset_config,
+        artifact_path="partitioned_data",
+        run_id=run_id,
+        download_cache=download_cache,
+    )
+    partitions = mlflow_dataset.load()
+
+    # the partitions are listed without being downloaded
+    assert sorted(partitions.keys()) == ["df1", "subfolder/df2"]
+    download_spy.assert_not_called()
+
+    pd.testing.assert_frame_equal(partitions["subfolder/df2"](), df2)
+    assert download_spy.call_count == 1
+    assert (tmp_path / "df_dir" / "subfolder" / "df2.csv").exists()
+    assert not (tmp_path / "df_dir" / "df1.csv").exists()
+
+    pd.testing.assert_frame_equal(partitions["df1"](), df1)
+    assert download_spy.call_count == 2  # noqa: PLR2004
@@ -0,0 +1,128 @@
+import mlflow
+import pandas as pd
+import pytest
+from kedro.io.core import DatasetError
+
+from kedro_mlflow.io.metrics import MlflowExperimentMetricsDataset
+
+
+@pytest.fixture
+def experiment_with_runs(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("my_experiment")
+    run_ids = []
+    for i in range(3):
+        with mlflow.start_run(experiment_id=experiment_id, run_name=f"run_{i}"):
+            mlflow.log_param("model", "a" if i < 2 else "b")
+            for step in range(3):
+                mlflow.log_metric("accuracy", 0.1 * i + 0.01 * step, step=step)
+            mlflow.log_metric("loss", 1 - 0.1 * i)
+            run_ids.append(mlflow.active_run().info.run_id)
+    return run_ids
+
+
+def test_experiment_metrics_dataset_load_last_values(
+    mlflow_client, experiment_with_runs
+):
+    dataset = MlflowExperimentMetricsDataset(
+        experiment_name="my_experiment", metric_keys=["accuracy", "loss"]
+    )
+    df = dataset.load()
+
+    assert list(df.columns) == ["run_id", "run_name", "start_time", "accuracy", "loss"]
+    assert set(df["run_id"]) == set(experiment_with_runs)
+    df = df.set_index("run_id")
+    for i, run_id in enumerate(experiment_with_runs):
+        assert df.loc[run_id, "accuracy"] == pytest.approx(0.1 * i + 0.02)
+        assert df.loc[run_id, "loss"] == pytest.approx(1 - 0.1 * i)
+
+
+def test_experiment_metrics_dataset_load_all_metrics_if_no_keys(
+    mlflow_client, experiment_with_runs
+):
+    dataset = MlflowExperimentMetricsDataset(experiment_name="my_experiment")
+    df = dataset.load()
+
+    assert set(df.columns) == {"run_id", "run_name", "start_time", "accuracy", "loss"}
+
+
+def test_experiment_metrics_dataset_filter_string(mlflow_client, experiment_with_runs):
+    dataset = MlflowExperimentMetricsDataset(
+        experiment_name="my_experiment",
+        filter_string="params.model = 'a'",
+        metric_keys=["loss"],
+    )
+    df = dataset.load()
+
+    assert set(df["run_id"]) == set(experiment_with_runs[:2])
+
+
+def test_experiment_metrics_dataset_max_results_paginates(
+    mocker, mlflow_client, experiment_with_runs
+):
+    mocker.patch(
+        "kedro_mlflow.io.metrics.mlflow_experiment_metrics_dataset.SEARCH_MAX_RESULTS_DEFAULT",
+        1,
+    )
+    dataset = MlflowExperimentMetricsDataset(
+        experiment_name="my_experiment",
+        metric_keys=["loss"],
+        load_args={"max_results": 2, "order_by": ["attributes.start_time ASC"]},
+    )
+    df = dataset.load()
+
+    assert list(df["run_id"]) == experiment_with_runs[:2]
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_experiment_metrics_dataset_load_history(
+    mlflow_client, experiment_with_runs, max_workers
+):
+    dataset = MlflowExperimentMetricsDataset(
+        experiment_name="my_experiment",
+        metric_keys=["accuracy"],
+        load_args={"history": True, "max_workers": max_workers},
+    )
+    df = dataset.load()
+
+    assert list(df.columns) == ["run_id", "key", "step", "timestamp", "value"]
+    assert len(df) == 9
+    history = df[df["run_id"] == experiment_with_runs[1]].sort_values("step")
+    pd.testing.assert_series_equal(
+        history["value"].reset_index(drop=True),
+        pd.Series([0.1, 0.11, 0.12], name="value"),
+    )
+
+
+def test_experiment_metrics_dataset_uses_active_run_experiment(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("other_experiment")
+    with mlflow.start_run(experiment_id=experiment_id):
+        mlflow.log_metric("loss", 0.5)
+        df = MlflowExperimentMetricsDataset(metric_keys=["loss"]).load()
+
+    assert df["loss"].tolist() == [0.5]
+
+
+def test_experiment_metrics_dataset_without_experiment_nor_active_run(mlflow_client):
+    dataset = MlflowExperimentMetricsDataset()
+    with pytest.raises(DatasetError, match="You must either specify an"):
+        dataset.load()
+    assert not dataset.exists()
+
+
+def test_experiment_metrics_dataset_unknown_experiment(mlflow_client):
+    dataset = MlflowExperimentMetricsDataset(experiment_name="unknown")
+    with pytest.raises(DatasetError, match="does not exist"):
+        dataset.load()
+
+
+def test_experiment_metrics_dataset_exists(mlflow_client, experiment_with_runs):
+    assert MlflowExperimentMetricsDataset(experiment_name="my_experiment").exists()
+    assert not MlflowExperimentMetricsDataset(
+        experiment_name="my_experiment", filter_string="params.model = 'c'"
+    ).exists()
+
+
+def test_experiment_metrics_dataset_save_is_not_implemented(mlflow_client):
+    dataset = MlflowExperimentMetricsDataset(experiment_name="my_experiment")
+    with pytest.raises(DatasetError, match="'save' method is not implemented"):
+        dataset.save(pd.DataFrame())
@@ -0,0 +1,195 @@
+import mlflow
+import pytest
+
+from kedro_mlflow.io.metrics import (
+    MlflowMetricDataset,
+    MlflowMetricHistoryDataset,
+    MlflowMetricLogger,
+    MlflowMetricsHistoryDataset,
+    get_metric_logger,
+)
+from kedro_mlflow.io.metrics.mlflow_metric_logger import (
+    _flush_metric_loggers,
+    _start_dataset_metric_buffering,
+    _stop_dataset_metric_buffering,
+)
+
+
+def _history(mlflow_client, run_id, key):
+    return [
+        (metric.step, metric.value)
+        for metric in mlflow_client.get_metric_history(run_id, key)
+    ]
+
+
+def test_metric_logger_buffers_until_flush(mlflow_client):
+    metric_logger = MlflowMetricLogger(flush_interval=None)
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        for i in range(3):
+            metric_logger.log("loss", 1 / (i + 1))
+
+        assert mlflow_client.get_metric_history(run_id, "loss") == []
+
+        metric_logger.flush()
+
+    assert _history(mlflow_client, run_id, "loss") == [
+        (0, 1.0),
+        (1, 0.5),
+        (2, pytest.approx(1 / 3)),
+    ]
+
+
+def test_metric_logger_flushes_with_a_single_batch(mocker, mlflow_client):
+    metric_logger = MlflowMetricLogger(flush_interval=None)
+    log_batch_spy = mocker.spy(mlflow.tracking.MlflowClient, "log_batch")
+    with mlflow.start_run():
+        metric_logger.log_metrics({"loss": 0.5, "accuracy": 0.7}, step=3)
+        metric_logger.log_metrics({"loss": 0.4, "accuracy": 0.8}, step=4)
+        metric_logger.flush()
+
+    assert log_batch_spy.call_count == 1
+    assert len(log_batch_spy.call_args.kwargs["metrics"]) == 4  # noqa: PLR2004
+
+
+def test_metric_logger_flushes_when_buffer_is_full(mlflow_client):
+    metric_logger = MlflowMetricLogger(max_buffer_size=2, flush_interval=None)
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        metric_logger.log("loss", 0.3)
+        assert _history(mlflow_client, run_id, "loss") == []
+        metric_logger.log("loss", 0.2)
+        assert _history(mlflow_client, run_id, "loss") == [(0, 0.3), (1, 0.2)]
+
+
+def test_metric_logger_flushes_after_interval(mlflow_client):
+    metric_logger = MlflowMetricLogger(flush_interval=0)
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        metric_logger.log("loss", 0.3, step=5)
+        assert _history(mlflow_client, run_id, "loss") == [(5, 0.3)]
+
+
+def test_metric_logger_with_run_id(mlflow_client):
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+
+    with MlflowMetricLogger(run_id=run_id, flush_interval=None) as metric_logger:
+        metric_logger.log("loss", 0.3)
+
+    assert _history(mlflow_client, run_id, "loss") == [(0, 0.3)]
+
+
+def test_metric_logger_without_run_id_nor_active_run(mlflow_client):
+    metric_logger = MlflowMetricLogger()
+    with pytest.raises(ValueError, match="You must either specify a run_id"):
+        metric_logger.log("loss", 0.3)
+
+
+def test_metric_logger_logging_deactivation(mlflow_client):
+    metric_logger = MlflowMetricLogger(flush_interval=None)
+    metric_logger._logging_activated = False
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        metric_logger.log("loss", 0.3)
+        metric_logger.flush()
+
+    assert _history(mlflow_client, run_id, "loss") == []
+
+
+def test_metric_logger_logging_deactivation_is_bool():
+    metric_logger = MlflowMetricLogger()
+    with pytest.raises(ValueError, match="_logging_activated must be a boolean"):
+        metric_logger._logging_activated = "hello"
+
+
+def test_flush_metric_loggers_flushes_all_loggers(mlflow_client):
+    metric_logger = MlflowMetricLogger(flush_interval=None)
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        metric_logger.log("loss", 0.3)
+        get_metric_logger().log("accuracy", 0.8)
+        _flush_metric_loggers()
+
+    assert _history(mlflow_client, run_id, "loss") == [(0, 0.3)]
+    assert _history(mlflow_client, run_id, "accuracy") == [(0, 0.8)]
+
+
+def test_get_metric_logger_is_shared():
+    assert get_metric_logger() is get_metric_logger()
+
+
+@pytest.fixture
+def buffered_run(mlflow_client):
+    # the run of a kedro pipeline, whose metrics are buffered by the hook
+    with mlflow.start_run() as run:
+        _start_dataset_metric_buffering(run.info.run_id)
+        yield run.info.run_id
+        _stop_dataset_metric_buffering(run.info.run_id)
+
+
+def test_metric_datasets_log_right_away_outside_a_kedro_run(mlflow_client):
+    with mlflow.start_run():
+        run_id = mlflow.active_run().info.run_id
+        MlflowMetricDataset(key="loss").save(0.3)
+        MlflowMetricHistoryDataset(key="accuracy").save([0.5, 0.6])
+
+    assert _history(mlflow_client, run_id, "loss") == [(0, 0.3)]
+    assert _history(mlflow_client, run_id, "accuracy") == [(0, 0.5), (1, 0.6)]
+
+
+def test_metric_datasets_are_buffered_until_flush(mocker, mlflow_client, buffered_run):
+    log_batch_spy = mocker.spy(mlflow.tracking.MlflowClient, "log_batch")
+    run_id = buffered_run
+    MlflowMetricDataset(key="loss").save(0.3)
+    MlflowMetricHistoryDataset(key="accuracy").save([0.5, 0.6])
+    MlflowMetricsHistoryDataset(prefix="other").save({"f1": {"step": 0, "value": 0.4}})
+    assert _history(mlflow_client, run_id, "loss") == []
+
+    _flush_metric_loggers()
+
+    assert log_batch_spy.call_count == 1
+    assert _history(mlflow_client, run_id, "loss") == [(0, 0.3)]
+    assert _history(mlflow_client, run_id, "accuracy") == [(0, 0.5), (1, 0.6)]
+    assert _history(mlflow_client, run_id, "other.f1") == [(0, 0.4)]
+
+
+def test_metric_dataset_append_mode_takes_buffered_metrics_into_account(
+    mlflow_client, buffered_run
+):
+    metric_ds = MlflowMetricDataset(key="loss", save_args={"mode": "append"})
+    metric_ds.save(0.3)
+    _flush_metric_loggers()
+    metric_ds.save(0.2)
+    metric_ds.save(0.1)
+    _flush_metric_loggers()
+
+    assert _history(mlflow_client, buffered_run, "loss") == [
+        (0, 0.3),
+        (1, 0.2),
+        (2, 0.1),
+    ]
+
+
+def test_metric_datasets_of_other_runs_are_not_buffered(mlflow_client):
+    # e.g. a kedro session interrupted before the end of its pipeline
+    with mlflow.start_run() as interrupted_run:
+        _start_dataset_metric_buffering(interrupted_run.info.run_id)
+
+    with mlflow.start_run() as run:
+        MlflowMetricDataset(key="loss").save(0.3)
+
+    assert _history(mlflow_client, run.info.run_id, "loss") == [(0, 0.3)]
+    _stop_dataset_metric_buffering(interrupted_run.info.run_id)
+
+
+def test_stop_dataset_metric_buffering_flushes_the_run(mlflow_client, buffered_run):
+    MlflowMetricDataset(key="loss").save(0.3)
+    assert _history(mlflow_client, buffered_run, "loss") == []
+
+    _stop_dataset_metric_buffering(buffered_run)
+
+    assert _history(mlflow_client, buffered_run, "loss") == [(0, 0.3)]
+    # the next metrics are logged right away
+    MlflowMetricDataset(key="loss", save_args={"mode": "append"}).save(0.2)
+    assert _history(mlflow_client, buffered_run, "loss") == [(0, 0.3), (1, 0.2)]
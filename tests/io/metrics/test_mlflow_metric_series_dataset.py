@@ -0,0 +1,137 @@
+import mlflow
+import pandas as pd
+import pyarrow as pa
+import pytest
+from kedro.io.core import DatasetError
+
+from kedro_mlflow.io.metrics import MlflowMetricSeriesDataset
+
+
+@pytest.fixture
+def metric_as_list():
+    return [0.3, 0.2, 0.1, 0.15, 0.05]
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+@pytest.mark.parametrize(
+    "save_mode,load_mode",
+    [
+        ("list", "list"),
+        ("list", "dict"),
+        ("dict", "list"),
+        ("dict", "dict"),
+        ("history", "history"),
+    ],
+)
+def test_metric_series_dataset_save_load(
+    mlflow_client, metric_as_list, file_format, save_mode, load_mode
+):
+    metric_as_dict = dict(enumerate(metric_as_list))
+    metric_as_history = [
+        {"step": step, "value": value} for step, value in metric_as_dict.items()
+    ]
+    mode_metrics_mapping = {
+        "list": metric_as_list,
+        "dict": metric_as_dict,
+        "history": metric_as_history,
+    }
+
+    metric_ds = MlflowMetricSeriesDataset(
+        key="my_metric", save_args={"mode": save_mode, "format": file_format}
+    )
+    with mlflow.start_run():
+        metric_ds.save(mode_metrics_mapping[save_mode])
+        run_id = mlflow.active_run().info.run_id
+
+    artifacts = [
+        fileinfo.path
+        for fileinfo in mlflow_client.list_artifacts(run_id=run_id, path="metrics")
+    ]
+    extension = ".parquet" if file_format == "parquet" else ".arrow"
+    assert artifacts == [f"metrics/my_metric{extension}"]
+
+    metric_ds_loader = MlflowMetricSeriesDataset(
+        key="my_metric",
+        run_id=run_id,
+        load_args={"mode": load_mode},
+        save_args={"format": file_format},
+    )
+    assert metric_ds_loader.load() == mode_metrics_mapping[load_mode]
+
+
+def test_metric_series_dataset_logs_only_summary_metrics(mlflow_client, metric_as_list):
+    metric_ds = MlflowMetricSeriesDataset(key="my_metric")
+    with mlflow.start_run():
+        metric_ds.save(metric_as_list)
+        run_id = mlflow.active_run().info.run_id
+
+    metrics = mlflow_client.get_run(run_id).data.metrics
+    assert metrics == {
+        "my_metric.min": 0.05,
+        "my_metric.max": 0.3,
+        "my_metric.last": 0.05,
+        "my_metric.mean": pytest.approx(0.16),
+    }
+    assert mlflow_client.get_metric_history(run_id, "my_metric") == []
+
+
+def test_metric_series_dataset_save_dataframe_load_table(mlflow_client):
+    df = pd.DataFrame({"step": [0, 10, 20], "value": [1.0, 2.0, 3.0]})
+    metric_ds = MlflowMetricSeriesDataset(
+        key="my_metric",
+        load_args={"mode": "table"},
+        save_args={"format": "arrow", "artifact_path": None},
+    )
+    with mlflow.start_run():
+        metric_ds.save(df)
+        table = metric_ds.load()
+        reloaded_df = MlflowMetricSeriesDataset(
+            key="my_metric",
+            load_args={"mode": "dataframe"},
+            save_args={"format": "arrow", "artifact_path": None},
+        ).load()
+
+    assert isinstance(table, pa.Table)
+    assert table.column("step").to_pylist() == [0, 10, 20]
+    pd.testing.assert_frame_equal(reloaded_df, df)
+
+
+def test_metric_series_dataset_exists(mlflow_client, metric_as_list):
+    metric_ds = MlflowMetricSeriesDataset(key="my_metric")
+    with mlflow.start_run():
+        assert not metric_ds.exists()
+        metric_ds.save(metric_as_list)
+        assert metric_ds.exists()
+
+
+def test_metric_series_dataset_logging_deactivation(mlflow_client, metric_as_list):
+    metric_ds = MlflowMetricSeriesDataset(key="inactive_metric")
+    metric_ds._logging_activated = False
+    with mlflow.start_run():
+        metric_ds.save(metric_as_list)
+        assert not metric_ds.exists()
+
+
+def test_metric_series_dataset_wrong_format():
+    with pytest.raises(DatasetError, match=r"save_args\['format'\] must be one of"):
+        MlflowMetricSeriesDataset(key="my_metric", save_args={"format": "csv"})
+
+
+def test_metric_series_dataset_wrong_modes(mlflow_client, metric_as_list):
+    with mlflow.start_run():
+        with pytest.raises(DatasetError, match=r"save_args\['mode'\] must be one of"):
+            MlflowMetricSeriesDataset(
+                key="my_metric", save_args={"mode": "bad_mode"}
+            ).save(metric_as_list)
+
+        MlflowMetricSeriesDataset(key="my_metric").save(metric_as_list)
+        with pytest.raises(DatasetError, match=r"load_args\['mode'\] must be one of"):
+            MlflowMetricSeriesDataset(
+                key="my_metric", load_args={"mode": "bad_mode"}
+            ).load()
+
+
+def test_metric_series_dataset_save_empty_series(mlflow_client):
+    with mlflow.start_run():
+        with pytest.raises(DatasetError, match="Cannot save an empty series"):
+            MlflowMetricSeriesDataset(key="my_metric").save([])
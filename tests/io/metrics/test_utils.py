@@ -0,0 +1,125 @@
+import mlflow
+import numpy as np
+import pytest
+
+from kedro_mlflow.io.metrics import MlflowMetricDataset, MlflowMetricHistoryDataset
+from kedro_mlflow.io.metrics.utils import (
+    _find_file_store_metrics_dir,
+    _read_metric_file,
+    load_metric_histories,
+)
+
+
+@pytest.fixture
+def run_with_metrics(mlflow_client):
+    with mlflow.start_run() as run:
+        for step in range(5):
+            mlflow.log_metric("loss", 1 / (step + 1), step=step)
+        mlflow.log_metric("accuracy", 0.5, step=0)
+        mlflow.log_metric("accuracy", 0.7, step=0)
+        mlflow.log_metric("nested/metric", 0.1)
+    return run.info.run_id
+
+
+def test_load_metric_histories_fast_path_matches_client(run_with_metrics):
+    fast_histories = load_metric_histories(run_with_metrics, file_store_fast_path=True)
+    client_histories = load_metric_histories(run_with_metrics)
+
+    assert set(fast_histories) == {"loss", "accuracy", "nested/metric"}
+    assert set(fast_histories) == set(client_histories)
+    for key, fast_history in fast_histories.items():
+        for fast_array, client_array in zip(fast_history, client_histories[key]):
+            np.testing.assert_array_equal(fast_array, client_array)
+            assert fast_array.dtype == client_array.dtype
+
+
+def test_load_metric_histories_fast_path_reads_the_files(mocker, run_with_metrics):
+    get_metric_history_spy = mocker.spy(
+        mlflow.tracking.MlflowClient, "get_metric_history"
+    )
+    histories = load_metric_histories(
+        run_with_metrics, keys=["loss", "unknown"], file_store_fast_path=True
+    )
+
+    get_metric_history_spy.assert_not_called()
+    assert histories["loss"].step.tolist() == [0, 1, 2, 3, 4]
+    assert histories["unknown"].value.size == 0
+
+
+def test_load_metric_histories_fast_path_falls_back_to_client(mocker, run_with_metrics):
+    mocker.patch("mlflow.get_tracking_uri", return_value="http://localhost:5000")
+    get_metric_history_mock = mocker.patch(
+        "mlflow.tracking.MlflowClient.get_metric_history", return_value=[]
+    )
+    load_metric_histories(run_with_metrics, keys=["loss"], file_store_fast_path=True)
+
+    get_metric_history_mock.assert_called_once_with(run_with_metrics, "loss")
+
+
+@pytest.mark.parametrize(
+    "tracking_uri",
+    ["http://localhost:5000", "databricks", "sqlite:///mlflow.db"],
+)
+def test_find_file_store_metrics_dir_other_schemes(tracking_uri):
+    assert _find_file_store_metrics_dir(tracking_uri, "123") is None
+
+
+def test_find_file_store_metrics_dir_deleted_experiment(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("to_delete")
+    with mlflow.start_run(experiment_id=experiment_id) as run:
+        mlflow.log_metric("loss", 0.1)
+    mlflow_client.delete_experiment(experiment_id)
+
+    metrics_dir = _find_file_store_metrics_dir(
+        mlflow.get_tracking_uri(), run.info.run_id
+    )
+    assert metrics_dir.parent.parent.parent.name == ".trash"
+    assert (metrics_dir / "loss").is_file()
+
+
+@pytest.mark.parametrize(
+    "content,expected_steps",
+    [
+        ("1 0.1 0\n2 0.2 1\n", [0, 1]),
+        ("1 0.1\n2 0.2\n", [0, 0]),  # legacy lines without step
+        ("1 0.1 3 ds digest\n2 0.2 4 ds digest\n", [3, 4]),  # lines with a dataset
+        ("1 nan 0\n2 inf 1\n", [0, 1]),
+        ("", []),
+    ],
+)
+def test_read_metric_file(tmp_path, content, expected_steps):
+    path = tmp_path / "metric"
+    path.write_text(content)
+    history = _read_metric_file(path)
+
+    assert history.step.tolist() == expected_steps
+    assert history.timestamp.tolist() == list(range(1, len(expected_steps) + 1))
+    assert history.value.dtype == np.float64
+
+
+@pytest.mark.parametrize(
+    "dataset,load_args,expected",
+    [
+        (MlflowMetricDataset, {}, 0.2),
+        (MlflowMetricDataset, {"step": 0}, 0.7),
+        (MlflowMetricHistoryDataset, {"mode": "list"}, [0.5, 0.7, 0.2]),
+        (MlflowMetricHistoryDataset, {"mode": "dict"}, {0: 0.7, 1: 0.2}),
+    ],
+)
+def test_metric_datasets_file_store_fast_path(
+    mlflow_client, dataset, load_args, expected
+):
+    with mlflow.start_run() as run:
+        mlflow.log_metric("accuracy", 0.5, step=0)
+        mlflow.log_metric("accuracy", 0.7, step=0)
+        mlflow.log_metric("accuracy", 0.2, step=1)
+
+    fast_dataset = dataset(
+        key="accuracy",
+        run_id=run.info.run_id,
+        load_args={**load_args, "file_store_fast_path": True},
+    )
+    client_dataset = dataset(
+        key="accuracy", run_id=run.info.run_id, load_args=load_args
+    )
+    assert fast_dataset.load() == client_dataset.load() == expected
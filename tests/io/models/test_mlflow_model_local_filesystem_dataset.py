@@ -1,15 +1,23 @@
+import json
+import pickle
+from concurrent.futures import Future
+from copy import deepcopy
 from tempfile import TemporaryDirectory
 
 import mlflow
 import pandas as pd
 import pytest
 from kedro.io import DataCatalog, MemoryDataset
+from kedro.io.core import DatasetError
 from kedro.pipeline import Pipeline, node
 from kedro_datasets.pickle import PickleDataset
 from pytest_lazy_fixtures import lf
 from sklearn.linear_model import LinearRegression
 
-from kedro_mlflow.io.models import MlflowModelLocalFileSystemDataset
+from kedro_mlflow.io.models import (
+    MlflowModelLocalFileSystemDataset,
+    mlflow_abstract_model_dataset,
+)
 from kedro_mlflow.mlflow import KedroPipelineModel
 from kedro_mlflow.pipeline import pipeline_ml_factory
 
@@ -214,3 +222,143 @@ def test_metrics_history_dataset_with_metadata(metadata):
 
     # Metadata should not show in _describe
     assert "metadata" not in mlflow_model_ds._describe()
+
+
+def test_save_failure_keeps_previous_model(mocker, linreg_path, linreg_model):
+    mlflow_model_ds = MlflowModelLocalFileSystemDataset(
+        flavor="mlflow.sklearn", filepath=linreg_path.as_posix()
+    )
+    mlflow_model_ds.save(linreg_model)
+
+    mocker.patch("mlflow.sklearn.save_model", side_effect=OSError("disk full"))
+    with pytest.raises(DatasetError, match="disk full"):
+        mlflow_model_ds.save(linreg_model)
+
+    # the previous model is still there, and no temporary folder remains
+    assert isinstance(mlflow_model_ds.load(), LinearRegression)
+    assert [path.name for path in linreg_path.parent.iterdir()] == ["linreg"]
+
+
+@pytest.mark.parametrize("fingerprint", [False, True])
+def test_save_with_fingerprint(linreg_path, linreg_model, fingerprint):
+    mlflow_model_ds = MlflowModelLocalFileSystemDataset(
+        flavor="mlflow.sklearn",
+        filepath=linreg_path.as_posix(),
+        # the default "skops" format stores the ids of the objects,
+        # so the same model is never byte-identical
+        save_args={"serialization_format": "cloudpickle"},
+        fingerprint=fingerprint,
+    )
+    mlflow_model_ds.save(linreg_model)
+
+    def _mlmodel_stat():
+        stat = (linreg_path / "MLmodel").stat()
+        return stat.st_ino, stat.st_mtime_ns
+
+    mlmodel_stat = _mlmodel_stat()
+
+    # the same model is saved again
+    mlflow_model_ds.save(linreg_model)
+    assert (_mlmodel_stat() == mlmodel_stat) is fingerprint
+
+    # a different model is always saved
+    linreg_model.fit(X=[[1], [2]], y=[3, 4])
+    mlflow_model_ds.save(linreg_model)
+    assert _mlmodel_stat() != mlmodel_stat
+    assert mlflow_model_ds.load().coef_ == pytest.approx([1])
+
+
+def test_flavor_module_is_imported_once(mocker, monkeypatch, linreg_path):
+    monkeypatch.setattr(mlflow_abstract_model_dataset, "_FLAVOR_MODULES", {})
+    import_spy = mocker.spy(mlflow_abstract_model_dataset, "import_module")
+
+    mlflow_model_ds = MlflowModelLocalFileSystemDataset(
+        flavor="mlflow.sklearn", filepath=linreg_path.as_posix()
+    )
+    for dataset in (
+        mlflow_model_ds,
+        deepcopy(mlflow_model_ds),
+        pickle.loads(pickle.dumps(mlflow_model_ds)),
+    ):
+        assert dataset._mlflow_model_module is mlflow.sklearn
+
+    import_spy.assert_called_once_with("mlflow.sklearn")
+
+
+def test_flavor_module_background_import(monkeypatch, linreg_path, linreg_model):
+    monkeypatch.setattr(mlflow_abstract_model_dataset, "_FLAVOR_MODULES", {})
+
+    mlflow_model_ds = MlflowModelLocalFileSystemDataset(
+        flavor="mlflow.sklearn",
+        filepath=linreg_path.as_posix(),
+        background_import=True,
+    )
+    assert isinstance(
+        mlflow_abstract_model_dataset._FLAVOR_MODULES["mlflow.sklearn"], Future
+    )
+
+    # the dataset waits for the import
+    mlflow_model_ds.save(linreg_model)
+    assert isinstance(mlflow_model_ds.load(), LinearRegression)
+
+
+def test_flavor_module_background_import_does_not_exist(linreg_path):
+    with pytest.raises(DatasetError, match="'mlflow.whoops' module not found"):
+        MlflowModelLocalFileSystemDataset(
+            flavor="mlflow.whoops",
+            filepath=linreg_path.as_posix(),
+            background_import=True,
+        )
+
+
+def test_save_with_benchmark(linreg_path):
+    linreg_model = LinearRegression().fit(X=[[1], [2]], y=[3, 4])
+    mlflow_model_ds = MlflowModelLocalFileSystemDataset(
+        flavor="mlflow.sklearn",
+        filepath=linreg_path.as_posix(),
+        save_args={"benchmark_args": {"input_example": [[1], [2]], "repeat": 3}},
+    )
+    mlflow_model_ds.save(linreg_model)
+
+    benchmark = json.loads((linreg_path / "benchmark.json").read_text())
+    assert benchmark["size"] > 0
+    assert benchmark["load_time"] > 0
+    assert benchmark["predict_latency_p50"] <= benchmark["predict_latency_p95"]
+    # the benchmark_args are not passed to mlflow
+    assert isinstance(mlflow_model_ds.load(), LinearRegression)
+
+
+def test_save_with_benchmark_failure(mocker, linreg_path):
+    linreg_model = LinearRegression().fit(X=[[1], [2]], y=[3, 4])
+    mocker.patch(
+        "kedro_mlflow.io.models.mlflow_abstract_model_dataset.benchmark_model",
+        side_effect=ValueError("wrong input example"),
+    )
+    save_args = {"benchmark_args": {"input_example": "wrong"}}
+    mlflow_model_ds = MlflowModelLocalFileSystemDataset(
+        flavor="mlflow.sklearn", filepath=linreg_path.as_posix(), save_args=save_args
+    )
+    mlflow_model_ds.save(linreg_model)
+
+    # the model is saved without its benchmark, and the save_args are left untouched
+    assert not (linreg_path / "benchmark.json").exists()
+    assert isinstance(mlflow_model_ds.load(), LinearRegression)
+    assert save_args == {"benchmark_args": {"input_example": "wrong"}}
+
+
+@pytest.mark.parametrize("serialization_format", [None, "skops"])
+def test_fingerprint_ignored_with_skops(
+    caplog, linreg_path, linreg_model, serialization_format
+):
+    save_args = (
+        {"serialization_format": serialization_format} if serialization_format else {}
+    )
+    mlflow_model_ds = MlflowModelLocalFileSystemDataset(
+        flavor="mlflow.sklearn",
+        filepath=linreg_path.as_posix(),
+        save_args=save_args,
+        fingerprint=True,
+    )
+
+    assert "'fingerprint' is ignored" in caplog.text
+    assert mlflow_model_ds._describe()["fingerprint"] is False
@@ -1,6 +1,7 @@
 from tempfile import TemporaryDirectory
 
 import mlflow
+import numpy as np
 import pandas as pd
 import pytest
 from kedro.io import DataCatalog, MemoryDataset
@@ -10,6 +11,7 @@ from kedro_datasets.pickle import PickleDataset
 from pytest_lazy_fixtures import lf
 from sklearn.linear_model import LinearRegression
 
+from kedro_mlflow.io.artifacts.artifact_uploader import wait_for_artifact_uploads
 from kedro_mlflow.io.models import MlflowModelTrackingDataset
 from kedro_mlflow.mlflow import KedroPipelineModel
 from kedro_mlflow.pipeline import pipeline_ml_factory
@@ -370,3 +372,140 @@ def test_mlflow_model_tracking_dataset_with_metadata(metadata):
 
     # Metadata should not show in _describe
     assert "metadata" not in mlflow_model_ds._describe()
+
+
+def test_mlflow_model_tracking_dataset_mmap(tmp_path, linreg_model):
+    mlflow_model_ds = MlflowModelTrackingDataset(
+        flavor="mlflow.sklearn",
+        save_args={"name": "my_linreg"},
+        download_cache={"dir": tmp_path / "cache"},
+        mmap=True,
+    )
+    mlflow_model_ds.save(linreg_model)
+
+    for _ in range(2):
+        # the second load reads the dump from the cache
+        linreg_model_loaded = mlflow_model_ds.load()
+        assert isinstance(linreg_model_loaded.coef_, np.memmap)
+        assert not linreg_model_loaded.coef_.flags.writeable
+        assert pytest.approx(linreg_model_loaded.predict([[1, 2]])[0]) == 5  # noqa: PLR2004
+
+
+def test_mlflow_model_tracking_dataset_mmap_requires_download_cache():
+    with pytest.raises(DatasetError, match="'mmap' requires a 'download_cache'"):
+        MlflowModelTrackingDataset(flavor="mlflow.sklearn", mmap=True)
+
+
+def test_mlflow_model_tracking_dataset_async_upload(mocker, tracking_uri, linreg_model):
+    mlflow.set_tracking_uri(tracking_uri)
+    log_model_spy = mocker.spy(mlflow.sklearn, "log_model")
+    mlflow_model_ds = MlflowModelTrackingDataset(
+        flavor="mlflow.sklearn",
+        save_args={
+            "name": "my_linreg",
+            "serialization_format": "cloudpickle",
+            "tags": {"tag": "value"},
+        },
+        async_upload=True,
+    )
+    with mlflow.start_run() as run:
+        mlflow_model_ds.save(linreg_model)
+        # the load waits for the upload
+        linreg_model_loaded = mlflow_model_ds.load()
+        assert wait_for_artifact_uploads() == []
+
+    log_model_spy.assert_not_called()
+    assert isinstance(linreg_model_loaded, LinearRegression)
+    assert pytest.approx(linreg_model_loaded.predict([[1, 2]])[0]) == 5  # noqa: PLR2004
+    assert mlflow_model_ds.model_info.run_id == run.info.run_id
+    assert mlflow_model_ds.model_info.flavors["python_function"]
+    assert mlflow_model_ds.model_uri == mlflow_model_ds.model_info.model_uri
+
+    logged_model = mlflow.get_logged_model(mlflow_model_ds.model_info.model_id)
+    assert logged_model.name == "my_linreg"
+    assert logged_model.tags["tag"] == "value"
+    assert logged_model.source_run_id == run.info.run_id
+    assert logged_model.status == "READY"
+
+
+def test_mlflow_model_tracking_dataset_async_upload_failure(
+    mocker, tracking_uri, linreg_model
+):
+    mlflow.set_tracking_uri(tracking_uri)
+    mocker.patch(
+        "mlflow.tracking.MlflowClient.log_model_artifacts",
+        side_effect=OSError("network error"),
+    )
+    mlflow_model_ds = MlflowModelTrackingDataset(
+        flavor="mlflow.sklearn", save_args={"name": "my_linreg"}, async_upload=True
+    )
+    with mlflow.start_run():
+        mlflow_model_ds.save(linreg_model)
+        with pytest.raises(DatasetError, match="network error"):
+            mlflow_model_ds.load()
+        assert len(wait_for_artifact_uploads()) == 1
+
+
+@pytest.mark.parametrize("async_upload", [False, True])
+def test_mlflow_model_tracking_dataset_benchmark(
+    tracking_uri, linreg_model, async_upload
+):
+    mlflow.set_tracking_uri(tracking_uri)
+    mlflow_model_ds = MlflowModelTrackingDataset(
+        flavor="mlflow.sklearn",
+        save_args={
+            "name": "my_linreg",
+            "input_example": pd.DataFrame(data=[[1, 2]], columns=["a", "b"]),
+            "benchmark_args": {"repeat": 3},
+        },
+        async_upload=async_upload,
+    )
+    with mlflow.start_run() as run:
+        mlflow_model_ds.save(linreg_model)
+        assert wait_for_artifact_uploads() == []
+
+    metrics = mlflow.get_run(run.info.run_id).data.metrics
+    assert set(metrics) == {
+        "my_linreg.benchmark.load_time",
+        "my_linreg.benchmark.predict_latency_p50",
+        "my_linreg.benchmark.predict_latency_p95",
+        "my_linreg.benchmark.size",
+    }
+    assert metrics["my_linreg.benchmark.size"] > 0
+    logged_model = mlflow.get_logged_model(mlflow_model_ds.model_info.model_id)
+    assert {metric.key for metric in logged_model.metrics} == set(metrics)
+
+
+@pytest.mark.parametrize("async_upload", [False, True])
+def test_mlflow_model_tracking_dataset_benchmark_failure_logs_model(
+    mocker, tracking_uri, linreg_model, async_upload
+):
+    mlflow.set_tracking_uri(tracking_uri)
+    mocker.patch(
+        "kedro_mlflow.io.models.mlflow_abstract_model_dataset.benchmark_model",
+        side_effect=ValueError("wrong input example"),
+    )
+    mlflow_model_ds = MlflowModelTrackingDataset(
+        flavor="mlflow.sklearn",
+        save_args={
+            "name": "my_linreg",
+            "benchmark_args": {"input_example": "wrong"},
+        },
+        async_upload=async_upload,
+    )
+    with mlflow.start_run() as run:
+        mlflow_model_ds.save(linreg_model)
+        assert wait_for_artifact_uploads() == []
+
+    assert mlflow.get_run(run.info.run_id).data.metrics == {}
+    assert isinstance(mlflow_model_ds.load(), LinearRegression)
+
+
+def test_mlflow_model_tracking_dataset_does_not_modify_save_args():
+    save_args = {"name": "my_linreg", "benchmark_args": {"input_example": [[1, 2]]}}
+    MlflowModelTrackingDataset(flavor="mlflow.sklearn", save_args=save_args)
+    # the same save_args can be reused for another dataset
+    assert save_args == {
+        "name": "my_linreg",
+        "benchmark_args": {"input_example": [[1, 2]]},
+    }
@@ -0,0 +1,59 @@
+import pytest
+from kedro.io.core import DatasetError
+
+from kedro_mlflow.io.models.model_benchmark import benchmark_model, pop_benchmark_args
+
+
+def test_pop_benchmark_args():
+    save_args = {"input_example": [[1, 2]], "benchmark_args": {"repeat": 5}}
+    assert pop_benchmark_args(save_args) == {
+        "input_example": [[1, 2]],
+        "warmup": 1,
+        "repeat": 5,
+    }
+    # the other arguments are passed to the flavor
+    assert save_args == {"input_example": [[1, 2]]}
+    assert pop_benchmark_args({"name": "my_model"}) is None
+
+
+@pytest.mark.parametrize(
+    "benchmark_args,error",
+    [
+        ({"repeats": 5, "input_example": [[1]]}, "are not supported: \\['repeats'\\]"),
+        ({}, "requires an 'input_example'"),
+        ({"repeat": 0, "input_example": [[1]]}, "'repeat' must be a positive integer"),
+    ],
+)
+def test_pop_benchmark_args_invalid(benchmark_args, error):
+    with pytest.raises(DatasetError, match=error):
+        pop_benchmark_args({"benchmark_args": benchmark_args})
+
+
+def test_benchmark_model(tmp_path):
+    (tmp_path / "model.pkl").write_bytes(b"0" * 100)
+
+    class DummyModel:
+        calls = 0
+
+        def predict(self, data):
+            DummyModel.calls += 1
+            return data
+
+    benchmark = benchmark_model(
+        load=DummyModel, model_path=tmp_path, input_example=[1], warmup=2, repeat=3
+    )
+
+    assert DummyModel.calls == 5  # noqa: PLR2004
+    assert set(benchmark) == {
+        "load_time",
+        "predict_latency_p50",
+        "predict_latency_p95",
+        "size",
+    }
+    assert benchmark["size"] == 100  # noqa: PLR2004
+    assert benchmark["predict_latency_p50"] <= benchmark["predict_latency_p95"]
+
+
+def test_benchmark_model_without_predict(tmp_path):
+    with pytest.raises(DatasetError, match="has no 'predict' method"):
+        benchmark_model(load=object, model_path=tmp_path, input_example=[1])
@@ -0,0 +1,181 @@
+import mlflow
+import pytest
+from mlflow import MlflowClient
+from sklearn.tree import DecisionTreeClassifier
+
+from kedro_mlflow.io.artifacts.artifact_cache import ArtifactCache
+from kedro_mlflow.io.models import MlflowModelRegistryDataset
+from kedro_mlflow.io.models.model_cache import (
+    LoadedModelCache,
+    clear_memory_cache,
+    fetch_model,
+    get_model_cache,
+    resolve_model_uri,
+)
+
+
+@pytest.fixture
+def registered_model(tmp_path, monkeypatch):
+    # the artifacts of a database tracking are stored in a relative mlruns/ folder
+    monkeypatch.chdir(tmp_path)
+    tracking_and_registry_uri = r"sqlite:///" + (tmp_path / "mlruns.db").as_posix()
+    mlflow.set_tracking_uri(tracking_and_registry_uri)
+    mlflow.set_registry_uri(tracking_and_registry_uri)
+
+    runs = {}
+    for i in range(3):
+        with mlflow.start_run():
+            mlflow.sklearn.log_model(
+                DecisionTreeClassifier(),
+                name="demo_model",
+                registered_model_name="demo_model",
+            )
+            runs[i + 1] = mlflow.active_run().info.run_id
+
+    client = MlflowClient(
+        tracking_uri=tracking_and_registry_uri, registry_uri=tracking_and_registry_uri
+    )
+    client.transition_model_version_stage(name="demo_model", version=2, stage="Staging")
+    client.set_registered_model_alias(name="demo_model", alias="champion", version=1)
+    return runs
+
+
+def test_resolve_model_uri(registered_model):
+    # the fixture is slow to create, so all the cases share it
+    for model_uri, expected_model_uri in [
+        ("models:/demo_model/latest", "models:/demo_model/3"),
+        ("models:/demo_model/Staging", "models:/demo_model/2"),
+        ("models:/demo_model@champion", "models:/demo_model/1"),
+        ("models:/demo_model/1", "models:/demo_model/1"),
+        ("models:/m-123456", "models:/m-123456"),
+        ("runs:/123456/model", "runs:/123456/model"),
+    ]:
+        assert resolve_model_uri(model_uri) == expected_model_uri
+
+
+def test_resolve_model_uri_ttl(mocker, registered_model):
+    now = mocker.patch(
+        "kedro_mlflow.io.models.model_cache.time.monotonic", return_value=0
+    )
+    assert resolve_model_uri("models:/demo_model@champion", ttl=60) == (
+        "models:/demo_model/1"
+    )
+
+    MlflowClient().set_registered_model_alias(
+        name="demo_model", alias="champion", version=3
+    )
+    # the resolved version is reused until the ttl expires
+    now.return_value = 59
+    assert resolve_model_uri("models:/demo_model@champion", ttl=60) == (
+        "models:/demo_model/1"
+    )
+    assert resolve_model_uri("models:/demo_model@champion") == "models:/demo_model/3"
+    now.return_value = 61
+    assert resolve_model_uri("models:/demo_model@champion", ttl=60) == (
+        "models:/demo_model/3"
+    )
+
+
+def test_get_model_cache(tmp_path):
+    assert get_model_cache(False) is None
+    assert isinstance(get_model_cache(True), ArtifactCache)
+    model_cache = get_model_cache({"dir": tmp_path, "max_size": 1024})
+    assert model_cache.cache_dir == tmp_path
+    assert model_cache.max_size == 1024  # noqa: PLR2004
+
+
+def test_mlflow_model_registry_dataset_download_cache(
+    mocker, tmp_path, registered_model
+):
+    download_spy = mocker.spy(mlflow.artifacts, "download_artifacts")
+    mlflow_model_ds = MlflowModelRegistryDataset(
+        model_name="demo_model",
+        stage_or_version="staging",
+        download_cache={"dir": tmp_path / "cache"},
+    )
+
+    assert mlflow_model_ds.prefetch() is True
+    assert download_spy.call_count == 1
+
+    # the model is loaded from the cache
+    assert mlflow_model_ds.load().metadata.run_id == registered_model[2]
+    assert download_spy.call_count == 1
+
+    # a reference to the same version uses the same cache entry
+    model_cache = mlflow_model_ds._model_cache
+    assert fetch_model("models:/demo_model/Staging", model_cache) == fetch_model(
+        "models:/demo_model/2", model_cache
+    )
+    assert download_spy.call_count == 1
+
+
+def test_mlflow_model_registry_dataset_prefetch_requires_cache():
+    assert MlflowModelRegistryDataset(model_name="demo_model").prefetch() is False
+
+
+def test_loaded_model_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setenv("KEDRO_MLFLOW_MEMORY_CACHE_MAX_MODELS", "2")
+    loaded_model_cache = LoadedModelCache()
+    loads = []
+
+    def _loader(key):
+        def _load():
+            loads.append(key)
+            return object()
+
+        return _load
+
+    model_a = loaded_model_cache.get("a", _loader("a"))
+    loaded_model_cache.get("b", _loader("b"))
+    assert loaded_model_cache.get("a", _loader("a")) is model_a
+    loaded_model_cache.get("c", _loader("c"))  # "b" is the least recently used
+
+    assert loads == ["a", "b", "c"]
+    assert "a" in loaded_model_cache
+    assert "b" not in loaded_model_cache
+    assert len(loaded_model_cache) == 2  # noqa: PLR2004
+
+    loaded_model_cache.clear()
+    assert len(loaded_model_cache) == 0
+
+
+def test_mlflow_model_registry_dataset_memory_cache(mocker, registered_model):
+    clear_memory_cache()
+    load_spy = mocker.spy(mlflow.sklearn, "load_model")
+
+    champion_ds = MlflowModelRegistryDataset(
+        model_name="demo_model",
+        alias="champion",
+        flavor="mlflow.sklearn",
+        memory_cache=True,
+    )
+    version_ds = MlflowModelRegistryDataset(
+        model_name="demo_model",
+        stage_or_version=1,
+        flavor="mlflow.sklearn",
+        memory_cache=True,
+    )
+
+    # the alias is resolved, so both datasets share the model
+    model = champion_ds.load()
+    assert version_ds.load() is model
+    assert load_spy.call_count == 1
+
+    # another version is another entry
+    latest_ds = MlflowModelRegistryDataset(
+        model_name="demo_model", flavor="mlflow.sklearn", memory_cache=True
+    )
+    assert latest_ds.load() is not model
+    assert load_spy.call_count == 2  # noqa: PLR2004
+
+    # without the option, the model is loaded each time
+    uncached_ds = MlflowModelRegistryDataset(
+        model_name="demo_model", stage_or_version=1, flavor="mlflow.sklearn"
+    )
+    assert uncached_ds.load() is not model
+    assert load_spy.call_count == 3  # noqa: PLR2004
+
+    clear_memory_cache()
+    assert champion_ds.load() is not model
+    assert load_spy.call_count == 4  # noqa: PLR2004
+    clear_memory_cache()
@@ -0,0 +1,22 @@
+import pytest
+from mlflow.pyfunc import PythonModelContext
+
+from kedro_mlflow.mlflow import KedroPipelineModel
+
+
+@pytest.fixture
+def load_pipeline_model(tmp_path):
+    """Create a KedroPipelineModel and load its artifacts like mlflow does,
+    without logging it."""
+
+    def _load_pipeline_model(pipeline, catalog, input_name="raw_data", **kwargs):
+        kedro_pipeline_model = KedroPipelineModel(
+            pipeline=pipeline, catalog=catalog, input_name=input_name, **kwargs
+        )
+        artifacts = kedro_pipeline_model.extract_pipeline_artifacts(tmp_path)
+        kedro_pipeline_model.load_context(
+            PythonModelContext(artifacts=artifacts, model_config={})
+        )
+        return kedro_pipeline_model
+
+    return _load_pipeline_model
@@ -0,0 +1,139 @@
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, node
+from kedro.runner import SequentialRunner, ThreadRunner
+from kedro_datasets.pickle import PickleDataset
+
+from kedro_mlflow.mlflow.execution_plan import ExecutionPlan
+
+
+def split_fun(data):
+    return data + 1, data - 1
+
+
+def combine_fun(encoder, plus, minus):
+    return {"total": (plus + minus) * encoder, "diff": plus - minus}
+
+
+def scale_fun(data, factor):
+    return data * factor
+
+
+def chunk_fun(data):
+    yield data
+
+
+@pytest.fixture
+def pipeline_inference():
+    return Pipeline(
+        [
+            node(split_fun, inputs="raw_data", outputs=["plus", "minus"]),
+            node(
+                combine_fun,
+                inputs=["encoder", "plus", "minus"],
+                outputs={"total": "total", "diff": "diff"},
+            ),
+            node(
+                scale_fun,
+                inputs=dict(data="total", factor="params:factor"),
+                outputs="predictions",
+            ),
+            node(lambda data: data, inputs="diff", outputs="unused", name="unused"),
+            node(
+                lambda predictions, unused: predictions,
+                inputs=["predictions", "unused"],
+                outputs="final_predictions",
+                name="final",
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = DataCatalog(
+        {
+            "raw_data": MemoryDataset(),
+            "encoder": PickleDataset(filepath=(tmp_path / "encoder.pkl").as_posix()),
+            "params:factor": MemoryDataset(2),
+        }
+    )
+    catalog.save("encoder", 3)
+    return catalog
+
+
+@pytest.mark.parametrize("copy_mode", ["assign", "deepcopy", None, {"plus": "copy"}])
+def test_execution_plan_same_result_as_runner(
+    load_pipeline_model, pipeline_inference, catalog, copy_mode
+):
+    kedro_pipeline_model = load_pipeline_model(
+        pipeline_inference, catalog, copy_mode=copy_mode
+    )
+    data = pd.DataFrame([1, 2, 3])
+
+    for params in ({}, {"factor": 10}):
+        fast_predictions = kedro_pipeline_model.predict(None, data, params=dict(params))
+        runner_predictions = kedro_pipeline_model.predict(
+            None, data, params={**params, "runner": "ThreadRunner"}
+        )
+        pd.testing.assert_frame_equal(fast_predictions, runner_predictions)
+        pd.testing.assert_frame_equal(
+            fast_predictions, data * 2 * 3 * params.get("factor", 2)
+        )
+
+
+def test_execution_plan_skips_sequential_runner(
+    load_pipeline_model, mocker, pipeline_inference, catalog
+):
+    kedro_pipeline_model = load_pipeline_model(pipeline_inference, catalog)
+    runner_run = mocker.spy(SequentialRunner, "run")
+    thread_runner_run = mocker.spy(ThreadRunner, "run")
+
+    kedro_pipeline_model.predict(None, pd.DataFrame([1]))
+    kedro_pipeline_model.predict(None, pd.DataFrame([1]), {"runner": "ThreadRunner"})
+
+    runner_run.assert_not_called()
+    thread_runner_run.assert_called_once()
+
+
+def test_execution_plan_missing_uses_runner(
+    load_pipeline_model, mocker, pipeline_inference, catalog
+):
+    kedro_pipeline_model = load_pipeline_model(pipeline_inference, catalog)
+    # a model pickled after load_context by a previous version has no plan
+    del kedro_pipeline_model._execution_plan
+    runner_run = mocker.spy(SequentialRunner, "run")
+
+    predictions = kedro_pipeline_model.predict(None, pd.DataFrame([1]))
+
+    runner_run.assert_called_once()
+    pd.testing.assert_frame_equal(predictions, pd.DataFrame([12]))
+
+
+def test_execution_plan_not_compiled_with_generator(load_pipeline_model, mocker):
+    pipeline = Pipeline([node(chunk_fun, inputs="raw_data", outputs="predictions")])
+    kedro_pipeline_model = load_pipeline_model(
+        pipeline, DataCatalog({"raw_data": MemoryDataset()})
+    )
+    runner_run = mocker.spy(SequentialRunner, "run")
+
+    assert not ExecutionPlan.can_compile(pipeline)
+    assert kedro_pipeline_model._execution_plan is None
+    kedro_pipeline_model.predict(None, pd.DataFrame([1]))
+    runner_run.assert_called_once()
+
+
+def test_execution_plan_wrong_outputs(load_pipeline_model):
+    pipeline = Pipeline(
+        [
+            node(lambda data: data, inputs="raw_data", outputs=["a", "b"]),
+            node(lambda a, b: a, inputs=["a", "b"], outputs="predictions"),
+        ]
+    )
+    kedro_pipeline_model = load_pipeline_model(
+        pipeline, DataCatalog({"raw_data": MemoryDataset()})
+    )
+
+    with pytest.raises(ValueError, match="list of 2 outputs"):
+        kedro_pipeline_model.predict(None, 1)
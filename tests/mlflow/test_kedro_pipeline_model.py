@@ -639,3 +639,59 @@ def test_kedro_pipeline_model_too_many_outputs():
 
     with pytest.raises(ValueError, match="Pipeline must have one and only one output"):
         KedroPipelineModel(pipeline, catalog, input_name="data")
+
+
+class NotCopyableModel:
+    def __init__(self, size):
+        self.weights = list(range(size))
+
+    def __rmul__(self, data):
+        return data * 2
+
+    def __deepcopy__(self, memo):
+        raise AssertionError("The loaded artifacts must not be copied on predict.")
+
+
+@pytest.mark.parametrize("size", [1, 10**6])
+def test_kedro_pipeline_model_predict_shares_loaded_artifacts(
+    load_pipeline_model, tmp_path, pipeline_inference_dummy, size
+):
+    catalog = DataCatalog(
+        {
+            "raw_data": MemoryDataset(),
+            "data": MemoryDataset(),
+            "model": PickleDataset(
+                filepath=(tmp_path / "model.pkl").resolve().as_posix()
+            ),
+        }
+    )
+    catalog.save("model", NotCopyableModel(size))
+    kedro_pipeline_model = load_pipeline_model(
+        pipeline_inference_dummy, catalog, "raw_data"
+    )
+    loaded_model = kedro_pipeline_model.loaded_catalog.load("model")
+
+    predictions = [kedro_pipeline_model.predict(None, data) for data in (1, 2, 3)]
+
+    assert predictions == [2, 4, 6]
+    # the artifact is still loaded, and the runtime datasets are not kept
+    assert kedro_pipeline_model.loaded_catalog.load("model") is loaded_model
+    assert not kedro_pipeline_model.loaded_catalog["raw_data"].exists()
+    assert "predictions" not in kedro_pipeline_model.loaded_catalog
+
+
+def test_kedro_pipeline_model_predict_params_do_not_leak(
+    load_pipeline_model, pipeline_inference_with_parameters, catalog_with_parameters
+):
+    catalog_with_parameters.save("model", 1)
+    kedro_pipeline_model = load_pipeline_model(
+        pipeline_inference_with_parameters, catalog_with_parameters, "data"
+    )
+    data = pd.DataFrame([0.2, 0.6, 0.9])
+
+    with_params = kedro_pipeline_model.predict(None, data, params={"threshold": 0.8})
+    without_params = kedro_pipeline_model.predict(None, data)
+
+    assert (with_params == pd.DataFrame([0, 0, 1])).all(axis=None)
+    # the runtime parameter only applies to its call
+    assert (without_params == pd.DataFrame([0, 1, 1])).all(axis=None)